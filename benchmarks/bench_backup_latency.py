@@ -0,0 +1,57 @@
+"""Command latency with the backup writer inline vs. in the background.
+
+Run with ``python -m benchmarks.bench_backup_latency``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from .synthetic import balanced_seed, build_shell, percentile
+
+
+def run(background: bool, mode: str, commands: int, depth: int, fan_out: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        shell = build_shell(
+            Path(tmp),
+            balanced_seed(depth, fan_out, files_per_dir=2),
+            backup_mode=mode,
+            backup_background=background,
+        )
+        samples = []
+        for idx in range(commands):
+            message = f"mkdir /Documentos/Bench{idx}" if idx % 2 else "dir /Documentos"
+            start = time.perf_counter()
+            shell.process_message(message)
+            samples.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        shell.close()
+        drain = (time.perf_counter() - start) * 1000
+    return {
+        "p50": percentile(samples, 50),
+        "p99": percentile(samples, 99),
+        "drain": drain,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--fan-out", type=int, default=8)
+    args = parser.parse_args()
+    print(f"{'mode':>8} {'background':>10} {'p50 ms':>9} {'p99 ms':>9} {'close ms':>9}")
+    for mode in ("full", "journal"):
+        for background in (False, True):
+            result = run(background, mode, args.commands, args.depth, args.fan_out)
+            print(
+                f"{mode:>8} {str(background):>10} {result['p50']:>9.2f} "
+                f"{result['p99']:>9.2f} {result['drain']:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
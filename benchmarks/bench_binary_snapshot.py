@@ -0,0 +1,64 @@
+"""Save/restore time and size of JSON snapshots versus the binary ``VFSB`` format.
+
+Run with ``python -m benchmarks.bench_binary_snapshot``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from src.services.virtual_fs import VirtualFileSystem
+
+from .synthetic import balanced_seed
+
+
+def timed(action):
+    start = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start
+
+
+def save_json(fs: VirtualFileSystem, path: Path) -> None:
+    # same shape as BackupService full snapshots
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump({"snapshot": fs.snapshot()}, fh, indent=2, ensure_ascii=False)
+
+
+def load_json(path: Path) -> VirtualFileSystem:
+    with path.open("r", encoding="utf-8") as fh:
+        return VirtualFileSystem.from_seed(json.load(fh)["snapshot"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--fan-out", type=int, default=10)
+    parser.add_argument("--files", type=int, default=2)
+    args = parser.parse_args()
+    fs = VirtualFileSystem.from_seed(balanced_seed(args.depth, args.fan_out, files_per_dir=args.files))
+    probe = "/Documentos/" + "/".join(["Carpeta3"] * args.depth)
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "snapshot.json"
+        binary_path = Path(tmp) / "snapshot.vfsb"
+        _, json_save = timed(lambda: save_json(fs, json_path))
+        _, binary_save = timed(lambda: fs.save_binary(binary_path))
+        _, json_load = timed(lambda: load_json(json_path))
+        _, binary_eager = timed(lambda: VirtualFileSystem.load_binary(binary_path, lazy=False))
+        restored, binary_lazy = timed(lambda: VirtualFileSystem.load_binary(binary_path))
+        _, first_dir = timed(lambda: restored.list_directory(probe))
+        print(f"sonda: {probe}")
+        print(f"{'formato':>14} {'tamaño MB':>10} {'guardar s':>10} {'restaurar s':>12} {'1er dir s':>10}")
+        print(
+            f"{'json':>14} {json_path.stat().st_size / 2**20:>10.2f} {json_save:>10.3f} {json_load:>12.3f} {'-':>10}"
+        )
+        size = binary_path.stat().st_size / 2**20
+        print(f"{'vfsb completo':>14} {size:>10.2f} {binary_save:>10.3f} {binary_eager:>12.3f} {'-':>10}")
+        print(f"{'vfsb perezoso':>14} {size:>10.2f} {binary_save:>10.3f} {binary_lazy:>12.4f} {first_dir:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
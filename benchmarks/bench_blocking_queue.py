@@ -0,0 +1,100 @@
+"""Producer/consumer throughput: BlockingQueue against the standard queue.Queue.
+
+Each configuration moves the same number of items through a bounded queue;
+``get_many`` consumers take up to 64 items per call.
+
+Run with ``python -m benchmarks.bench_blocking_queue``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import queue
+import threading
+import time
+from typing import Callable, List
+
+from src.datastructures.blocking_queue import BlockingQueue, QueueClosed
+
+_DONE = object()
+
+
+def run_stdlib(items: int, producers: int, consumers: int, capacity: int) -> float:
+    channel: "queue.Queue[object]" = queue.Queue(maxsize=capacity)
+
+    def produce(count: int) -> None:
+        for idx in range(count):
+            channel.put(idx)
+
+    def consume() -> None:
+        while channel.get() is not _DONE:
+            pass
+
+    def finish() -> None:
+        for _ in range(consumers):
+            channel.put(_DONE)
+
+    return _drive(items, producers, consumers, produce, consume, finish)
+
+
+def run_blocking(items: int, producers: int, consumers: int, capacity: int, batch: int) -> float:
+    channel: BlockingQueue[int] = BlockingQueue(capacity)
+
+    def produce(count: int) -> None:
+        for idx in range(count):
+            channel.put(idx)
+
+    def consume() -> None:
+        try:
+            if batch > 1:
+                while True:
+                    channel.get_many(batch)
+            else:
+                while True:
+                    channel.get()
+        except QueueClosed:
+            pass
+
+    return _drive(items, producers, consumers, produce, consume, channel.close)
+
+
+def _drive(
+    items: int,
+    producers: int,
+    consumers: int,
+    produce: Callable[[int], None],
+    consume: Callable[[], None],
+    finish: Callable[[], None],
+) -> float:
+    share = items // producers
+    consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    producer_threads = [threading.Thread(target=produce, args=(share,)) for _ in range(producers)]
+    start = time.perf_counter()
+    for thread in consumer_threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    finish()
+    for thread in consumer_threads:
+        thread.join()
+    return share * producers / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--capacity", type=int, default=1024)
+    parser.add_argument("--threads", type=int, nargs="*", default=[1, 4, 8], help="productores = consumidores")
+    args = parser.parse_args()
+    print(f"{'hilos':>7} {'queue.Queue':>12} {'Blocking':>10} {'get_many':>10}  (elementos/s)")
+    for threads in args.threads:
+        rates: List[float] = [
+            run_stdlib(args.items, threads, threads, args.capacity),
+            run_blocking(args.items, threads, threads, args.capacity, batch=1),
+            run_blocking(args.items, threads, threads, args.capacity, batch=64),
+        ]
+        print(f"{threads:>3}x{threads:<3} {rates[0]:>12,.0f} {rates[1]:>10,.0f} {rates[2]:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
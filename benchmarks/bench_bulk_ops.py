@@ -0,0 +1,151 @@
+"""Bulk LinkedStack/LinkedQueue operations against the element-wise loops they replace.
+
+Run with ``python -m benchmarks.bench_bulk_ops``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List, Tuple
+
+from src.datastructures.linked_queue import LinkedQueue
+from src.datastructures.linked_stack import LinkedStack
+from src.datastructures.nodes import NodePool
+
+
+def timed(function: Callable[[], object], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fill_cases(size: int) -> List[Tuple[str, Callable[[], object], Callable[[], object]]]:
+    values = list(range(size))
+
+    def stack_loop():
+        stack = LinkedStack()
+        for value in values:
+            stack.push(value)
+
+    def queue_loop():
+        queue = LinkedQueue()
+        for value in values:
+            queue.enqueue(value)
+
+    return [
+        ("pila: push vs extend", stack_loop, lambda: LinkedStack().extend(values)),
+        ("cola: enqueue vs extend", queue_loop, lambda: LinkedQueue().extend(values)),
+    ]
+
+
+def drain_cases(size: int) -> List[Tuple[str, Callable[[], object], Callable[[], object]]]:
+    def queue_loop():
+        queue = LinkedQueue(range(size))
+        start = time.perf_counter()
+        batch = []
+        while len(queue) > 0:
+            batch.append(queue.dequeue())
+        return time.perf_counter() - start
+
+    def queue_bulk():
+        queue = LinkedQueue(range(size))
+        start = time.perf_counter()
+        queue.drain()
+        return time.perf_counter() - start
+
+    def stack_loop():
+        stack = LinkedStack(range(size))
+        start = time.perf_counter()
+        [stack.pop() for _ in range(size)]
+        return time.perf_counter() - start
+
+    def stack_bulk():
+        stack = LinkedStack(range(size))
+        start = time.perf_counter()
+        stack.pop_many(size)
+        return time.perf_counter() - start
+
+    def splice_loop():
+        target, source = LinkedStack(range(size)), LinkedStack(range(size))
+        start = time.perf_counter()
+        moved = [source.pop() for _ in range(len(source))]
+        for value in reversed(moved):
+            target.push(value)
+        return time.perf_counter() - start
+
+    def splice_bulk():
+        target, source = LinkedStack(range(size)), LinkedStack(range(size))
+        start = time.perf_counter()
+        target.splice(source)
+        return time.perf_counter() - start
+
+    return [
+        ("cola: dequeue vs drain", queue_loop, queue_bulk),
+        ("pila: pop vs pop_many", stack_loop, stack_bulk),
+        ("pila: pop+push vs splice", splice_loop, splice_bulk),
+    ]
+
+
+def bounded_history(pushes: int, depth: int) -> Tuple[float, float]:
+    """Per-push cost of keeping a stack at ``depth`` entries: rebuild at 2x vs truncate."""
+
+    def rebuild():
+        stack = LinkedStack()
+        for value in range(pushes):
+            stack.push(value)
+            if len(stack) > 2 * depth:
+                kept = list(stack)[:depth]
+                stack.clear()
+                for item in reversed(kept):
+                    stack.push(item)
+
+    def truncate():
+        stack = LinkedStack()
+        for value in range(pushes):
+            stack.push(value)
+            if len(stack) > depth:
+                stack.truncate(depth)
+
+    return timed(rebuild) / pushes, timed(truncate) / pushes
+
+
+def churn(rounds: int, burst: int, pool: bool) -> float:
+    stack = LinkedStack(pool=NodePool(burst) if pool else None)
+    queue = LinkedQueue(pool=stack._pool)
+    values = list(range(burst))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for value in values:
+            stack.push(value)
+            queue.enqueue(value)
+        for _ in values:
+            stack.pop()
+            queue.dequeue()
+    return (time.perf_counter() - start) / (rounds * burst * 4)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--depth", type=int, default=50, help="profundidad del historial acotado")
+    args = parser.parse_args()
+    print(f"{'operación (n=' + format(args.size, ',') + ')':<34} {'bucle ms':>9} {'bulk ms':>9} {'veces':>6}")
+    for label, loop, bulk in fill_cases(args.size):
+        loop_time, bulk_time = timed(loop), timed(bulk)
+        print(f"{label:<34} {loop_time * 1e3:>9.1f} {bulk_time * 1e3:>9.1f} {loop_time / bulk_time:>6.1f}")
+    for label, loop, bulk in drain_cases(args.size):
+        loop_time = min(loop() for _ in range(3))
+        bulk_time = max(min(bulk() for _ in range(3)), 1e-9)
+        print(f"{label:<34} {loop_time * 1e3:>9.1f} {bulk_time * 1e3:>9.3f} {loop_time / bulk_time:>6.0f}")
+    rebuild, truncate = bounded_history(args.size // 10, args.depth)
+    print(f"historial acotado a {args.depth}: reconstruir al doble {rebuild * 1e9:.0f} ns/push, truncate {truncate * 1e9:.0f} ns/push")
+    plain, pooled = churn(args.size // 256, 64, False), churn(args.size // 256, 64, True)
+    print(f"ráfagas de 64 push/pop: sin pool {plain * 1e9:.0f} ns/op, con NodePool {pooled * 1e9:.0f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Child lookup cost as directory fan-out grows.
+
+``sin caché`` resolves random children with the path cache disabled, ``caché``
+repeats a hot set that fits in the cache, and ``mkdir+rmdir`` times a
+create/remove pair while the cache is full (removals invalidate it).
+
+Run with ``python -m benchmarks.bench_child_lookup``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from src.services.virtual_fs import DEFAULT_PATH_CACHE_SIZE, VirtualFileSystem
+
+from .synthetic import wide_seed
+
+
+def _paths(fan_out: int, count: int, rng: random.Random) -> List[str]:
+    return [f"/Documentos/CARPETA{rng.randrange(0, fan_out, 2):07d}" for _ in range(count)]
+
+
+def _per_lookup(fs: VirtualFileSystem, paths: List[str]) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        fs._resolve(path)
+    return (time.perf_counter() - start) / len(paths) * 1e9
+
+
+def measure(fan_out: int, lookups: int) -> Tuple[float, float, float]:
+    fs = VirtualFileSystem.from_seed(wide_seed(fan_out))
+    rng = random.Random(fan_out)
+    fs.resize_path_cache(0)
+    uncached = _per_lookup(fs, _paths(fan_out, lookups, rng))
+
+    fs.resize_path_cache(DEFAULT_PATH_CACHE_SIZE)
+    hot = _paths(fan_out, min(256, fan_out // 2), rng)
+    _per_lookup(fs, hot)  # warm up
+    cached = _per_lookup(fs, [rng.choice(hot) for _ in range(lookups)])
+
+    _per_lookup(fs, _paths(fan_out, DEFAULT_PATH_CACHE_SIZE, rng))  # fill the cache
+    pairs = max(1, lookups // 10)
+    start = time.perf_counter()
+    for idx in range(pairs):
+        fs.make_directory(f"/Documentos/Nueva{idx}")
+        fs.remove_directory(f"/Documentos/Nueva{idx}")
+    mutation = (time.perf_counter() - start) / pairs * 1e9
+    return uncached, cached, mutation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--fan-out", type=int, nargs="*", default=[10, 100, 1_000, 10_000, 100_000])
+    args = parser.parse_args()
+    print(f"{'fan-out':>10} {'sin caché ns':>13} {'caché ns':>9} {'mkdir+rmdir ns':>15}")
+    for fan_out in args.fan_out:
+        uncached, cached, mutation = measure(fan_out, args.lookups)
+        print(f"{fan_out:>10} {uncached:>13.0f} {cached:>9.0f} {mutation:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
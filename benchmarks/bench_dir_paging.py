@@ -0,0 +1,46 @@
+"""Time to the first page of ``dir`` as a folder grows, versus the full listing.
+
+Run with ``python -m benchmarks.bench_dir_paging``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from itertools import islice
+
+from src.services.virtual_fs import VirtualFileSystem
+
+from .synthetic import wide_seed
+
+
+def best_of(action, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fan-out", type=int, nargs="*", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    print(f"{'entradas':>10} {'1ª página µs':>13} {'página media µs':>16} {'listado completo ms':>20}")
+    for fan_out in args.fan_out:
+        fs = VirtualFileSystem.from_seed(wide_seed(fan_out))
+        fs.list_directory("/Documentos")  # builds the persistent sorted order once
+        first = best_of(lambda: list(islice(fs.iter_directory("/Documentos"), args.limit)))
+        resume = (True, f"Carpeta{fan_out // 2:07d}")
+        middle = best_of(lambda: list(islice(fs.iter_directory("/Documentos", after=resume), args.limit)))
+        start = time.perf_counter()
+        listing = fs.list_directory("/Documentos")
+        "\n".join(listing["folders"] + listing["files"])
+        full = time.perf_counter() - start
+        print(f"{fan_out:>10} {first * 1e6:>13.1f} {middle * 1e6:>16.1f} {full * 1e3:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
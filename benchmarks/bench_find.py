@@ -0,0 +1,76 @@
+"""Name index build time and ``find`` latency on a large tree.
+
+Run with ``python -m benchmarks.bench_find``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import time
+
+from src.services.virtual_fs import VirtualFileSystem
+
+from .synthetic import balanced_seed, percentile
+
+QUERIES = [
+    ("exact", "archivo1.txt"),
+    ("exact", "carpeta7"),
+    ("prefix", "carp"),
+    ("glob", "Archivo*.txt"),
+    ("substring", "peta9"),
+    ("substring", "zz_no_existe"),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--fan-out", type=int, default=10)
+    parser.add_argument("--files", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    fs = VirtualFileSystem.from_seed(balanced_seed(args.depth, args.fan_out, files_per_dir=args.files))
+    start = time.perf_counter()
+    index = fs.name_index()
+    print(f"índice: {len(index)} nodos en {time.perf_counter() - start:.2f} s")
+    print(f"{'modo':>10} {'patrón':>14} {'resultados':>11} {'índice ms':>10} {'recorrido ms':>13}")
+    for mode, pattern in QUERIES:
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            # counting matches isolates the index from path building and sorting
+            found = sum(1 for _ in index.search(pattern, mode))
+            samples.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        walk_scan(fs, pattern, mode)
+        scan = time.perf_counter() - start
+        print(f"{mode:>10} {pattern:>14} {found:>11} {percentile(samples, 50) * 1e3:>10.2f} {scan * 1e3:>13.1f}")
+    samples = []
+    for idx in range(1_000):
+        start = time.perf_counter()
+        fs.make_directory(f"/Documentos/Carpeta0/Nueva{idx}")
+        samples.append(time.perf_counter() - start)
+    print(f"mkdir con índice activo: p50 {percentile(samples, 50) * 1e6:.1f} µs, p99 {percentile(samples, 99) * 1e6:.1f} µs")
+
+
+def walk_scan(fs: VirtualFileSystem, pattern: str, mode: str) -> int:
+    """What a search costs without the index: visit every node."""
+    query = pattern.casefold()
+    count = 0
+    for _path, folder in fs.walk_directories():
+        for child in folder.children:
+            name = child.name.casefold()
+            if mode == "exact":
+                count += name == query
+            elif mode == "prefix":
+                count += name.startswith(query)
+            elif mode == "glob":
+                count += fnmatch.fnmatchcase(name, query)
+            else:
+                count += query in name
+    return count
+
+
+if __name__ == "__main__":
+    main()
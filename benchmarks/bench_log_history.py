@@ -0,0 +1,64 @@
+"""Log append cost: legacy LinkedStack trimming vs. the RingBuffer history.
+
+Run with ``python -m benchmarks.bench_log_history``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from src.datastructures.linked_stack import LinkedStack
+from src.services.log_service import LogService
+
+
+class LegacyStackLog:
+    """The previous LogService strategy: rebuild the stack once the cap is hit."""
+
+    def __init__(self, max_entries: int):
+        self._stack: LinkedStack[str] = LinkedStack()
+        self._max_entries = max_entries
+
+    def add_entry(self, label: str, payload: str) -> None:
+        self._stack.push(f"[2025-01-01 00:00:00] {label}: {payload}")
+        if len(self._stack) <= self._max_entries:
+            return
+        buffer = list(self._stack)[: self._max_entries]
+        self._stack.clear()
+        for value in reversed(buffer):
+            self._stack.push(value)
+
+    def recent(self, limit: int):
+        return list(self._stack)[:limit]
+
+
+def fill(log, count: int) -> None:
+    for idx in range(count):
+        log.add_entry("dir", str(idx))
+
+
+def per_op(fn, ops: int) -> float:
+    start = time.perf_counter()
+    for idx in range(ops):
+        fn(idx)
+    return (time.perf_counter() - start) / ops * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--caps", type=int, nargs="*", default=[50, 10_000, 1_000_000])
+    args = parser.parse_args()
+    print(f"{'cap':>9} {'impl':>7} {'append µs':>11} {'log 10 µs':>11}")
+    for cap in args.caps:
+        for name, factory in (("stack", LegacyStackLog), ("ring", LogService)):
+            log = factory(cap)
+            # legacy appends at the cap cost O(cap); keep the slow runs short
+            fill(log, cap)
+            ops = max(5, min(20_000, 2_000_000 // cap)) if name == "stack" else 20_000
+            append = per_op(lambda idx: log.add_entry("dir", str(idx)), ops)
+            query = per_op(lambda idx: list(log.recent(10)), max(5, ops // 10))
+            print(f"{cap:>9} {name:>7} {append:>11.2f} {query:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
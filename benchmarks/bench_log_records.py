@@ -0,0 +1,73 @@
+"""Memory per log entry and add_entry overhead: eager strings vs. LogRecord.
+
+Run with ``python -m benchmarks.bench_log_records``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+
+from src.services.log_service import LogService
+
+
+class EagerLog:
+    """The previous behaviour: format a timestamped string on every call."""
+
+    def __init__(self, max_entries: int):
+        self._entries = []
+        self._max_entries = max_entries
+
+    def add_entry(self, label: str, payload: str) -> str:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        message = f"[{timestamp}] {label}: {payload}"
+        self._entries.append(message)
+        if len(self._entries) > self._max_entries:
+            del self._entries[0]
+        return message
+
+
+def memory_per_entry(factory, entries: int, payload: str) -> float:
+    tracemalloc.start()
+    log = factory(entries)
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(entries):
+        log.add_entry("dir", payload)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / entries
+
+
+def overhead(factory, calls: int, payload: str) -> float:
+    log = factory(50)
+    start = time.perf_counter()
+    for _ in range(calls):
+        log.add_entry("dir", payload)
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+    small = "Carpeta 'Nueva' creada correctamente"
+    large = "\n".join(f"  - Carpeta{idx:06d}" for idx in range(5_000))
+    impls = (
+        ("eager", EagerLog),
+        ("record", LogService),
+        ("record+trunc", lambda cap: LogService(cap, max_payload_chars=2000)),
+    )
+    print(f"{'impl':>13} {'payload':>8} {'bytes/entry':>12} {'ns/add':>9}")
+    for name, factory in impls:
+        for label, payload in (("small", small), ("large", large)):
+            entries = args.entries if label == "small" else 200
+            memory = memory_per_entry(factory, entries, payload)
+            cost = overhead(factory, args.calls if label == "small" else 2_000, payload)
+            print(f"{name:>13} {label:>8} {memory:>12.0f} {cost:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Cost of the metrics instrumentation on the shell's message path.
+
+Runs the same non-mutating workload with ``metrics.enabled`` off and on, and
+times a bare stage timer of each kind.
+
+Run with ``python -m benchmarks.bench_metrics``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from src.services.metrics import NULL_METRICS, Metrics
+
+from .synthetic import balanced_seed, build_shell
+
+WORKLOAD = [
+    "dir /Documentos/Carpeta3 --limit 5",
+    "find Carpeta1 --exact --limit 3",
+    "du /Documentos/Carpeta7",
+    "log 3",
+    "muestra Carpeta5",
+]
+
+
+def per_message(enabled: bool, messages: int) -> float:
+    with tempfile.TemporaryDirectory() as workdir:
+        shell = build_shell(
+            Path(workdir),
+            balanced_seed(2, 10),
+            auto_backup_commands=[],
+            log_sink={"enabled": False},
+            metrics={"enabled": enabled},
+        )
+        for message in WORKLOAD:
+            shell.process_message(message)  # warm the name index and du aggregates
+        start = time.perf_counter()
+        for idx in range(messages):
+            shell.process_message(WORKLOAD[idx % len(WORKLOAD)])
+        elapsed = time.perf_counter() - start
+        shell.close()
+    return elapsed / messages * 1e6
+
+
+def per_timer(metrics: Metrics, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        with metrics.time("parse"):
+            pass
+    return (time.perf_counter() - start) / rounds * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--timers", type=int, default=1_000_000)
+    args = parser.parse_args()
+    print(f"{'métricas':>10} {'µs/mensaje':>11} {'ns/etapa':>9}")
+    for enabled, metrics in ((False, NULL_METRICS), (True, Metrics())):
+        label = "activas" if enabled else "apagadas"
+        print(f"{label:>10} {per_message(enabled, args.messages):>11.2f} {per_timer(metrics, args.timers):>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
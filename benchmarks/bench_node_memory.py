@@ -0,0 +1,87 @@
+"""Memory used by the in-memory tree: legacy dataclass nodes vs. compact nodes.
+
+Run with ``python -m benchmarks.bench_node_memory`` (add ``--sizes 10000000``
+for the 10^7 case; it needs several GB of RAM and a few minutes).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List
+
+from src.services.virtual_fs import FileSystemNode
+
+
+@dataclass
+class LegacyNode:
+    name: str
+    type: str
+    children: List["LegacyNode"] = field(default_factory=list)
+
+
+def build_legacy(total: int) -> LegacyNode:
+    root = LegacyNode("Documentos", "directory")
+    pending, created = deque([root]), 1
+    while created < total:
+        parent = pending.popleft()
+        for idx in range(10):
+            if created >= total:
+                break
+            if idx < 2:
+                child = LegacyNode(f"Carpeta{created}", "directory")
+                pending.append(child)
+            else:
+                child = LegacyNode(f"Archivo{idx}.txt", "file")
+            parent.children.append(child)
+            created += 1
+    return root
+
+
+def build_compact(total: int) -> FileSystemNode:
+    root = FileSystemNode("Documentos", "directory")
+    pending, created = deque([root]), 1
+    while created < total:
+        parent = pending.popleft()
+        for idx in range(10):
+            if created >= total:
+                break
+            if idx < 2:
+                child = FileSystemNode(f"Carpeta{created}", "directory")
+                pending.append(child)
+            else:
+                child = FileSystemNode(f"Archivo{idx}.txt", "file")
+            parent.add_child(child)
+            created += 1
+    return root
+
+
+def measure(builder, total: int):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    tree = builder(total)
+    elapsed = time.perf_counter() - start
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tree
+    return current, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+    print(f"{'nodes':>10} {'impl':>8} {'MB':>9} {'B/node':>8} {'build s':>8}")
+    for total in args.sizes:
+        for name, builder in (("legacy", build_legacy), ("compact", build_compact)):
+            used, elapsed = measure(builder, total)
+            print(f"{total:>10} {name:>8} {used / 2**20:>9.1f} {used / total:>8.0f} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
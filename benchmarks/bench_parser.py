@@ -0,0 +1,129 @@
+"""Parsing and dispatch of synthetic command lines, before and after the command table.
+
+The legacy path is the previous pipeline (prompt regex, lowercase the whole
+line, ``split``, ``KeyError`` for unknown words); it does not understand
+quotes.
+
+Run with ``python -m benchmarks.bench_parser``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from typing import Callable, List, Optional, Tuple
+
+from src.commands.base import CommandRegistry
+from src.commands.clear_log_command import ClearLogCommand
+from src.commands.dir_command import DirCommand
+from src.commands.du_command import DuCommand
+from src.commands.find_command import FindCommand
+from src.commands.log_command import LogCommand
+from src.commands.mkdir_command import MkdirCommand
+from src.commands.mv_command import MvCommand
+from src.commands.redo_command import RedoCommand
+from src.commands.rmdir_command import RmdirCommand
+from src.commands.undo_command import UndoCommand
+from src.services.input_validator import InputValidator
+
+TEMPLATES = [
+    "dir /Documentos/Carpeta{n}",
+    "mkdir /Documentos/Proyectos/Nueva{n}",
+    "usuario: rmdir -r /Documentos/Carpeta{n}",
+    "mv /Documentos/Carpeta{n} /Documentos/Archivo{n}",
+    "ls /Documentos --limit 20",
+    "find Plan{n} --prefix",
+    'mkdir "/Documentos/Mis fotos {n}"',
+    "log 5",
+    "muéstrame lo que hay en Carpeta{n}",
+    "borra la carpeta Fotos{n}",
+]
+
+
+def build_registry() -> CommandRegistry:
+    registry = CommandRegistry()
+    for command in (
+        DirCommand(), MkdirCommand(), RmdirCommand(), MvCommand(), FindCommand(), DuCommand(),
+        UndoCommand(), RedoCommand(), ClearLogCommand(), LogCommand(),
+    ):
+        registry.register(command)
+    return registry
+
+
+class LegacyValidator:
+    """The validator as it was: regex prompt strip, lowercase everything, ``split``."""
+
+    _prompt_pattern = re.compile(r"^[^:]+:(.*)")
+
+    def sanitize(self, raw: str) -> str:
+        text = raw.strip()
+        match = self._prompt_pattern.match(text)
+        if match:
+            text = match.group(1).strip()
+        return text.lower()
+
+    def extract_command(self, sanitized: str) -> Tuple[str, List[str]]:
+        if not sanitized:
+            raise ValueError("Debe ingresar un comando")
+        tokens = sanitized.split()
+        return tokens[0], tokens[1:]
+
+
+def legacy_dispatch(registry: CommandRegistry) -> Callable[[str], Optional[object]]:
+    validator = LegacyValidator()
+
+    def dispatch(line: str) -> Optional[object]:
+        try:
+            sanitized = validator.sanitize(line)
+            command_name, _ = validator.extract_command(sanitized)
+        except ValueError:
+            return None
+        try:
+            return registry.get(command_name)
+        except KeyError:
+            return None
+
+    return dispatch
+
+
+def table_dispatch(registry: CommandRegistry) -> Callable[[str], Optional[object]]:
+    validator = InputValidator()
+
+    def dispatch(line: str) -> Optional[object]:
+        try:
+            command_name, _ = validator.parse(line)
+        except ValueError:
+            return None
+        return registry.resolve(command_name)
+
+    return dispatch
+
+
+def measure(dispatch: Callable[[str], Optional[object]], lines: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            dispatch(line)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=2_000_000)
+    parser.add_argument("--repeat", type=int, default=3, help="se informa la mejor pasada")
+    args = parser.parse_args()
+    rng = random.Random(5)
+    lines = [rng.choice(TEMPLATES).format(n=rng.randrange(10_000)) for _ in range(args.lines)]
+    registry = build_registry()
+    print(f"{'ruta':>8} {'líneas/s':>12} {'ns/línea':>9}")
+    for label, dispatch in (("legacy", legacy_dispatch(registry)), ("tabla", table_dispatch(registry))):
+        elapsed = measure(dispatch, lines, args.repeat)
+        print(f"{label:>8} {args.lines / elapsed:>12,.0f} {elapsed / args.lines * 1e9:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Repeated listing of deep paths in a wide tree, with and without the path cache.
+
+Run with ``python -m benchmarks.bench_path_cache``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from src.services.virtual_fs import VirtualFileSystem
+
+from .synthetic import balanced_seed
+
+
+def measure(seed: dict, hot_paths: list, lookups: int, cache_size: int) -> tuple:
+    fs = VirtualFileSystem.from_seed(seed)
+    fs.resize_path_cache(cache_size)
+    for path in hot_paths:
+        fs.make_directories(path)
+    rng = random.Random(7)
+    workload = [rng.choice(hot_paths) for _ in range(lookups)]
+    start = time.perf_counter()
+    for path in workload:
+        fs.list_directory(path)
+    elapsed = time.perf_counter() - start
+    return elapsed / lookups * 1e6, fs.path_cache_stats()["hit_rate"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fan-out", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=20, help="niveles extra bajo cada ruta caliente")
+    parser.add_argument("--hot", type=int, default=200, help="rutas profundas distintas")
+    parser.add_argument("--lookups", type=int, default=50_000)
+    args = parser.parse_args()
+    seed = balanced_seed(2, args.fan_out)
+    rng = random.Random(3)
+    tail = "/".join(f"Nivel{level}" for level in range(args.depth))
+    hot_paths = [
+        f"/Documentos/Carpeta{rng.randrange(args.fan_out)}/Carpeta{rng.randrange(args.fan_out)}/{tail}"
+        for _ in range(args.hot)
+    ]
+    print(f"árbol: {args.fan_out ** 2 + args.fan_out + 1} carpetas, rutas de {args.depth + 3} niveles")
+    print(f"{'caché':>8} {'µs/dir':>8} {'aciertos':>9}")
+    for cache_size in (0, args.hot // 2, args.hot * 2):
+        per_call, hit_rate = measure(seed, hot_paths, args.lookups, cache_size)
+        print(f"{cache_size:>8} {per_call:>8.2f} {hit_rate:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
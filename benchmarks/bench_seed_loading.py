@@ -0,0 +1,62 @@
+"""Start-up time and peak memory of the seed loading modes.
+
+Run with ``python -m benchmarks.bench_seed_loading``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.services.seed_loader import load_filesystem
+
+from .synthetic import balanced_seed
+
+
+def measure(path: Path, mode: str, probe: str) -> dict:
+    # timings without tracemalloc, which slows allocation-heavy code a lot
+    start = time.perf_counter()
+    fs = load_filesystem(path, mode)
+    startup = time.perf_counter() - start
+    start = time.perf_counter()
+    fs.list_directory(probe)
+    first_dir = time.perf_counter() - start
+    del fs
+    tracemalloc.start()
+    fs = load_filesystem(path, mode)
+    startup_peak = tracemalloc.get_traced_memory()[1]
+    fs.list_directory(probe)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {"startup": startup, "peak": startup_peak, "first_dir": first_dir, "resident": current}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--fan-out", type=int, default=10)
+    parser.add_argument("--files", type=int, default=2)
+    args = parser.parse_args()
+    seed = balanced_seed(args.depth, args.fan_out, files_per_dir=args.files)
+    probe = "/Documentos/" + "/".join(["Carpeta3"] * args.depth)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "seed.json"
+        path.write_text(json.dumps(seed), encoding="utf-8")
+        del seed
+        size = path.stat().st_size
+        print(f"seed: {size / 2**20:.1f} MB, sonda: {probe}")
+        print(f"{'modo':>7} {'inicio s':>9} {'pico MB':>9} {'1er dir s':>10} {'residente MB':>13}")
+        for mode in ("eager", "stream", "lazy"):
+            result = measure(path, mode, probe)
+            print(
+                f"{mode:>7} {result['startup']:>9.3f} {result['peak'] / 2**20:>9.1f} "
+                f"{result['first_dir']:>10.3f} {result['resident'] / 2**20:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
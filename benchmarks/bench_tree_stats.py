@@ -0,0 +1,60 @@
+"""``du`` latency with incremental aggregates versus walking the subtree.
+
+Run with ``python -m benchmarks.bench_tree_stats``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from src.services.virtual_fs import VirtualFileSystem
+
+from .synthetic import balanced_seed, percentile
+
+
+def walk_usage(fs: VirtualFileSystem, path: str) -> int:
+    """What ``du`` costs without the aggregates."""
+    count = 0
+    pending = [fs._resolve(path)]
+    while pending:
+        node = pending.pop()
+        for child in node.children:
+            count += 1
+            if child.is_directory():
+                pending.append(child)
+    return count
+
+
+def timed_samples(action, repeat: int) -> list:
+    samples = []
+    for idx in range(repeat):
+        start = time.perf_counter()
+        action(idx)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--fan-out", type=int, default=10)
+    parser.add_argument("--files", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=1_000)
+    args = parser.parse_args()
+    fs = VirtualFileSystem.from_seed(balanced_seed(args.depth, args.fan_out, files_per_dir=args.files))
+    start = time.perf_counter()
+    fs.usage("/Documentos")
+    print(f"construcción de agregados: {time.perf_counter() - start:.2f} s")
+    walk = timed_samples(lambda _: walk_usage(fs, "/Documentos"), 3)
+    du = timed_samples(lambda _: fs.usage("/Documentos"), args.repeat)
+    deep = "/Documentos/" + "/".join(["Carpeta1"] * (args.depth - 1))
+    mkdir = timed_samples(lambda idx: fs.make_directory(f"{deep}/Nueva{idx}"), args.repeat)
+    rmdir = timed_samples(lambda idx: fs.remove_directory(f"{deep}/Nueva{idx}"), args.repeat)
+    print(f"du /Documentos recorriendo: {percentile(walk, 50) * 1e3:.1f} ms")
+    print(f"du /Documentos incremental: {percentile(du, 50) * 1e6:.1f} µs")
+    print(f"mkdir profundo: p50 {percentile(mkdir, 50) * 1e6:.1f} µs, rmdir: p50 {percentile(rmdir, 50) * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
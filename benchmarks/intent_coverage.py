@@ -0,0 +1,107 @@
+"""How many inputs are resolved without reaching the LLM fallback.
+
+Run with ``python -m benchmarks.intent_coverage``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Iterable, List
+
+from src.services.input_validator import InputValidator
+from src.services.intent_matcher import IntentMatcher
+from src.services.virtual_fs import VirtualFileSystem
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+COMMANDS = {"dir", "mkdir", "rmdir", "log", "clear"}
+
+TEMPLATES = [
+    "muéstrame lo que hay en {name}",
+    "qué hay en la carpeta {name}",
+    "lista {name}",
+    "enséñame el contenido de {name}",
+    "borra la carpeta {name}",
+    "elimina {name} por favor",
+    "crea la carpeta Nueva{idx} en {name}",
+    "hazme una carpeta llamada Extra{idx}",
+    "muestra el historial",
+    "enséñame los últimos {small} comandos del historial",
+    "limpia el historial",
+    "abre {typo}",
+    "¿me cuentas un chiste?",
+    "qué tiempo hace hoy",
+]
+
+
+def classify(lines: Iterable[str], matcher: IntentMatcher) -> dict:
+    validator = InputValidator()
+    counts = {"direct": 0, "local": 0, "llm": 0}
+    for line in lines:
+        try:
+            command, _ = validator.extract_command(validator.sanitize(line))
+        except ValueError:
+            command = ""
+        if command in COMMANDS:
+            counts["direct"] += 1
+        elif matcher.match(line):
+            counts["local"] += 1
+        else:
+            counts["llm"] += 1
+    return counts
+
+
+def synthetic_corpus(size: int, names: List[str], seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    corpus = []
+    for idx in range(size):
+        name = rng.choice(names)
+        typo = name[:-1] if len(name) > 6 else name
+        template = rng.choice(TEMPLATES)
+        corpus.append(template.format(name=name, idx=idx, small=rng.randint(1, 9), typo=typo))
+    return corpus
+
+
+def report(title: str, counts: dict, elapsed: float) -> None:
+    total = sum(counts.values()) or 1
+    without_llm = counts["direct"] + counts["local"]
+    print(
+        f"{title}: {total} entradas, directas={counts['direct']}, locales={counts['local']}, "
+        f"LLM={counts['llm']} -> {100 * without_llm / total:.1f}% sin red "
+        f"({elapsed * 1e6 / total:.1f} µs/entrada)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    seed = json.loads((DATA_DIR / "default_fs.json").read_text(encoding="utf-8"))
+    fs = VirtualFileSystem.from_seed(seed)
+    lines = [
+        line.strip()
+        for line in (DATA_DIR / "sample_inputs.txt").read_text(encoding="utf-8").splitlines()
+        if line.strip() and not line.startswith("#")
+    ]
+    start = time.perf_counter()
+    counts = classify(lines, IntentMatcher(fs))
+    report("sample_inputs.txt", counts, time.perf_counter() - start)
+
+    folders = ["Proyectos", "Fotos", "Facturas", "Musica", "Viajes", "Tesis", "Recetas", "Trabajo"]
+    synthetic = VirtualFileSystem.from_seed(
+        {"root": {"name": "Documentos", "type": "directory", "children": [
+            {"name": name, "type": "directory", "children": []} for name in folders
+        ]}}
+    )
+    corpus = synthetic_corpus(args.size, folders)
+    start = time.perf_counter()
+    counts = classify(corpus, IntentMatcher(synthetic))
+    report("corpus sintético", counts, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Throughput and tail latency of AsyncChatbotEngine under many sessions.
+
+Run with ``python -m benchmarks.load_sessions``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from src.services.async_engine import AsyncChatbotEngine
+
+from .synthetic import balanced_seed, build_shell, percentile
+
+MIX = ("dir /Documentos", "dir /Documentos/Carpeta0", "log 5", "mkdir", "dir /Documentos/Carpeta1/Carpeta2")
+
+
+async def session_loop(engine: AsyncChatbotEngine, session: str, requests: int, samples: List[float], rng: random.Random) -> None:
+    for idx in range(requests):
+        message = rng.choice(MIX)
+        if message == "mkdir":
+            message = f"mkdir /Documentos/Carpeta0/{session}-{idx}"
+        start = time.perf_counter()
+        await engine.process(session, message)
+        samples.append((time.perf_counter() - start) * 1000)
+
+
+async def run(sessions: int, requests: int, workers: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        shell = build_shell(Path(tmp), balanced_seed(3, 6, files_per_dir=3), backup_mode="journal")
+        engine = AsyncChatbotEngine(shell, max_workers=workers)
+        ids = [engine.open_session() for _ in range(sessions)]
+        samples: List[float] = []
+        rng = random.Random(sessions)
+        start = time.perf_counter()
+        await asyncio.gather(*(session_loop(engine, sid, requests, samples, rng) for sid in ids))
+        elapsed = time.perf_counter() - start
+        await engine.aclose()
+    return {
+        "throughput": len(samples) / elapsed,
+        "p50": percentile(samples, 50),
+        "p99": percentile(samples, 99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, nargs="*", default=[1, 10, 100, 1000])
+    parser.add_argument("--requests", type=int, default=20, help="mensajes por sesión")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+    print(f"{'sesiones':>9} {'msg/s':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for sessions in args.sessions:
+        result = asyncio.run(run(sessions, args.requests, args.workers))
+        print(f"{sessions:>9} {result['throughput']:>9.0f} {result['p50']:>9.2f} {result['p99']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
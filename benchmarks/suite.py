@@ -0,0 +1,276 @@
+"""Reproducible benchmark suite over the datastructures, filesystem and shell hot paths.
+
+Every case runs a fixed, seeded workload twice: once timed (operations per
+second and per-operation latency percentiles) and once under
+``tracemalloc`` for the peak memory of its setup plus its first
+``memory_ops`` operations. ``--output`` saves the results as JSON;
+``--compare`` reads a previous file and flags every case whose throughput
+dropped by more than ``--tolerance`` (the exit status is then 1). The shell
+case answers LLM fallbacks from a local fake endpoint.
+
+Run with ``python -m benchmarks.suite [--scale 0.2] [--output bench.json] [--compare old.json]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional
+
+from src.datastructures.linked_queue import LinkedQueue
+from src.datastructures.linked_stack import LinkedStack
+from src.services.log_service import LogService
+from src.services.virtual_fs import FileSystemNode, VirtualFileSystem
+
+from .synthetic import FakeAIEndpoint, build_shell, percentile, sized_seed
+
+Operation = Callable[[int], object]
+
+
+@dataclass
+class Params:
+    tree_size: int
+    fan_out: int
+    files_per_dir: int
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[random.Random, Params, int], ContextManager[Operation]]
+    ops: int
+    batch: int = 1  # operations per timed sample, for cases much faster than perf_counter
+    memory_ops: int = 10_000
+
+
+@contextmanager
+def stack_push_pop(rng: random.Random, params: Params, ops: int) -> Iterator[Operation]:
+    stack: LinkedStack[int] = LinkedStack(range(10_000))
+
+    def operation(idx: int) -> object:
+        stack.push(idx)
+        return stack.pop()
+
+    yield operation
+
+
+@contextmanager
+def queue_enqueue_dequeue(rng: random.Random, params: Params, ops: int) -> Iterator[Operation]:
+    queue: LinkedQueue[int] = LinkedQueue()
+    for idx in range(10_000):
+        queue.enqueue(idx)
+
+    def operation(idx: int) -> object:
+        queue.enqueue(idx)
+        return queue.dequeue()
+
+    yield operation
+
+
+def _deep_paths(filesystem: VirtualFileSystem, rng: random.Random, count: int) -> List[str]:
+    paths = [path for path, _ in filesystem.walk_directories()]
+    deepest = max(path.count("/") for path in paths)
+    deep = [path for path in paths if path.count("/") >= deepest - 1]
+    return [rng.choice(deep) for _ in range(count)]
+
+
+def _resolve(cache_size: int):
+    @contextmanager
+    def setup(rng: random.Random, params: Params, ops: int) -> Iterator[Operation]:
+        filesystem = VirtualFileSystem.from_seed(sized_seed(params.tree_size, params.fan_out))
+        filesystem.resize_path_cache(cache_size)
+        paths = _deep_paths(filesystem, rng, 256)
+
+        def operation(idx: int) -> object:
+            return filesystem._resolve_with_parent(paths[idx & 255])
+
+        yield operation
+
+    return setup
+
+
+@contextmanager
+def node_to_dict(rng: random.Random, params: Params, ops: int) -> Iterator[Operation]:
+    seed = sized_seed(params.tree_size, params.fan_out, params.files_per_dir)
+    root = FileSystemNode.from_dict(seed["root"])
+    yield lambda idx: root.to_dict()
+
+
+@contextmanager
+def node_from_dict(rng: random.Random, params: Params, ops: int) -> Iterator[Operation]:
+    data = sized_seed(params.tree_size, params.fan_out, params.files_per_dir)["root"]
+    yield lambda idx: FileSystemNode.from_dict(data)
+
+
+@contextmanager
+def log_add_entry(rng: random.Random, params: Params, ops: int) -> Iterator[Operation]:
+    logger = LogService(max_entries=50)
+    yield lambda idx: logger.add_entry("dir", "Contenido de /Documentos: 20 elementos")
+
+
+def shell_messages(rng: random.Random, folders: List[str], count: int) -> List[str]:
+    """A command mix: mostly reads, mkdir/rmdir pairs, local intents and LLM fallbacks."""
+    names = [path.rsplit("/", 1)[1] for path in folders]
+    created: List[str] = []
+    messages = []
+    for idx in range(count):
+        roll = rng.random()
+        folder = rng.choice(folders)
+        if roll < 0.35:
+            messages.append(f"dir {folder} --limit 20")
+        elif roll < 0.50:
+            messages.append(f"find {rng.choice(names)} --exact --limit 5")
+        elif roll < 0.60:
+            messages.append(f"du {folder}")
+        elif roll < 0.75:
+            created.append(f"{folder}/Nueva{idx}")
+            messages.append(f"mkdir {created[-1]}")
+        elif roll < 0.85 and created:
+            messages.append(f"rmdir {created.pop(rng.randrange(len(created)))}")
+        elif roll < 0.87:
+            # resolved through the name index, which mutations keep up to date
+            messages.append(f"muestra {rng.choice(names)}")
+        elif roll < 0.95:
+            messages.append("cuéntame un chiste")  # no intent matches: goes to the fake LLM
+        else:
+            messages.append("log 5")
+    return messages
+
+
+@contextmanager
+def shell_process_message(rng: random.Random, params: Params, ops: int) -> Iterator[Operation]:
+    seed = sized_seed(params.tree_size, params.fan_out, params.files_per_dir)
+    os.environ.setdefault("FAKE_AI_KEY", "benchmark")
+    with tempfile.TemporaryDirectory() as workdir, FakeAIEndpoint() as endpoint:
+        shell = build_shell(Path(workdir), seed, backup_mode="journal", ai=endpoint.settings())
+        folders = [path for path, _ in shell.context.filesystem.walk_directories()][1:]
+        messages = shell_messages(rng, folders, ops)
+        try:
+            yield lambda idx: shell.process_message(messages[idx])
+        finally:
+            shell.close()
+
+
+CASES = [
+    Case("stack_push_pop", stack_push_pop, ops=1_000_000, batch=1000),
+    Case("queue_enqueue_dequeue", queue_enqueue_dequeue, ops=1_000_000, batch=1000),
+    Case("resolve_cached", _resolve(1024), ops=500_000, batch=100),
+    Case("resolve_uncached", _resolve(0), ops=500_000, batch=100),
+    Case("node_to_dict", node_to_dict, ops=20),
+    Case("node_from_dict", node_from_dict, ops=20),
+    Case("log_add_entry", log_add_entry, ops=500_000, batch=1000),
+    Case("shell_process_message", shell_process_message, ops=2_000, memory_ops=500),
+]
+
+
+def run_case(case: Case, params: Params, scale: float, seed: int) -> Dict[str, float]:
+    batch = case.batch
+    ops = max(batch, int(case.ops * scale) // batch * batch)
+    samples: List[float] = []
+    with case.setup(random.Random(seed), params, ops) as operation:
+        gc.collect()
+        started = time.perf_counter()
+        for first in range(0, ops, batch):
+            tick = time.perf_counter()
+            for idx in range(first, first + batch):
+                operation(idx)
+            samples.append((time.perf_counter() - tick) / batch)
+        elapsed = time.perf_counter() - started
+    memory_ops = min(ops, case.memory_ops)
+    tracemalloc.start()
+    try:
+        with case.setup(random.Random(seed), params, ops) as operation:
+            for idx in range(memory_ops):
+                operation(idx)
+            peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "ops": ops,
+        "seconds": elapsed,
+        "ops_per_sec": ops / elapsed,
+        "p50_us": percentile(samples, 50) * 1e6,
+        "p95_us": percentile(samples, 95) * 1e6,
+        "p99_us": percentile(samples, 99) * 1e6,
+        "peak_kib": peak / 1024,
+    }
+
+
+def throughput_change(result: Dict[str, float], previous: Optional[Dict[str, float]]) -> Optional[float]:
+    """Relative ops/s change against a previous run (``None`` without one)."""
+    if not previous:
+        return None
+    return result["ops_per_sec"] / previous["ops_per_sec"] - 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplica el número de operaciones")
+    parser.add_argument("--tree-size", type=int, default=20_000, help="carpetas del árbol sintético")
+    parser.add_argument("--fan-out", type=int, default=10)
+    parser.add_argument("--files-per-dir", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--only", nargs="*", help="casos a ejecutar (por defecto, todos)")
+    parser.add_argument("--output", type=Path, help="guarda los resultados en JSON")
+    parser.add_argument("--compare", type=Path, help="resultados JSON de una corrida anterior")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="caída de ops/s que cuenta como regresión")
+    args = parser.parse_args()
+    params = Params(args.tree_size, args.fan_out, args.files_per_dir)
+    cases = [case for case in CASES if not args.only or case.name in args.only]
+    baseline = {}
+    if args.compare:
+        previous = json.loads(args.compare.read_text(encoding="utf-8"))
+        if previous["params"] != vars(params) or previous["scale"] != args.scale:
+            print(
+                f"Aviso: la corrida base usó otros parámetros ({previous['params']}, escala {previous['scale']})",
+                file=sys.stderr,
+            )
+        baseline = previous["results"]
+
+    results: Dict[str, Dict] = {}
+    print(f"{'caso':<24} {'ops/s':>12} {'p50 µs':>9} {'p95 µs':>9} {'p99 µs':>9} {'pico KiB':>9} {'cambio':>8}")
+    regressions = []
+    for case in cases:
+        result = results[case.name] = run_case(case, params, args.scale, args.seed)
+        change = throughput_change(result, baseline.get(case.name))
+        flag = ""
+        if change is not None:
+            flag = f"{change:>+8.1%}"
+            if change < -args.tolerance:
+                regressions.append(case.name)
+                flag += " REGRESIÓN"
+        print(
+            f"{case.name:<24} {result['ops_per_sec']:>12,.0f} {result['p50_us']:>9.2f} "
+            f"{result['p95_us']:>9.2f} {result['p99_us']:>9.2f} {result['peak_kib']:>9.0f} {flag}"
+        )
+
+    if args.output:
+        document = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": args.scale,
+            "seed": args.seed,
+            "params": vars(params),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    if regressions:
+        print(f"Regresiones (> {args.tolerance:.0%} menos ops/s): {', '.join(regressions)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Synthetic tree generators shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.services.chatbot_shell import ChatbotShell
+
+
+def wide_seed(fan_out: int, root_name: str = "Documentos") -> Dict:
+    """Seed with a single directory holding ``fan_out`` folders and files."""
+    children = []
+    for idx in range(fan_out):
+        if idx % 2:
+            children.append({"name": f"Archivo{idx:07d}.txt", "type": "file"})
+        else:
+            children.append({"name": f"Carpeta{idx:07d}", "type": "directory", "children": []})
+    return {"root": {"name": root_name, "type": "directory", "children": children}}
+
+
+def balanced_seed(depth: int, fan_out: int, files_per_dir: int = 0, root_name: str = "Documentos") -> Dict:
+    """Seed with ``fan_out`` subfolders per level down to ``depth`` levels."""
+
+    def build(name: str, level: int) -> Dict:
+        children = [{"name": f"Archivo{idx}.txt", "type": "file"} for idx in range(files_per_dir)]
+        if level < depth:
+            children.extend(build(f"Carpeta{idx}", level + 1) for idx in range(fan_out))
+        return {"name": name, "type": "directory", "children": children}
+
+    return {"root": build(root_name, 0)}
+
+
+def sized_seed(size: int, fan_out: int, files_per_dir: int = 0, root_name: str = "Documentos") -> Dict:
+    """Seed with about ``size`` folders, filled breadth-first ``fan_out`` at a time.
+
+    The depth follows from the other two (about ``log(size) / log(fan_out)``);
+    each folder also holds ``files_per_dir`` files.
+    """
+    root = {"name": root_name, "type": "directory", "children": []}
+    frontier = deque([root])
+    created = 0
+    while created < size:
+        parent = frontier.popleft()
+        for idx in range(min(fan_out, size - created)):
+            child = {"name": f"Carpeta{idx}", "type": "directory", "children": []}
+            parent["children"].append(child)
+            frontier.append(child)
+            created += 1
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        stack.extend(folder["children"])
+        folder["children"].extend({"name": f"Archivo{idx}.txt", "type": "file"} for idx in range(files_per_dir))
+    return {"root": root}
+
+
+class _FakeAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # otherwise keep-alive replies stall on delayed ACKs
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        server = self.server
+        if server.latency:
+            threading.Event().wait(server.latency)
+        server.requests += 1
+        payload = json.dumps({"choices": [{"message": {"content": server.reply}}]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeAIEndpoint:
+    """Local OpenAI-compatible endpoint that always suggests ``reply``.
+
+    Use as a context manager; :meth:`settings` returns the ``ai`` config block
+    (the key is read from ``FAKE_AI_KEY``, which the caller must set).
+    """
+
+    def __init__(self, reply: str = "log 3", latency: float = 0.0):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeAIHandler)
+        self._server.reply = reply
+        self._server.latency = latency
+        self._server.requests = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def requests(self) -> int:
+        return self._server.requests
+
+    def settings(self) -> Dict:
+        return {
+            "enabled": True,
+            "provider": "openai",
+            "endpoint": f"http://127.0.0.1:{self._server.server_port}/v1/chat/completions",
+            "model": "fake",
+            "api_key_env": "FAKE_AI_KEY",
+            "cache": {"enabled": False},
+        }
+
+    def __enter__(self) -> "FakeAIEndpoint":
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def build_shell(workdir: Path, seed: Dict, **overrides) -> ChatbotShell:
+    """Creates a ChatbotShell whose seed, config and backups live in ``workdir``."""
+    workdir = Path(workdir)
+    seed_path = workdir / "seed.json"
+    seed_path.write_text(json.dumps(seed), encoding="utf-8")
+    settings = {
+        "filesystem_seed": str(seed_path),
+        "backup_dir": str(workdir / "backups"),
+        "max_log_entries": 50,
+        "auto_backup_commands": ["dir", "mkdir", "rmdir"],
+        "ai": {"enabled": False},
+        "default_commands": [],
+    }
+    settings.update(overrides)
+    config_dir = workdir / "config"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    config_path = config_dir / "settings.json"
+    config_path.write_text(json.dumps(settings), encoding="utf-8")
+    return ChatbotShell(str(config_path))
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Protocol
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 from ..services.backup_service import BackupService
 from ..services.log_service import LogService
+from ..services.metrics import NULL_METRICS, Metrics
 from ..services.virtual_fs import VirtualFileSystem
 
 
@@ -14,30 +15,87 @@ class CommandContext:
     logger: LogService
     backup: BackupService
     settings: Dict
+    changes: List[Dict[str, Any]] = field(default_factory=list)
+    metrics: Metrics = NULL_METRICS
 
     def should_backup(self, command_name: str) -> bool:
         commands = self.settings.get("auto_backup_commands", [])
         return command_name in commands
 
+    def record_change(self, op: str, **details: Any) -> None:
+        """Remember a filesystem mutation so it can be journaled as a delta."""
+        self.changes.append({"op": op, **details})
+
+    def take_changes(self) -> List[Dict[str, Any]]:
+        changes, self.changes = self.changes, []
+        return changes
+
+
+def take_flag(args: List[str], *names: str) -> Tuple[bool, List[str]]:
+    """Split ``args`` into whether any of ``names`` was given and the remaining tokens."""
+    remaining = [token for token in args if token not in names]
+    return len(remaining) != len(args), remaining
+
+
+def take_option(tokens: List[str], name: str) -> Optional[str]:
+    """Remove ``name value`` from ``tokens`` and return the value (``None`` if absent)."""
+    if name not in tokens:
+        return None
+    position = tokens.index(name)
+    if position + 1 >= len(tokens):
+        raise ValueError(f"Falta el valor de {name}")
+    value = tokens[position + 1]
+    del tokens[position:position + 2]
+    return value
+
 
 class Command(Protocol):
     name: str
+    mutates: bool
 
     def execute(self, args: List[str], context: CommandContext) -> str:
         ...
 
 
 class CommandRegistry:
-    def __init__(self):
+    """Maps command words to commands through one precomputed table.
+
+    Besides each ``name``, the table holds the command's optional ``aliases``
+    and every abbreviation of a name (at least ``min_abbreviation``
+    characters) that no other command shares, so dispatch is a single
+    dictionary lookup.
+    """
+
+    def __init__(self, min_abbreviation: int = 3):
         self._commands: Dict[str, Command] = {}
+        self._table: Dict[str, Command] = {}
+        self._min_abbreviation = min_abbreviation
 
     def register(self, command: Command) -> None:
         self._commands[command.name] = command
+        self._rebuild()
+
+    def resolve(self, word: str) -> Optional[Command]:
+        """The command ``word`` names, abbreviates or aliases, or ``None``."""
+        return self._table.get(word)
 
     def get(self, name: str) -> Command:
-        if name not in self._commands:
+        command = self._table.get(name)
+        if command is None:
             raise KeyError(f"Comando desconocido: {name}")
-        return self._commands[name]
+        return command
 
     def available(self) -> List[str]:
         return sorted(self._commands.keys())
+
+    def _rebuild(self) -> None:
+        owners: Dict[str, List[Command]] = {}
+        for name, command in self._commands.items():
+            for end in range(self._min_abbreviation, len(name)):
+                owners.setdefault(name[:end], []).append(command)
+        table = {prefix: commands[0] for prefix, commands in owners.items() if len(commands) == 1}
+        for command in self._commands.values():
+            for alias in getattr(command, "aliases", ()):
+                table[alias] = command
+        table.update(self._commands)
+        self._table = table
@@ -7,6 +7,8 @@ from .base import Command, CommandContext
 
 class ClearLogCommand:
     name = "clear"
+    aliases = ("cls",)
+    mutates = False
 
     def execute(self, args: List[str], context: CommandContext) -> str:
         context.logger.clear()
@@ -1,25 +1,78 @@
 from __future__ import annotations
 
-from typing import List
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
 
-from .base import Command, CommandContext
+from ..services.input_validator import quote
+from .base import Command, CommandContext, take_option
+
+_CURSOR_KINDS = {"c": True, "a": False}
 
 
 class DirCommand:
+    """Lists a folder one page at a time.
+
+    ``dir ruta [--limit N] [--offset K]`` or ``dir ruta --cursor T``, where
+    ``T`` is the token printed at the end of the previous page. Only a
+    summary of the listing goes to the history.
+    """
+
     name = "dir"
+    aliases = ("ls",)
+    mutates = False
+    default_page = 500
 
     def execute(self, args: List[str], context: CommandContext) -> str:
-        target = args[0] if args else f"/{context.filesystem.root_name}"
-        listing = context.filesystem.list_directory(target)
-        lines = [f"Contenido de {target}:"]
-        if listing["folders"]:
-            lines.append("Carpetas:")
-            lines.extend(f"  - {folder}" for folder in listing["folders"])
-        if listing["files"]:
-            lines.append("Archivos:")
-            lines.extend(f"  - {file}" for file in listing["files"])
-        if len(lines) == 1:
-            lines.append("(vacío)")
-        message = "\n".join(lines)
-        context.logger.add_entry("dir", message)
-        return message
+        tokens = list(args)
+        limit = self._number(take_option(tokens, "--limit"), "--limit", minimum=1)
+        offset = self._number(take_option(tokens, "--offset"), "--offset", minimum=0)
+        cursor = take_option(tokens, "--cursor")
+        target = tokens[0] if tokens else f"/{context.filesystem.root_name}"
+        if limit is None:
+            limit = context.settings.get("dir_page_size", self.default_page)
+        after = decode_cursor(cursor) if cursor is not None else None
+        entries = context.filesystem.iter_directory(target, offset=offset or 0, after=after)
+        page = list(islice(entries, limit + 1))
+        more = len(page) > limit
+        page = page[:limit]
+        lines = list(self._render(target, page, first_page=cursor is None and not offset))
+        if more:
+            lines.append(f"Hay más elementos; continúe con: dir {quote(target)} --cursor {encode_cursor(page[-1])}")
+        summary = f"Contenido de {target}: {len(page)} elementos"
+        context.logger.add_entry("dir", f"{summary} (continúa)" if more else summary)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _render(target: str, page: List[Tuple[bool, str]], first_page: bool) -> Iterator[str]:
+        yield f"Contenido de {target}:"
+        if not page:
+            yield "(vacío)" if first_page else "(sin más elementos)"
+            return
+        section: Optional[bool] = None
+        for is_dir, name in page:
+            if is_dir is not section:
+                section = is_dir
+                yield "Carpetas:" if is_dir else "Archivos:"
+            yield f"  - {name}"
+
+    @staticmethod
+    def _number(value: Optional[str], name: str, minimum: int) -> Optional[int]:
+        if value is None:
+            return None
+        try:
+            return max(minimum, int(value))
+        except ValueError as exc:
+            raise ValueError(f"El parámetro {name} debe ser numérico") from exc
+
+
+def encode_cursor(entry: Tuple[bool, str]) -> str:
+    """Opaque token for the last listed entry; hex keeps it intact through case folding."""
+    is_dir, name = entry
+    return ("c" if is_dir else "a") + name.encode("utf-8").hex()
+
+
+def decode_cursor(token: str) -> Tuple[bool, str]:
+    try:
+        return _CURSOR_KINDS[token[0].lower()], bytes.fromhex(token[1:]).decode("utf-8")
+    except (IndexError, KeyError, ValueError) as exc:
+        raise ValueError("Cursor de listado inválido") from exc
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import List
+
+from .base import Command, CommandContext
+
+
+class DuCommand:
+    name = "du"
+    mutates = False
+
+    def execute(self, args: List[str], context: CommandContext) -> str:
+        target = args[0] if args else f"/{context.filesystem.root_name}"
+        usage = context.filesystem.usage(target)
+        message = (
+            f"Resumen de {target}: {usage['folders']} carpetas, {usage['files']} archivos, "
+            f"{usage['height']} niveles por debajo (profundidad {usage['depth']})"
+        )
+        context.logger.add_entry("du", message)
+        return message
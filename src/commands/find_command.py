@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import List
+
+from .base import Command, CommandContext, take_flag, take_option
+
+
+class FindCommand:
+    name = "find"
+    aliases = ("search",)
+    mutates = False
+    default_limit = 50
+
+    def execute(self, args: List[str], context: CommandContext) -> str:
+        tokens = list(args)
+        within = take_option(tokens, "--in")
+        limit_text = take_option(tokens, "--limit")
+        mode = "substring"
+        for flag in ("exact", "prefix", "glob", "substring"):
+            given, tokens = take_flag(tokens, f"--{flag}")
+            if given:
+                mode = flag
+        if not tokens:
+            raise ValueError("Debe indicar el nombre a buscar")
+        pattern = " ".join(tokens)
+        if mode == "substring" and any(char in pattern for char in "*?["):
+            mode = "glob"
+        limit = self.default_limit
+        if limit_text is not None:
+            try:
+                limit = max(1, int(limit_text))
+            except ValueError as exc:
+                raise ValueError("El parámetro --limit debe ser numérico") from exc
+        paths = context.filesystem.find(pattern, mode=mode, within=within)
+        context.logger.add_entry("find", f"'{pattern}' ({mode}): {len(paths)} resultados")
+        if not paths:
+            return f"No se encontró '{pattern}'"
+        lines = [f"Resultados para '{pattern}' ({len(paths)}):"]
+        lines.extend(f"  - {path}" for path in paths[:limit])
+        if len(paths) > limit:
+            lines.append(f"  ... y {len(paths) - limit} más")
+        return "\n".join(lines)
@@ -1,25 +1,41 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 from .base import Command, CommandContext
 
 
 class LogCommand:
     name = "log"
+    mutates = False
+    default_page = 10
 
     def execute(self, args: List[str], context: CommandContext) -> str:
-        limit = None
-        if args:
-            try:
-                limit = max(1, int(args[0]))
-            except ValueError as exc:
-                raise ValueError("El parámetro de log debe ser numérico") from exc
-        entries = context.logger.history()
-        if not entries:
+        limit: Optional[int] = None
+        offset = 0
+        tokens = list(args)
+        if "--offset" in tokens:
+            position = tokens.index("--offset")
+            offset = self._number(tokens[position + 1:position + 2], minimum=0)
+            del tokens[position:position + 2]
+        if tokens:
+            limit = self._number(tokens[:1], minimum=1)
+        if not len(context.logger):
             return "No hay entradas en el historial"
-        if limit:
-            entries = entries[:limit]
         lines = ["Historial reciente:"]
-        lines.extend(entries)
+        if offset:
+            lines.extend(context.logger.page(limit or self.default_page, offset))
+        elif limit is not None:
+            lines.extend(context.logger.page(limit))
+        else:
+            lines.extend(context.logger.recent())
+        if len(lines) == 1:
+            return "No hay más entradas en el historial"
         return "\n".join(lines)
+
+    @staticmethod
+    def _number(tokens: List[str], minimum: int) -> int:
+        try:
+            return max(minimum, int(tokens[0]))
+        except (IndexError, ValueError) as exc:
+            raise ValueError("El parámetro de log debe ser numérico") from exc
@@ -2,16 +2,33 @@ from __future__ import annotations
 
 from typing import List
 
-from .base import Command, CommandContext
+from .base import Command, CommandContext, take_flag
 
 
 class MkdirCommand:
     name = "mkdir"
+    aliases = ("md",)
+    mutates = True
 
     def execute(self, args: List[str], context: CommandContext) -> str:
+        parents, args = take_flag(args, "-p", "--parents")
         if not args:
             raise ValueError("Debe indicar la carpeta a crear")
+        if parents:
+            return self._make_parents(args[0], context)
         created = context.filesystem.make_directory(args[0])
+        context.record_change("mkdir", path=args[0])
         message = f"Carpeta '{created}' creada correctamente"
         context.logger.add_entry("mkdir", message)
         return message
+
+    @staticmethod
+    def _make_parents(path: str, context: CommandContext) -> str:
+        created = context.filesystem.make_directories(path)
+        if created:
+            context.record_change("mkdir", path=path, parents=True)
+            message = f"Ruta '{path}' creada correctamente ({created} carpetas nuevas)"
+        else:
+            message = f"La ruta '{path}' ya existía"
+        context.logger.add_entry("mkdir", message)
+        return message
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import List
+
+from .base import Command, CommandContext
+
+
+class MvCommand:
+    name = "mv"
+    aliases = ("move",)
+    mutates = True
+
+    def execute(self, args: List[str], context: CommandContext) -> str:
+        if len(args) < 2:
+            raise ValueError("Debe indicar el origen y el destino")
+        source, destination = args[0], args[1]
+        new_path = context.filesystem.move(source, destination)
+        context.record_change("mv", path=source, destination=destination)
+        message = f"'{source}' movido a '{new_path}'"
+        context.logger.add_entry("mv", message)
+        return message
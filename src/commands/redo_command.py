@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import List
+
+from .base import Command, CommandContext
+
+
+class RedoCommand:
+    name = "redo"
+    mutates = True
+
+    def execute(self, args: List[str], context: CommandContext) -> str:
+        history = context.filesystem.undo_log
+        if history is None:
+            raise ValueError("Deshacer/rehacer no está habilitado")
+        label, change = history.redo(journal=context.backup.mode == "journal")
+        context.record_change(change.pop("op"), **change)
+        message = f"Se rehizo: {label}"
+        context.logger.add_entry("redo", message)
+        return message
@@ -2,16 +2,25 @@ from __future__ import annotations
 
 from typing import List
 
-from .base import Command, CommandContext
+from .base import Command, CommandContext, take_flag
 
 
 class RmdirCommand:
     name = "rmdir"
+    aliases = ("rd",)
+    mutates = True
 
     def execute(self, args: List[str], context: CommandContext) -> str:
+        recursive, args = take_flag(args, "-r", "--recursive")
         if not args:
             raise ValueError("Debe indicar la carpeta a eliminar")
-        deleted = context.filesystem.remove_directory(args[0])
-        message = f"Carpeta '{deleted}' eliminada correctamente"
+        if recursive:
+            deleted, removed = context.filesystem.remove_tree(args[0])
+            context.record_change("rmdir", path=args[0], recursive=True)
+            message = f"Carpeta '{deleted}' eliminada correctamente ({removed} elementos)"
+        else:
+            deleted = context.filesystem.remove_directory(args[0])
+            context.record_change("rmdir", path=args[0])
+            message = f"Carpeta '{deleted}' eliminada correctamente"
         context.logger.add_entry("rmdir", message)
         return message
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import List
+
+from .base import Command, CommandContext, take_flag
+
+
+class StatsCommand:
+    """Shows per-stage latencies and counters.
+
+    ``stats`` prints a table, ``stats --json`` and ``stats --prometheus``
+    the machine-readable dumps, and ``stats --reset`` starts over.
+    """
+
+    name = "stats"
+    mutates = False
+
+    def execute(self, args: List[str], context: CommandContext) -> str:
+        metrics = context.metrics
+        if not metrics.enabled:
+            return "Las métricas están desactivadas (metrics.enabled en la configuración)"
+        as_json, args = take_flag(args, "--json")
+        as_prometheus, args = take_flag(args, "--prometheus")
+        reset, args = take_flag(args, "--reset")
+        if args:
+            raise ValueError("Uso: stats [--json | --prometheus | --reset]")
+        if reset:
+            metrics.reset()
+            return "Métricas reiniciadas"
+        if as_json:
+            return metrics.to_json()
+        if as_prometheus:
+            return metrics.to_prometheus().rstrip("\n")
+        return self._render(metrics.snapshot())
+
+    @staticmethod
+    def _render(data: dict) -> str:
+        lines = [f"Métricas de los últimos {data['uptime']:.0f} s:"]
+        if data["stages"]:
+            lines.append(
+                f"{'etapa':<10} {'n':>7} {'media ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'máx ms':>8}"
+            )
+        for stage, summary in data["stages"].items():
+            lines.append(
+                f"{stage:<10} {summary['count']:>7} {summary['mean'] * 1e3:>9.3f} "
+                f"{summary['p50'] * 1e3:>8.3f} {summary['p95'] * 1e3:>8.3f} "
+                f"{summary['p99'] * 1e3:>8.3f} {summary['max'] * 1e3:>8.3f}"
+            )
+        for name, value in {**data["counters"], **data["gauges"]}.items():
+            lines.append(f"{name}: {value:.3f}" if isinstance(value, float) else f"{name}: {value}")
+        return "\n".join(lines)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+import time
+from queue import Empty, Full  # re-exported: timeouts raise the stdlib exceptions
+from typing import Generic, List, Optional, TypeVar
+
+from .nodes import Node
+
+T = TypeVar("T")
+
+
+class QueueClosed(Exception):
+    """Raised by ``put`` after :meth:`BlockingQueue.close`, and by ``get`` once drained."""
+
+
+class BlockingQueue(Generic[T]):
+    """Thread-safe FIFO with an optional capacity, for producer/consumer hand-offs.
+
+    Producers and consumers lock different ends of the linked list (a
+    dummy head node keeps them apart), so a ``put`` only waits for other
+    producers and a ``get`` only for other consumers. Instead of a shared
+    counter each side keeps its own running total, written only under its
+    own lock; the size is their difference. ``capacity=0`` means unbounded.
+
+    ``put``/``get`` block until they can proceed; with ``timeout`` they raise
+    :class:`queue.Full`/:class:`queue.Empty` instead. After :meth:`close`,
+    ``put`` raises :class:`QueueClosed` and consumers still receive what was
+    queued before getting :class:`QueueClosed` themselves.
+    """
+
+    def __init__(self, capacity: int = 0):
+        if capacity < 0:
+            raise ValueError("La capacidad no puede ser negativa")
+        self._capacity = capacity
+        self._head = self._tail = Node(None)
+        self._puts = 0  # written under _put_lock only
+        self._takes = 0  # written under _take_lock only
+        self._put_lock = threading.Lock()
+        self._not_full = threading.Condition(self._put_lock)
+        self._take_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._take_lock)
+        self._closed = False
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, value: T, timeout: Optional[float] = None) -> None:
+        with self._put_lock:
+            if self._capacity:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while self._puts - self._takes >= self._capacity and not self._closed:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise Full
+                    self._not_full.wait(remaining)
+            if self._closed:
+                raise QueueClosed("La cola está cerrada")
+            node = Node(value)
+            self._tail.next = node
+            self._tail = node
+            # publish our total before reading theirs: if a consumer misses
+            # this value, we are guaranteed to see it emptied the queue
+            self._puts = puts = self._puts + 1
+            size = puts - self._takes
+            if self._capacity and size < self._capacity:
+                self._not_full.notify()  # cascade: another producer may fit too
+        if size == 1:
+            with self._take_lock:
+                self._not_empty.notify()
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        return self._take(1, timeout)[0]
+
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[T]:
+        """Wait for at least one value, then take up to ``max_items`` without waiting again."""
+        if max_items < 1:
+            raise ValueError("max_items debe ser al menos 1")
+        return self._take(max_items, timeout)
+
+    def close(self) -> None:
+        """Refuse new values and wake every waiting producer and consumer."""
+        with self._put_lock, self._take_lock:
+            self._closed = True
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+
+    def __len__(self) -> int:
+        puts = self._puts
+        return max(0, puts - self._takes)
+
+    def _take(self, max_items: int, timeout: Optional[float]) -> List[T]:
+        with self._take_lock:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._puts == self._takes:
+                if self._closed:
+                    raise QueueClosed("La cola está cerrada")
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise Empty
+                self._not_empty.wait(remaining)
+            taken = min(max_items, self._puts - self._takes)
+            values: List[T] = []
+            head = self._head
+            for _ in range(taken):
+                head = head.next  # type: ignore[assignment]
+                values.append(head.value)
+                head.value = None  # the new dummy head must not keep the value alive
+            self._head = head
+            self._takes = takes = self._takes + taken
+            left = self._puts - takes
+            if left > 0:
+                self._not_empty.notify()  # cascade: values are left for another consumer
+        if self._capacity and left + taken >= self._capacity:
+            with self._put_lock:
+                self._not_full.notify(taken)
+        return values
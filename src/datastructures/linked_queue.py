@@ -1,25 +1,31 @@
 from __future__ import annotations
 
-from typing import Generic, Iterable, Iterator, Optional, TypeVar
+from typing import Generic, Iterable, Iterator, List, Optional, TypeVar
 
-from .nodes import Node
+from .nodes import Node, NodePool
 
 T = TypeVar("T")
 
 
 class LinkedQueue(Generic[T]):
-    """Queue implemented with singly linked nodes."""
+    """Queue implemented with singly linked nodes.
 
-    def __init__(self, values: Optional[Iterable[T]] = None):
+    Besides ``enqueue``/``dequeue`` it offers ``extend``, ``drain`` (dequeue
+    up to ``n`` values in one pass) and ``splice``, which appends another
+    ``LinkedQueue`` in O(1). An optional :class:`NodePool` recycles the nodes
+    of dequeued values.
+    """
+
+    def __init__(self, values: Optional[Iterable[T]] = None, pool: Optional[NodePool] = None):
         self._head: Optional[Node] = None
         self._tail: Optional[Node] = None
         self._size = 0
+        self._pool = pool
         if values:
-            for value in values:
-                self.enqueue(value)
+            self.extend(values)
 
     def enqueue(self, value: T) -> None:
-        node = Node(value)
+        node = Node(value) if self._pool is None else self._pool.acquire(value)
         if not self._head:
             self._head = self._tail = node
         else:
@@ -28,6 +34,26 @@ class LinkedQueue(Generic[T]):
             self._tail = node
         self._size += 1
 
+    def extend(self, values: Iterable[T]) -> None:
+        """Enqueue ``values`` in order."""
+        acquire = Node if self._pool is None else self._pool.acquire
+        anchor = Node(None)  # temporary head so the loop needs no empty-queue branch
+        tail = anchor
+        added = 0
+        for value in values:
+            node = acquire(value)
+            tail.next = node
+            tail = node
+            added += 1
+        if not added:
+            return
+        if self._tail is None:
+            self._head = anchor.next
+        else:
+            self._tail.next = anchor.next
+        self._tail = tail
+        self._size += added
+
     def dequeue(self) -> T:
         if not self._head:
             raise IndexError("La cola está vacía")
@@ -36,7 +62,48 @@ class LinkedQueue(Generic[T]):
         if self._head is None:
             self._tail = None
         self._size -= 1
-        return node.value  # type: ignore[return-value]
+        value = node.value
+        if self._pool is not None:
+            self._pool.release(node)
+        return value  # type: ignore[return-value]
+
+    def drain(self, count: Optional[int] = None) -> List[T]:
+        """Dequeue up to ``count`` values (all of them by default), oldest first."""
+        if count is not None and count < 0:
+            raise ValueError("La cantidad no puede ser negativa")
+        take = self._size if count is None else min(count, self._size)
+        node = self._head
+        values: List[T] = []
+        append = values.append
+        if self._pool is None:
+            for _ in range(take):
+                append(node.value)  # type: ignore[union-attr]
+                node = node.next  # type: ignore[union-attr]
+        else:
+            release = self._pool.release
+            for _ in range(take):
+                append(node.value)  # type: ignore[union-attr]
+                following = node.next  # type: ignore[union-attr]
+                release(node)  # type: ignore[arg-type]
+                node = following
+        self._head = node
+        if node is None:
+            self._tail = None
+        self._size -= take
+        return values
+
+    def splice(self, other: "LinkedQueue[T]") -> None:
+        """Move every value of ``other`` behind this queue's in O(1)."""
+        if other is self or other._head is None:
+            return
+        if self._tail is None:
+            self._head = other._head
+        else:
+            self._tail.next = other._head
+        self._tail = other._tail
+        self._size += other._size
+        other._head = other._tail = None
+        other._size = 0
 
     def peek(self) -> T:
         if not self._head:
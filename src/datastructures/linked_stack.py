@@ -1,33 +1,140 @@
 from __future__ import annotations
 
-from typing import Generic, Iterable, Iterator, Optional, TypeVar
+from typing import Generic, Iterable, Iterator, List, Optional, TypeVar
 
-from .nodes import Node
+from .nodes import Node, NodePool
 
 T = TypeVar("T")
 
 
 class LinkedStack(Generic[T]):
-    """Stack implemented with singly linked nodes."""
+    """Stack implemented with singly linked nodes.
 
-    def __init__(self, values: Optional[Iterable[T]] = None):
+    Besides ``push``/``pop`` it offers bulk operations that walk the chain
+    once: ``extend``, ``pop_many``, ``truncate`` (keep the newest ``n``) and
+    ``splice``, which stacks another ``LinkedStack`` on top in O(1). An
+    optional :class:`NodePool` recycles the nodes of popped values.
+    """
+
+    def __init__(self, values: Optional[Iterable[T]] = None, pool: Optional[NodePool] = None):
         self._top: Optional[Node] = None
+        self._bottom: Optional[Node] = None
         self._size = 0
+        self._pool = pool
         if values:
-            for value in values:
-                self.push(value)
+            self.extend(values)
 
     def push(self, value: T) -> None:
-        self._top = Node(value, self._top)
+        pool = self._pool
+        node = Node(value, self._top) if pool is None else pool.acquire(value, self._top)
+        if self._top is None:
+            self._bottom = node
+        self._top = node
         self._size += 1
 
+    def extend(self, values: Iterable[T]) -> None:
+        """Push ``values`` in order, so the last one ends up on top."""
+        acquire = Node if self._pool is None else self._pool.acquire
+        iterator = iter(values)
+        if self._top is None:
+            for value in iterator:
+                self._top = self._bottom = acquire(value, None)
+                self._size = 1
+                break
+        top = self._top
+        size = self._size
+        for value in iterator:
+            top = acquire(value, top)
+            size += 1
+        self._top = top
+        self._size = size
+
     def pop(self) -> T:
         if not self._top:
             raise IndexError("La pila está vacía")
         node = self._top
         self._top = node.next
+        if self._top is None:
+            self._bottom = None
         self._size -= 1
-        return node.value  # type: ignore[return-value]
+        value = node.value
+        if self._pool is not None:
+            self._pool.release(node)
+        return value  # type: ignore[return-value]
+
+    def pop_many(self, count: int) -> List[T]:
+        """Pop up to ``count`` values, top first."""
+        if count < 0:
+            raise ValueError("La cantidad no puede ser negativa")
+        take = min(count, self._size)
+        node = self._top
+        values: List[T] = []
+        append = values.append
+        if self._pool is None:
+            for _ in range(take):
+                append(node.value)  # type: ignore[union-attr]
+                node = node.next  # type: ignore[union-attr]
+        else:
+            node = self._release_chain(node, take, append)
+        self._top = node
+        if node is None:
+            self._bottom = None
+        self._size -= take
+        return values
+
+    def truncate(self, keep: int) -> List[T]:
+        """Keep only the ``keep`` newest values; returns the dropped ones, newest first.
+
+        Costs O(keep) to find the cut plus O(dropped) to collect what falls off.
+        """
+        if keep < 0:
+            raise ValueError("La cantidad no puede ser negativa")
+        if self._size <= keep:
+            return []
+        if keep == 0:
+            dropped = list(self)
+            self.clear()
+            return dropped
+        last = self._top
+        for _ in range(keep - 1):
+            last = last.next  # type: ignore[union-attr]
+        assert last is not None
+        node, last.next = last.next, None
+        self._bottom = last
+        dropped_count = self._size - keep
+        self._size = keep
+        dropped: List[T] = []
+        append = dropped.append
+        if self._pool is None:
+            while node is not None:
+                append(node.value)
+                node = node.next
+        else:
+            self._release_chain(node, dropped_count, append)
+        return dropped
+
+    def splice(self, other: "LinkedStack[T]") -> None:
+        """Move every value of ``other`` on top of this stack in O(1), keeping its order."""
+        if other is self or other._top is None:
+            return
+        assert other._bottom is not None
+        other._bottom.next = self._top
+        if self._top is None:
+            self._bottom = other._bottom
+        self._top = other._top
+        self._size += other._size
+        other._top = other._bottom = None
+        other._size = 0
+
+    def _release_chain(self, node: Optional[Node], count: int, append) -> Optional[Node]:
+        """Collect ``count`` values from ``node`` on, returning their nodes to the pool."""
+        release = self._pool.release  # type: ignore[union-attr]
+        for _ in range(count):
+            append(node.value)  # type: ignore[union-attr]
+            following = node.next  # type: ignore[union-attr]
+            release(node)
+            node = following
+        return node
 
     def peek(self) -> T:
         if not self._top:
@@ -35,7 +142,9 @@ class LinkedStack(Generic[T]):
         return self._top.value  # type: ignore[return-value]
 
     def clear(self) -> None:
+        """Drop every value in O(1); the nodes are not returned to the pool."""
         self._top = None
+        self._bottom = None
         self._size = 0
 
     def __len__(self) -> int:
@@ -1,3 +1,8 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+
 class Node:
     """Simple singly linked node used by stack and queue."""
 
@@ -6,3 +11,35 @@ class Node:
     def __init__(self, value, next_node=None):
         self.value = value
         self.next = next_node
+
+
+class NodePool:
+    """Free list of :class:`Node` objects shared by stacks and queues.
+
+    Containers built with a pool take nodes from it and give them back when
+    values leave, which saves allocator work under heavy push/pop churn. At
+    most ``max_size`` spare nodes are kept; released nodes drop their value
+    so nothing stays referenced.
+    """
+
+    __slots__ = ("_free", "max_size")
+
+    def __init__(self, max_size: int = 1024):
+        self._free: List[Node] = []
+        self.max_size = max_size
+
+    def acquire(self, value, next_node: Optional[Node] = None) -> Node:
+        if not self._free:
+            return Node(value, next_node)
+        node = self._free.pop()
+        node.value = value
+        node.next = next_node
+        return node
+
+    def release(self, node: Node) -> None:
+        if len(self._free) < self.max_size:
+            node.value = node.next = None
+            self._free.append(node)
+
+    def __len__(self) -> int:
+        return len(self._free)
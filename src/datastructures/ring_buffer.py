@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Generic, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class RingBuffer(Generic[T]):
+    """Fixed-capacity buffer over preallocated slots.
+
+    ``append`` is O(1) and overwrites the oldest value once full. Iteration
+    goes newest first, matching ``LinkedStack``.
+    """
+
+    __slots__ = ("_slots", "_capacity", "_start", "_size", "evicted")
+
+    def __init__(self, capacity: int, values: Optional[Iterable[T]] = None):
+        if capacity < 1:
+            raise ValueError("La capacidad debe ser positiva")
+        self._slots: List[Optional[T]] = [None] * capacity
+        self._capacity = capacity
+        self._start = 0  # index of the oldest value
+        self._size = 0
+        self.evicted = 0
+        if values:
+            for value in values:
+                self.append(value)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def append(self, value: T) -> Optional[T]:
+        """Store ``value``; returns the evicted oldest value when full."""
+        if self._size < self._capacity:
+            self._slots[(self._start + self._size) % self._capacity] = value
+            self._size += 1
+            return None
+        dropped = self._slots[self._start]
+        self._slots[self._start] = value
+        self._start = (self._start + 1) % self._capacity
+        self.evicted += 1
+        return dropped
+
+    def peek(self) -> T:
+        if not self._size:
+            raise IndexError("El buffer está vacío")
+        return self._slots[(self._start + self._size - 1) % self._capacity]  # type: ignore[return-value]
+
+    def latest(self, count: int) -> Iterator[T]:
+        """Yield up to ``count`` values, newest first, in O(count)."""
+        slots, capacity = self._slots, self._capacity
+        newest = self._start + self._size - 1
+        for offset in range(min(count, self._size)):
+            yield slots[(newest - offset) % capacity]  # type: ignore[misc]
+
+    def oldest_first(self) -> Iterator[T]:
+        slots, capacity = self._slots, self._capacity
+        for offset in range(self._size):
+            yield slots[(self._start + offset) % capacity]  # type: ignore[misc]
+
+    def clear(self) -> None:
+        self._slots = [None] * self._capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        return self.latest(self._size)
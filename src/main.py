@@ -1,15 +1,38 @@
 from __future__ import annotations
 
+import argparse
 import sys
 from pathlib import Path
 
+from .services.batch_runner import BatchRunner, read_script
 from .services.chatbot_shell import ChatbotShell
 
 
 def main() -> None:
     base_dir = Path(__file__).resolve().parent.parent
-    config_path = base_dir / "config" / "settings.json"
-    shell = ChatbotShell(str(config_path))
+    parser = argparse.ArgumentParser(description="Chatbot de Pilas y Colas sobre un árbol de carpetas virtual.")
+    parser.add_argument("--config", default=str(base_dir / "config" / "settings.json"))
+    parser.add_argument("--script", help="Archivo de comandos a ejecutar sin interacción ('-' para stdin)")
+    parser.add_argument("--dry-run", action="store_true", help="Solo valida las rutas del script, sin aplicar cambios")
+    parser.add_argument(
+        "--backup-every", type=int, default=0, help="Respalda cada N cambios (0: solo al terminar el script)"
+    )
+    parser.add_argument("--quiet", action="store_true", help="En modo script, muestra solo los errores")
+    args = parser.parse_args()
+    shell = ChatbotShell(args.config)
+    try:
+        if args.script:
+            ok = run_script(shell, args)
+        else:
+            run_interactive(shell)
+            ok = True
+    finally:
+        shell.close()
+    if not ok:
+        sys.exit(1)
+
+
+def run_interactive(shell: ChatbotShell) -> None:
     print("Chatbot de Pilas y Colas listo. Escriba 'salir' para terminar.")
     print(f"Comandos disponibles: {', '.join(shell.available_commands())}")
     while True:
@@ -25,5 +48,29 @@ def main() -> None:
         print(f"Cortana: {response}")
 
 
+def run_script(shell: ChatbotShell, args: argparse.Namespace) -> bool:
+    runner = BatchRunner(shell, dry_run=args.dry_run, backup_every=args.backup_every)
+    if args.script == "-":
+        report_results(runner.run(read_script(sys.stdin)), args.quiet)
+    else:
+        with open(args.script, "r", encoding="utf-8") as stream:
+            report_results(runner.run(read_script(stream)), args.quiet)
+    report = runner.report
+    print(
+        f"{report.commands} comandos en {report.elapsed:.2f} s "
+        f"({report.commands_per_second:.0f} comandos/s), {report.errors} errores, "
+        f"{report.backups} respaldos",
+        file=sys.stderr,
+    )
+    return report.errors == 0
+
+
+def report_results(results, quiet: bool) -> None:
+    for result in results:
+        if quiet and result.ok:
+            continue
+        print(f"[{result.line_number}] {result.message}\nCortana: {result.response}")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .services.backup_service import restore_from_journal
+from .services.config_loader import ConfigLoader
+
+
+def main() -> None:
+    base_dir = Path(__file__).resolve().parent.parent
+    parser = argparse.ArgumentParser(
+        description="Reconstruye el árbol a partir de la base y los deltas del journal."
+    )
+    parser.add_argument("--config", default=str(base_dir / "config" / "settings.json"))
+    parser.add_argument("--until", help="Fecha ISO (p. ej. 2025-12-03T18:42:00) a restaurar")
+    parser.add_argument("--output", help="Archivo JSON destino; por defecto stdout")
+    args = parser.parse_args()
+
+    config = ConfigLoader(args.config)
+    backup_dir = config.resolve_path(config.get("backup_dir"))
+    try:
+        filesystem = restore_from_journal(str(backup_dir), until=args.until)
+    except (ValueError, OSError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    text = json.dumps(filesystem.snapshot(), indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """LRU + TTL cache for AI suggestions with in-flight request coalescing.
+
+    When ``persist_path`` is given, entries are also appended to a JSON-lines
+    file and reloaded on start so answers survive restarts.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 3600.0,
+        persist_path: Optional[Path] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0, "expired": 0}
+        self._persist_path = Path(persist_path) if persist_path else None
+        if self._persist_path:
+            self._load()
+
+    @staticmethod
+    def make_key(provider: str, model: str, system_prompt: str, message: str) -> str:
+        # only whitespace is collapsed: the suggestion copies names from the
+        # message, so "crea fotos" and "crea Fotos" need their own answers
+        normalized = " ".join(message.split())
+        raw = "\x1f".join((provider, model, system_prompt, normalized))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._lookup(key)
+
+    def put(self, key: str, value: str) -> None:
+        expires = self._clock() + self._ttl
+        with self._lock:
+            self._store(key, value, expires)
+        self._persist(key, value, expires)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Optional[str]]) -> Optional[str]:
+        """Return the cached value or run ``compute`` once for all concurrent callers."""
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = self._inflight[key] = threading.Event()
+                owner = True
+            else:
+                self._counters["coalesced"] += 1
+                owner = False
+        if not owner:
+            pending.wait()
+            with self._lock:
+                entry = self._entries.get(key)
+            return entry[0] if entry else None
+        try:
+            value = compute()
+            if value is not None:
+                self.put(key, value)
+            return value
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            pending.set()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._counters, "size": len(self._entries)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self._persist_path and self._persist_path.exists():
+            self._persist_path.unlink()
+
+    def _lookup(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._counters["misses"] += 1
+            return None
+        value, expires = entry
+        if expires <= self._clock():
+            del self._entries[key]
+            self._counters["expired"] += 1
+            self._counters["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._counters["hits"] += 1
+        return value
+
+    def _store(self, key: str, value: str, expires: float) -> None:
+        self._entries[key] = (value, expires)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def _persist(self, key: str, value: str, expires: float) -> None:
+        if not self._persist_path:
+            return
+        record = json.dumps({"key": key, "value": value, "expires": expires}, ensure_ascii=False)
+        try:
+            self._persist_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._persist_path.open("a", encoding="utf-8") as fh:
+                fh.write(record + "\n")
+        except OSError:
+            pass  # the in-memory tier keeps working without the disk tier
+
+    def _load(self) -> None:
+        assert self._persist_path is not None
+        if not self._persist_path.exists():
+            return
+        now = self._clock()
+        lines = 0
+        with self._persist_path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                lines += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("expires", 0) > now:
+                    self._store(record["key"], record["value"], record["expires"])
+        self._counters["evictions"] = 0
+        if lines > 2 * len(self._entries):
+            self._compact()
+
+    def _compact(self) -> None:
+        assert self._persist_path is not None
+        tmp = self._persist_path.with_suffix(self._persist_path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            for key, (value, expires) in self._entries.items():
+                fh.write(json.dumps({"key": key, "value": value, "expires": expires}, ensure_ascii=False) + "\n")
+        tmp.replace(self._persist_path)
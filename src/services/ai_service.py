@@ -3,8 +3,22 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass
-from typing import Optional, Tuple
-from urllib import error, request
+from typing import Dict, Optional, Tuple
+
+from .ai_cache import ResponseCache
+from .http_transport import CircuitBreaker, PooledHttpTransport, Transport, TransportError
+
+
+class AIError(Exception):
+    """Why one suggestion request produced no command (reported to that caller only)."""
+
+
+@dataclass
+class AISuggestion:
+    """Outcome of one :meth:`AIService.suggest` call."""
+
+    command: Optional[str]
+    error: Optional[str] = None
 
 
 @dataclass
@@ -15,18 +29,44 @@ class AISettings:
     api_key_env: str
     system_prompt: str
     provider: str
+    connect_timeout: float = 5.0
+    read_timeout: float = 15.0
+    max_retries: int = 2
+    breaker_threshold: int = 3
+    breaker_reset_seconds: float = 30.0
 
 
 class AIService:
-    """Minimal HTTP client for LLM command suggestions."""
+    """Minimal HTTP client for LLM command suggestions.
+
+    :meth:`suggest` returns each call's error with its result, so concurrent
+    sessions never see each other's failures; :attr:`last_error` only keeps
+    the outcome of the latest :meth:`suggest_command` call.
+    """
 
-    def __init__(self, settings: AISettings):
+    def __init__(
+        self,
+        settings: AISettings,
+        cache: Optional[ResponseCache] = None,
+        transport: Optional[Transport] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
         self._settings = settings
         self._api_key = os.getenv(settings.api_key_env, "")
         self._last_error: Optional[str] = None
         self._provider = (settings.provider or "openai").lower()
+        self._cache = cache
+        self._transport = transport or PooledHttpTransport(
+            connect_timeout=settings.connect_timeout,
+            read_timeout=settings.read_timeout,
+            max_retries=settings.max_retries,
+        )
+        self._breaker = breaker or CircuitBreaker(
+            failure_threshold=settings.breaker_threshold,
+            reset_timeout=settings.breaker_reset_seconds,
+        )
 
-    def is_ready(self) -> bool:
+    def is_configured(self) -> bool:
         return (
             self._settings.enabled
             and bool(self._settings.endpoint)
@@ -34,41 +74,75 @@ class AIService:
             and bool(self._api_key)
         )
 
+    def is_ready(self) -> bool:
+        """Configured; an open circuit breaker still lets cached answers through."""
+        return self.is_configured()
+
+    def suggest(self, user_message: str) -> AISuggestion:
+        if not self.is_configured():
+            return AISuggestion(None, "IA no configurada o sin API key")
+        try:
+            if self._cache is None:
+                command = self._guarded_request(user_message)
+            else:
+                key = ResponseCache.make_key(
+                    self._provider, self._settings.model, self._settings.system_prompt, user_message
+                )
+                # the breaker only guards the network: a cached answer is served during an outage
+                command = self._cache.get_or_compute(key, lambda: self._guarded_request(user_message))
+        except AIError as exc:
+            return AISuggestion(None, str(exc))
+        if command is None:  # coalesced behind a request that failed
+            return AISuggestion(None, "La IA no devolvió una sugerencia")
+        return AISuggestion(command)
+
     def suggest_command(self, user_message: str) -> Optional[str]:
-        self._last_error = None
-        if not self.is_ready():
-            self._last_error = "IA no configurada o sin API key"
-            return None
-        request_data = self._build_request(user_message)
-        if not request_data:
-            return None
-        url, payload, headers = request_data
+        """Single-caller shorthand for :meth:`suggest`; the error goes to :attr:`last_error`."""
+        result = self.suggest(user_message)
+        self._last_error = result.error
+        return result.command
+
+    def cache_stats(self) -> Dict[str, int]:
+        if self._cache is None:
+            return {}
+        return self._cache.stats()
+
+    def _guarded_request(self, user_message: str) -> str:
+        if not self._breaker.allow():
+            raise AIError("IA en pausa tras fallos repetidos")
         try:
-            req = request.Request(
-                url,
-                data=json.dumps(payload).encode("utf-8"),
-                headers=headers,
-                method="POST",
-            )
-            with request.urlopen(req, timeout=15) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
+            return self._request_suggestion(user_message)
+        finally:
+            # a non-retryable error gives no verdict on the backend
+            self._breaker.release()
+
+    def _request_suggestion(self, user_message: str) -> str:
+        url, payload, headers = self._build_request(user_message)
+        try:
+            status, body = self._transport.post(url, json.dumps(payload).encode("utf-8"), headers)
+        except TransportError as exc:
+            self._breaker.record_failure()
+            raise AIError(str(exc)) from exc
+        if status >= 400:
+            if status == 429 or status >= 500:
+                self._breaker.record_failure()
+            detail = body.decode("utf-8", errors="ignore")
+            raise AIError(f"HTTP {status}: {detail.strip()}")
+        self._breaker.record_success()
+        try:
+            data = json.loads(body.decode("utf-8"))
             content = self._extract_content(data)
-            if not content:
-                self._last_error = "La IA no devolvió contenido"
-                return None
-            return content.strip()
-        except error.HTTPError as http_err:
-            detail = http_err.read().decode("utf-8", errors="ignore") if http_err.fp else str(http_err)
-            self._last_error = f"HTTP {http_err.code}: {detail.strip()}"
-        except Exception as exc:  # pragma: no cover - red/timeout entran aquí
-            self._last_error = f"{exc.__class__.__name__}: {exc}"
-        return None
+        except (ValueError, AttributeError, IndexError, TypeError) as exc:
+            raise AIError(f"Respuesta IA inválida: {exc}") from exc
+        if not content:
+            raise AIError("La IA no devolvió contenido")
+        return content.strip()
 
     @property
     def last_error(self) -> Optional[str]:
         return self._last_error
 
-    def _build_request(self, user_message: str) -> Optional[Tuple[str, dict, dict]]:
+    def _build_request(self, user_message: str) -> Tuple[str, dict, dict]:
         prompt = f"Texto del usuario: {user_message}. Devuelve solo el comando a ejecutar."
         if self._provider == "openai":
             payload = {
@@ -105,8 +179,7 @@ class AIService:
             headers = {"Content-Type": "application/json"}
             return url, payload, headers
 
-        self._last_error = f"Proveedor IA no soportado: {self._provider}"
-        return None
+        raise AIError(f"Proveedor IA no soportado: {self._provider}")
 
     def _extract_content(self, data: dict) -> Optional[str]:
         if self._provider == "openai":
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..commands.base import CommandContext
+from .chatbot_shell import ChatbotShell, CommandPlan
+
+
+class AsyncRWLock:
+    """Phase-fair readers–writer lock for coroutines.
+
+    New readers queue behind waiting writers; when a writer releases, every
+    queued reader is admitted before the next writer. Waiters are woken
+    individually through futures, so releases cost O(woken) rather than
+    waking every waiter.
+    """
+
+    def __init__(self):
+        self._readers = 0
+        self._writer = False
+        self._waiting_readers: Deque[asyncio.Future] = deque()
+        self._waiting_writers: Deque[asyncio.Future] = deque()
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[None]:
+        if not self._writer and not self._waiting_writers:
+            self._readers += 1
+        else:
+            await self._wait(self._waiting_readers, self._release_read)
+        try:
+            yield
+        finally:
+            self._release_read()
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[None]:
+        if not self._writer and not self._readers and not self._waiting_writers:
+            self._writer = True
+        else:
+            await self._wait(self._waiting_writers, self._release_write)
+        try:
+            yield
+        finally:
+            self._release_write()
+
+    async def _wait(self, queue: Deque[asyncio.Future], release: Callable[[], None]) -> None:
+        future = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                release()  # granted just before the cancellation landed
+            raise
+
+    def _release_read(self) -> None:
+        self._readers -= 1
+        if not self._readers:
+            self._grant_writer() or self._grant_readers()
+
+    def _release_write(self) -> None:
+        self._writer = False
+        self._grant_readers() or self._grant_writer()
+
+    def _grant_writer(self) -> bool:
+        while self._waiting_writers:
+            future = self._waiting_writers.popleft()
+            if not future.done():
+                self._writer = True
+                future.set_result(None)
+                return True
+        return False
+
+    def _grant_readers(self) -> bool:
+        granted = False
+        while self._waiting_readers:
+            future = self._waiting_readers.popleft()
+            if not future.done():
+                self._readers += 1
+                future.set_result(None)
+                granted = True
+        return granted
+
+
+class AsyncChatbotEngine:
+    """Serves many chat sessions concurrently on top of one :class:`ChatbotShell`.
+
+    Each session keeps its own ``LogService`` history while all of them share
+    the shell's ``VirtualFileSystem`` under an :class:`AsyncRWLock`. Planning,
+    command execution and LLM calls run in a thread pool and backup writes in
+    a single writer thread, so a slow session never blocks the event loop.
+    Commands holding the read lock run in parallel threads, which is why the
+    filesystem materializes lazy folders, listings and indexes under locks.
+    """
+
+    def __init__(self, shell: ChatbotShell, max_workers: int = 8):
+        self._shell = shell
+        self._sessions: Dict[str, CommandContext] = {}
+        self._ids = itertools.count(1)
+        self._lock = AsyncRWLock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chat-exec")
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chat-backup")
+        self._backup_guard = threading.Lock()
+
+    def open_session(self, session_id: Optional[str] = None) -> str:
+        session_id = session_id or f"sesion-{next(self._ids)}"
+        if session_id in self._sessions:
+            raise ValueError(f"La sesión {session_id} ya existe")
+        self._sessions[session_id] = self._shell.new_context(self._shell.new_logger())
+        return session_id
+
+    def close_session(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    def history(self, session_id: str) -> List[str]:
+        return self._context(session_id).logger.history()
+
+    @property
+    def session_count(self) -> int:
+        return len(self._sessions)
+
+    async def process(self, session_id: str, raw_message: str) -> str:
+        context = self._context(session_id)
+        loop = asyncio.get_running_loop()
+        async with self._lock.read():
+            # planning may walk the tree (intent matching), so keep it off the loop
+            plan = await loop.run_in_executor(
+                self._executor, self._shell.plan, raw_message, context.logger
+            )
+        if plan.command is None:
+            plan = await loop.run_in_executor(
+                self._executor, self._shell.plan_with_ai, plan, context.logger
+            )
+        if plan.command is None:
+            return self._shell.fail(plan, context.logger)
+        guard = self._lock.write() if plan.command.mutates else self._lock.read()
+        async with guard:
+            result, queued = await loop.run_in_executor(
+                self._executor, self._execute, plan, context
+            )
+        if queued:
+            await loop.run_in_executor(self._writer, self._write_backups)
+        return result
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._writer, self._shell.close)
+        self._executor.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
+
+    def _context(self, session_id: str) -> CommandContext:
+        try:
+            return self._sessions[session_id]
+        except KeyError:
+            raise ValueError(f"Sesión desconocida: {session_id}") from None
+
+    def _execute(self, plan: CommandPlan, context: CommandContext) -> Tuple[str, bool]:
+        result, changes = self._shell.run_command(plan, context)
+        if changes is None or not context.should_backup(plan.command_name):
+            return result, False
+        # queueing must not interleave with the writer thread draining the queue
+        with self._backup_guard:
+            self._shell.queue_backup(plan.command_name, changes)
+        return result, True
+
+    def _write_backups(self) -> None:
+        with self._backup_guard:
+            self._shell.backup.process()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+if TYPE_CHECKING:
+    from .chatbot_shell import ChatbotShell
+
+EXIT_WORDS = frozenset({"salir", "exit"})
+
+
+@dataclass
+class BatchResult:
+    line_number: int
+    message: str
+    response: str
+    ok: bool
+
+
+@dataclass
+class BatchReport:
+    commands: int = 0
+    errors: int = 0
+    mutations: int = 0
+    backups: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def commands_per_second(self) -> float:
+        return self.commands / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def read_script(stream: TextIO) -> Iterator[tuple]:
+    """Yield ``(line_number, message)`` for each command line; stops at ``salir``."""
+    for line_number, line in enumerate(stream, start=1):
+        message = line.strip()
+        if not message or message.startswith("#"):
+            continue
+        if message.lower() in EXIT_WORDS:
+            return
+        yield line_number, message
+
+
+class BatchRunner:
+    """Streams script lines through a :class:`ChatbotShell` one at a time.
+
+    Backups are deferred: the changes of every successful command are
+    collected and handed to the backup service once per ``backup_every``
+    mutations (``0`` waits for the end of the batch), so a full-mode backup
+    writes one snapshot per chunk instead of one per command. With
+    ``dry_run`` the commands run against a throwaway copy of the tree, which
+    validates every path (including ones created earlier in the script)
+    without changing anything or writing backups; phrases are matched
+    against that copy too, and lines only the LLM could resolve are
+    reported as unresolved instead of calling it.
+    """
+
+    def __init__(self, shell: "ChatbotShell", dry_run: bool = False, backup_every: int = 0):
+        self._shell = shell
+        self._dry_run = dry_run
+        self._backup_every = max(0, backup_every)
+        self._context = shell.dry_run_context() if dry_run else shell.context
+        self._intents = shell.intent_matcher(self._context.filesystem) if dry_run else None
+        self._pending: List[Dict[str, Any]] = []
+        self._backup_due = False
+        self.report = BatchReport()
+
+    def run(self, lines: Iterable[tuple]) -> Iterator[BatchResult]:
+        """Execute ``(line_number, message)`` pairs lazily; :attr:`report` is final once exhausted."""
+        start = time.perf_counter()
+        try:
+            for line_number, message in lines:
+                yield self._execute(line_number, message)
+        finally:
+            self._flush_backups()
+            self.report.elapsed = time.perf_counter() - start
+
+    def _execute(self, line_number: int, message: str) -> BatchResult:
+        shell, context = self._shell, self._context
+        self.report.commands += 1
+        plan = shell.plan(message, context.logger, self._intents)
+        if plan.command is None and not plan.interpreted:
+            if self._dry_run:
+                plan = replace(plan, ai_error="no se consulta en modo simulación")
+            else:
+                plan = shell.plan_with_ai(plan, context.logger)
+        if plan.command is None:
+            return self._result(line_number, message, shell.fail(plan, context.logger), False)
+        response, changes = shell.run_command(plan, context)
+        if changes is None:
+            return self._result(line_number, message, response, False)
+        self.report.mutations += len(changes)
+        if self._dry_run:
+            return self._result(line_number, message, "Comando válido", True)
+        if context.should_backup(plan.command_name):
+            self._pending.extend(changes)
+            self._backup_due = True
+            if self._backup_every and len(self._pending) >= self._backup_every:
+                self._flush_backups()
+        return self._result(line_number, message, response, True)
+
+    def _result(self, line_number: int, message: str, response: str, ok: bool) -> BatchResult:
+        if not ok:
+            self.report.errors += 1
+        return BatchResult(line_number, message, response, ok)
+
+    def _flush_backups(self) -> None:
+        if not self._backup_due:
+            return
+        changes, self._pending = self._pending, []
+        self._backup_due = False
+        self._shell.queue_backup("batch", changes)
+        self._shell.backup.process()
+        self.report.backups += 1
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Dict, List
+
+from .virtual_fs import FileSystemNode
+
+MAGIC = b"VFSB"
+VERSION = 1
+# magic, version, flags, node count, string count, then the offset of each section
+_HEADER = struct.Struct("<4sHHII6Q")
+_ALIGN = 8
+
+
+def encode_tree(root: FileSystemNode) -> bytes:
+    """Serialize a tree into the columnar ``VFSB`` format.
+
+    Nodes are stored breadth first, so the children of a node occupy the
+    contiguous range ``first_child[i] .. first_child[i] + child_count[i]``.
+    Every column is a flat little-endian array and names live in a
+    deduplicated string table (offsets + UTF-8 blob), which lets a reader
+    address any node straight from an ``mmap`` without decoding the rest.
+    """
+    names: Dict[str, int] = {}
+    name_ids = array("I")
+    first_child = array("I")
+    child_count = array("I")
+    kinds = bytearray()
+    order = deque([root])
+    next_index = 1
+    while order:
+        node = order.popleft()
+        name_id = names.setdefault(node.name, len(names))
+        name_ids.append(name_id)
+        kinds.append(1 if node.is_directory() else 0)
+        children = node.children if node.is_directory() else []
+        first_child.append(next_index if children else 0)
+        child_count.append(len(children))
+        next_index += len(children)
+        order.extend(children)
+
+    encoded = [name.encode("utf-8") for name in names]
+    string_offsets = array("I", [0])
+    total = 0
+    for chunk in encoded:
+        total += len(chunk)
+        string_offsets.append(total)
+
+    sections = [_le(name_ids), _le(first_child), _le(child_count), bytes(kinds), _le(string_offsets), b"".join(encoded)]
+    offsets = []
+    position = _HEADER.size
+    body = bytearray()
+    for section in sections:
+        padding = (-position) % _ALIGN
+        body.extend(b"\0" * padding)
+        position += padding
+        offsets.append(position)
+        body.extend(section)
+        position += len(section)
+    header = _HEADER.pack(MAGIC, VERSION, 0, len(name_ids), len(names), *offsets)
+    return header + bytes(body)
+
+
+def write_snapshot(root: FileSystemNode, path: Path) -> int:
+    """Atomically write ``root`` to ``path``; returns the number of bytes written."""
+    data = encode_tree(root)
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+    return len(data)
+
+
+class BinarySnapshotLoader:
+    """Reads a ``VFSB`` snapshot through ``mmap``.
+
+    ``load_root(lazy=True)`` returns immediately; folders decode their
+    children from the mapping on first access, so ``dir`` on a restored
+    snapshot runs before the rest of the tree is decoded.
+    """
+
+    def __init__(self, source):
+        if isinstance(source, (bytes, bytearray)):
+            self._mapping = None
+            buffer = memoryview(bytes(source))
+        else:
+            with Path(source).open("rb") as fh:
+                if os.fstat(fh.fileno()).st_size == 0:
+                    raise ValueError("Snapshot binario inválido o de otra versión")
+                self._mapping = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            buffer = memoryview(self._mapping)
+        try:
+            magic, version, _flags, nodes, strings, *offsets = _HEADER.unpack_from(buffer, 0)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Snapshot binario inválido o de otra versión")
+        names_at, first_at, count_at, kind_at, str_offsets_at, blob_at = offsets
+        self._name_ids = _column(buffer, names_at, nodes)
+        self._first_child = _column(buffer, first_at, nodes)
+        self._child_count = _column(buffer, count_at, nodes)
+        self._kinds = buffer[kind_at:kind_at + nodes]
+        self._string_offsets = _column(buffer, str_offsets_at, strings + 1)
+        self._blob = buffer[blob_at:blob_at + self._string_offsets[strings]]
+        self._names: List[str] = [None] * strings  # type: ignore[list-item]
+        self.node_count = nodes
+
+    def load_root(self, lazy: bool = True) -> FileSystemNode:
+        root = self._node(0)
+        if lazy:
+            if self._child_count[0]:
+                root.defer_children(self, 0)
+            return root
+        pending = [(root, 0)]
+        while pending:
+            node, index = pending.pop()
+            first = self._first_child[index]
+            for child_index in range(first, first + self._child_count[index]):
+                child = self._node(child_index)
+                node.add_child(child)
+                if self._child_count[child_index]:
+                    pending.append((child, child_index))
+        return root
+
+    def load_children(self, index: int) -> List[FileSystemNode]:
+        children = []
+        first = self._first_child[index]
+        for child_index in range(first, first + self._child_count[index]):
+            child = self._node(child_index)
+            if self._child_count[child_index]:
+                child.defer_children(self, child_index)
+            children.append(child)
+        return children
+
+    def _node(self, index: int) -> FileSystemNode:
+        return FileSystemNode(self._name(self._name_ids[index]), "directory" if self._kinds[index] else "file")
+
+    def _name(self, name_id: int) -> str:
+        name = self._names[name_id]
+        if name is None:
+            start, end = self._string_offsets[name_id], self._string_offsets[name_id + 1]
+            name = self._names[name_id] = str(self._blob[start:end], "utf-8")
+        return name
+
+
+def _le(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _column(buffer: memoryview, offset: int, count: int):
+    view = buffer[offset:offset + 4 * count]
+    if sys.byteorder == "little":
+        return view.cast("I")
+    values = array("I", view.tobytes())
+    values.byteswap()
+    return values
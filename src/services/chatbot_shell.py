@@ -1,21 +1,45 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..commands.base import CommandContext, CommandRegistry
+from ..commands.base import Command, CommandContext, CommandRegistry
 from ..commands.clear_log_command import ClearLogCommand
 from ..commands.dir_command import DirCommand
+from ..commands.du_command import DuCommand
+from ..commands.find_command import FindCommand
 from ..commands.log_command import LogCommand
 from ..commands.mkdir_command import MkdirCommand
+from ..commands.mv_command import MvCommand
+from ..commands.redo_command import RedoCommand
 from ..commands.rmdir_command import RmdirCommand
+from ..commands.stats_command import StatsCommand
+from ..commands.undo_command import UndoCommand
+from .ai_cache import ResponseCache
 from .ai_service import AIService, AISettings
-from .backup_service import BackupService
+from .backup_service import BackupService, Snapshot, SnapshotProvider
 from .config_loader import ConfigLoader
 from .input_validator import InputValidator
+from .intent_matcher import IntentMatcher
 from .log_service import LogService
-from .virtual_fs import VirtualFileSystem
+from .log_sink import LogSink
+from .metrics import NULL_METRICS, Metrics
+from .seed_loader import load_filesystem
+from .undo_manager import UndoManager
+from .virtual_fs import DEFAULT_PATH_CACHE_SIZE, VirtualFileSystem
+
+
+@dataclass
+class CommandPlan:
+    """A message resolved (or not yet) to a registered command."""
+
+    raw_message: str
+    command_name: str = ""
+    args: List[str] = field(default_factory=list)
+    command: Optional[Command] = None
+    error: Optional[str] = None
+    interpreted: bool = False
+    ai_error: Optional[str] = None  # why the LLM fallback failed, for this message only
 
 
 class ChatbotShell:
@@ -24,87 +48,229 @@ class ChatbotShell:
     def __init__(self, config_path: str):
         self._config = ConfigLoader(config_path)
         self._validator = InputValidator()
+        self._metrics = self._build_metrics()
         self._filesystem = self._load_filesystem()
-        self._logger = LogService(max_entries=self._config.get("max_log_entries", 50))
+        self._logger = self.new_logger(sink=self._build_log_sink())
         backup_dir = self._config.resolve_path(self._config.get("backup_dir"))
-        self._backup = BackupService(str(backup_dir))
+        self._backup = BackupService(
+            str(backup_dir),
+            mode=self._config.get("backup_mode", "full"),
+            base_every=self._config.get("journal_base_every", 100),
+            background=self._config.get("backup_background", False),
+            max_pending=self._config.get("backup_max_pending", 64),
+            overflow=self._config.get("backup_overflow", "block"),
+            snapshot_format=self._config.get("backup_format", "json"),
+            metrics=self._metrics,
+        )
         self._ai = self._build_ai_service()
+        self._intents = self.intent_matcher(self._filesystem)
         self._registry = CommandRegistry()
-        self._context = CommandContext(
-            filesystem=self._filesystem,
-            logger=self._logger,
-            backup=self._backup,
-            settings=self._config.data,
-        )
+        self._context = self.new_context(self._logger)
         self._register_commands()
+        self._register_gauges()
         self._prime_defaults()
 
     def _load_filesystem(self) -> VirtualFileSystem:
         seed_path = self._config.resolve_path(self._config.get("filesystem_seed"))
-        with Path(seed_path).open("r", encoding="utf-8") as fh:
-            seed = json.load(fh)
-        return VirtualFileSystem.from_seed(seed)
+        filesystem = load_filesystem(seed_path, mode=self._config.get("seed_loading", "eager"))
+        filesystem.resize_path_cache(self._config.get("path_cache_size", DEFAULT_PATH_CACHE_SIZE))
+        undo_depth = self._config.get("undo_depth", 50)
+        if undo_depth:
+            filesystem.undo_log = UndoManager(filesystem, max_depth=undo_depth)
+        return filesystem
 
     def _register_commands(self) -> None:
         self._registry.register(DirCommand())
         self._registry.register(MkdirCommand())
         self._registry.register(RmdirCommand())
+        self._registry.register(MvCommand())
+        self._registry.register(FindCommand())
+        self._registry.register(DuCommand())
+        self._registry.register(UndoCommand())
+        self._registry.register(RedoCommand())
         self._registry.register(ClearLogCommand())
         self._registry.register(LogCommand())
+        self._registry.register(StatsCommand())
 
     def _prime_defaults(self) -> None:
         for command in self._config.get("default_commands", []):
             self.process_message(command)
 
     def process_message(self, raw_message: str) -> str:
-        ai_result: Optional[Tuple[str, List[str]]] = None
+        return self.handle(raw_message, self._context)
+
+    def handle(self, raw_message: str, context: CommandContext) -> str:
+        """Run one message against ``context``; the synchronous pipeline."""
+        plan = self.plan(raw_message, context.logger)
+        if plan.command is None:
+            plan = self.plan_with_ai(plan, context.logger)
+        if plan.command is None:
+            return self.fail(plan, context.logger)
+        result, queued = self.execute(plan, context)
+        if queued:
+            self._backup.process()
+        return result
+
+    def plan(
+        self, raw_message: str, logger: LogService, intents: Optional[IntentMatcher] = None
+    ) -> CommandPlan:
+        """Resolve a message without touching the network.
+
+        Returns a plan without ``command`` (and with ``error`` set) when only
+        the LLM fallback could still make sense of the message. ``intents``
+        replaces the shell's matcher, e.g. one over a dry-run copy of the tree.
+        """
+        self._metrics.incr("messages")
         try:
-            sanitized = self._validator.sanitize(raw_message)
-            command_name, args = self._validator.extract_command(sanitized)
+            with self._metrics.time("parse"):
+                command_name, args = self._validator.parse(raw_message)
         except ValueError as parse_error:
-            ai_result = self._ai_interpret(raw_message)
-            if not ai_result:
-                extra = self._ai.last_error
-                message = str(parse_error)
-                if extra:
-                    message = f"{message}. Detalle IA: {extra}"
-                self._logger.add_entry("error", message)
-                return f"Error: {message}"
-            command_name, args = ai_result
+            return self._plan_locally(raw_message, str(parse_error), logger, intents)
+        with self._metrics.time("lookup"):
+            command = self._registry.resolve(command_name)
+        if command is None:
+            return self._plan_locally(
+                raw_message, f"Comando desconocido: {command_name}", logger, intents
+            )
+        return CommandPlan(raw_message, command.name, args, command)
 
-        try:
-            command = self._registry.get(command_name)
-        except KeyError as lookup_error:
-            if not ai_result:
-                ai_result = self._ai_interpret(raw_message)
-            if not ai_result:
-                extra = self._ai.last_error
-                message = str(lookup_error)
-                if extra:
-                    message = f"{message}. Detalle IA: {extra}"
-                self._logger.add_entry("error", message)
-                return f"Error: {message}"
-            command_name, args = ai_result
-            try:
-                command = self._registry.get(command_name)
-            except KeyError as final_error:
-                extra = self._ai.last_error
-                message = str(final_error)
-                if extra:
-                    message = f"{message}. Detalle IA: {extra}"
-                self._logger.add_entry("error", message)
-                return f"Error: {message}"
+    def plan_with_ai(self, plan: CommandPlan, logger: LogService) -> CommandPlan:
+        """Blocking LLM fallback for a plan that :meth:`plan` could not resolve."""
+        if plan.command is not None or plan.interpreted:
+            return plan
+        ai_result, ai_error = self._ai_interpret(plan.raw_message, logger)
+        if not ai_result:
+            return replace(plan, ai_error=ai_error)
+        return self._lookup(plan.raw_message, *ai_result)
+
+    def fail(self, plan: CommandPlan, logger: LogService) -> str:
+        self._metrics.incr("unresolved")
+        message = plan.error or "Debe ingresar un comando"
+        if plan.ai_error:
+            message = f"{message}. Detalle IA: {plan.ai_error}"
+        logger.add_entry("error", message)
+        return f"Error: {message}"
 
+    def execute(self, plan: CommandPlan, context: CommandContext) -> Tuple[str, bool]:
+        """Run a resolved plan; returns the response and whether a backup was queued."""
+        result, changes = self.run_command(plan, context)
+        if changes is None or not context.should_backup(plan.command_name):
+            return result, False
+        self.queue_backup(plan.command_name, changes)
+        return result, True
+
+    def run_command(
+        self, plan: CommandPlan, context: CommandContext
+    ) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+        """Execute the command; ``changes`` is ``None`` when it failed."""
+        assert plan.command is not None
+        self._metrics.incr(f"commands_{plan.command_name}")
         try:
-            result = command.execute(args, self._context)
+            with self._metrics.time("execute"):
+                result = plan.command.execute(plan.args, context)
         except ValueError as command_error:
+            self._metrics.incr("command_errors")
+            context.take_changes()
             message = str(command_error)
-            self._logger.add_entry("error", message)
-            return f"Error: {message}"
-        if self._context.should_backup(command_name):
-            self._backup.queue_snapshot(command_name, self._filesystem.snapshot())
-            self._backup.process()
-        return result
+            context.logger.add_entry("error", message)
+            return f"Error: {message}", None
+        return result, context.take_changes()
+
+    def queue_backup(self, command_name: str, changes: List[Dict[str, Any]]) -> None:
+        if self._backup.snapshot_format == "binary":
+            provider = self._filesystem.snapshot_binary
+        else:
+            provider = self._filesystem.snapshot
+        if self._metrics.enabled:
+            provider = self._timed_snapshot(provider)
+        self._backup.record(command_name, changes, provider)
+
+    def _timed_snapshot(self, provider: SnapshotProvider) -> SnapshotProvider:
+        def timed() -> Snapshot:
+            with self._metrics.time("snapshot"):
+                return provider()
+
+        return timed
+
+    def new_context(self, logger: LogService) -> CommandContext:
+        """Context sharing this shell's filesystem and backups with its own history."""
+        return CommandContext(
+            filesystem=self._filesystem,
+            logger=logger,
+            backup=self._backup,
+            settings=self._config.data,
+            metrics=self._metrics,
+        )
+
+    def dry_run_context(self) -> CommandContext:
+        """Context over a throwaway copy of the tree with its own history.
+
+        The copy is decoded lazily from a binary snapshot, so only the folders
+        a script actually touches are materialized.
+        """
+        return CommandContext(
+            filesystem=VirtualFileSystem.load_binary(self._filesystem.snapshot_binary()),
+            logger=self.new_logger(),
+            backup=self._backup,
+            settings=self._config.data,
+        )
+
+    def new_logger(self, sink: Optional[LogSink] = None) -> LogService:
+        return LogService(
+            max_entries=self._config.get("max_log_entries", 50),
+            max_payload_chars=self._config.get("log_max_payload_chars"),
+            sink=sink,
+        )
+
+    def _build_log_sink(self) -> Optional[LogSink]:
+        log_file = self._config.get("log_file")
+        sink_config = self._config.get("log_sink", {}) or {}
+        if not log_file or not sink_config.get("enabled", True):
+            return None
+        return LogSink(
+            self._config.resolve_path(log_file),
+            batch_size=sink_config.get("batch_size", 32),
+            fsync_interval=sink_config.get("fsync_interval", 5.0),
+            max_bytes=sink_config.get("max_bytes", 1024 * 1024),
+            backup_count=sink_config.get("backup_count", 5),
+            compress=sink_config.get("compress", True),
+        )
+
+    def _plan_locally(
+        self, raw_message: str, error: str, logger: LogService, intents: Optional[IntentMatcher]
+    ) -> CommandPlan:
+        local = self._local_interpret(raw_message, logger, intents or self._intents)
+        if not local:
+            return CommandPlan(raw_message, error=error)
+        return self._lookup(raw_message, *local)
+
+    def _lookup(self, raw_message: str, command_name: str, args: List[str]) -> CommandPlan:
+        command = self._registry.resolve(command_name)
+        if command is None:
+            error = f"Comando desconocido: {command_name}"
+            return CommandPlan(raw_message, command_name, args, error=error, interpreted=True)
+        return CommandPlan(raw_message, command.name, args, command, interpreted=True)
+
+    def close(self) -> None:
+        """Flush pending backups and log entries; call once the session ends."""
+        self._backup.close()
+        self._logger.close()
+        dump_file = (self._config.get("metrics", {}) or {}).get("dump_file")
+        if dump_file:
+            self._metrics.dump(self._config.resolve_path(dump_file))
+
+    @property
+    def backup(self) -> BackupService:
+        return self._backup
+
+    @property
+    def metrics(self) -> Metrics:
+        return self._metrics
+
+    @property
+    def context(self) -> CommandContext:
+        """The context used by :meth:`process_message`."""
+        return self._context
 
     def available_commands(self) -> List[str]:
         return self._registry.available()
@@ -113,6 +279,21 @@ class ChatbotShell:
     def history(self) -> List[str]:
         return self._logger.history()
 
+    def _build_metrics(self) -> Metrics:
+        metrics_config = self._config.get("metrics", {}) or {}
+        return Metrics() if metrics_config.get("enabled", False) else NULL_METRICS
+
+    def _register_gauges(self) -> None:
+        """Expose counters the services already keep; they are only read by ``stats``."""
+        metrics = self._metrics
+        metrics.gauge("log_evictions", lambda: self._logger.evictions)
+        for key in ("pending", "coalesced", "dropped"):
+            metrics.gauge(f"backup_{key}", lambda key=key: self._backup.stats()[key])
+        for key in ("hit_rate", "evictions", "size"):
+            metrics.gauge(f"path_cache_{key}", lambda key=key: self._filesystem.path_cache_stats()[key])
+        for key in ("hits", "misses", "coalesced", "evictions", "size"):
+            metrics.gauge(f"ai_cache_{key}", lambda key=key: self._ai.cache_stats().get(key, 0))
+
     def _build_ai_service(self) -> AIService:
         ai_config = self._config.get("ai", {}) or {}
         settings = AISettings(
@@ -125,23 +306,72 @@ class ChatbotShell:
                 "Eres un asistente que traduce frases a comandos dir/rmdir/log/clear",
             ),
             provider=ai_config.get("provider", "openai"),
+            **self._transport_settings(ai_config.get("transport") or {}),
         )
-        return AIService(settings)
+        return AIService(settings, cache=self._build_ai_cache(ai_config.get("cache") or {}))
 
-    def _ai_interpret(self, raw_message: str) -> Optional[Tuple[str, List[str]]]:
-        if not self._ai.is_ready():
+    @staticmethod
+    def _transport_settings(transport_config: dict) -> dict:
+        keys = ("connect_timeout", "read_timeout", "max_retries", "breaker_threshold", "breaker_reset_seconds")
+        return {key: transport_config[key] for key in keys if key in transport_config}
+
+    def _build_ai_cache(self, cache_config: dict) -> Optional[ResponseCache]:
+        if not cache_config.get("enabled", False):
             return None
-        suggestion = self._ai.suggest_command(raw_message)
-        if not suggestion:
-            if self._ai.last_error:
-                self._logger.add_entry("ai-error", self._ai.last_error)
+        persist = cache_config.get("persist_path")
+        return ResponseCache(
+            max_entries=cache_config.get("max_entries", 256),
+            ttl_seconds=cache_config.get("ttl_seconds", 3600),
+            persist_path=self._config.resolve_path(persist) if persist else None,
+        )
+
+    def intent_matcher(self, filesystem: VirtualFileSystem) -> Optional[IntentMatcher]:
+        """A matcher over ``filesystem`` with the configured synonyms, or ``None`` if disabled."""
+        intent_config = self._config.get("intents", {}) or {}
+        if not intent_config.get("enabled", True):
             return None
+        return IntentMatcher(
+            filesystem,
+            intents=intent_config.get("synonyms"),
+            stopwords=intent_config.get("stopwords"),
+            cutoff=intent_config.get("fuzzy_cutoff", 0.8),
+        )
+
+    def _local_interpret(
+        self, raw_message: str, logger: LogService, intents: Optional[IntentMatcher]
+    ) -> Optional[Tuple[str, List[str]]]:
+        if intents is None:
+            return None
+        with self._metrics.time("intent"):
+            local = intents.match(raw_message)
+        if local:
+            command_name, args = local
+            suggestion = " ".join([command_name, *args])
+            logger.add_entry(
+                "intent", f"Entrada '{raw_message}' interpretada localmente como '{suggestion}'"
+            )
+        return local
+
+    def _ai_interpret(
+        self, raw_message: str, logger: LogService
+    ) -> Tuple[Optional[Tuple[str, List[str]]], Optional[str]]:
+        """The LLM's ``(command, args)`` for ``raw_message``, or ``None`` with the reason."""
+        if not self._ai.is_ready():
+            return None, None
+        self._metrics.incr("ai_calls")
+        with self._metrics.time("ai"):
+            result = self._ai.suggest(raw_message)
+        suggestion = result.command
+        if not suggestion:
+            self._metrics.incr("ai_failures")
+            if result.error:
+                logger.add_entry("ai-error", result.error)
+            return None, result.error
         try:
-            sanitized = self._validator.sanitize(suggestion)
-            command_name, args = self._validator.extract_command(sanitized)
+            command_name, args = self._validator.parse(suggestion)
         except ValueError:
-            return None
-        self._logger.add_entry(
+            return None, None
+        logger.add_entry(
             "ai", f"Entrada '{raw_message}' interpretada como '{suggestion}'"
         )
-        return command_name, args
+        return (command_name, args), None
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import http.client
+import random
+import socket
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Mapping, Optional, Protocol, Tuple
+from urllib.parse import urlsplit
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+PoolKey = Tuple[str, str, int]
+
+
+class TransportError(Exception):
+    """Raised when a request cannot be completed at the network level."""
+
+
+class Transport(Protocol):
+    def post(self, url: str, body: bytes, headers: Mapping[str, str]) -> Tuple[int, bytes]:
+        ...
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures.
+
+    While open, :meth:`allow` is false until ``reset_timeout`` seconds pass;
+    then a single trial request is let through (half-open) and every other
+    caller is refused until that trial reports success or failure, or gives
+    the trial back with :meth:`release`.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_owner: Optional[int] = None  # thread holding the half-open trial
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def allow(self) -> bool:
+        """Whether a request may go out; in half-open state this claims the trial."""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "open" or self._trial_owner is not None:
+                return False
+            self._trial_owner = threading.get_ident()
+            return True
+
+    def would_allow(self) -> bool:
+        """Like :meth:`allow` without claiming the half-open trial."""
+        with self._lock:
+            state = self._state()
+            return state == "closed" or (state == "half-open" and self._trial_owner is None)
+
+    def release(self) -> None:
+        """Give back a trial claimed by this thread whose request ended without a verdict."""
+        with self._lock:
+            if self._trial_owner == threading.get_ident():
+                self._trial_owner = None
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_owner = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self._threshold:
+                self._opened_at = self._clock()
+            self._trial_owner = None
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self._reset_timeout:
+            return "half-open"
+        return "open"
+
+
+class PooledHttpTransport:
+    """HTTP/1.1 keep-alive transport with one small connection pool per host.
+
+    Connect and read timeouts are separate. Responses with a status in
+    ``RETRY_STATUSES`` and network errors are retried up to ``max_retries``
+    times with full-jitter exponential backoff (``Retry-After`` wins when the
+    server sends it).
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 15.0,
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        pool_size: int = 4,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+    ):
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._max_retries = max(0, max_retries)
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._pool_size = max(1, pool_size)
+        self._sleep = sleep
+        self._rng = rng
+        self._pools: Dict[PoolKey, Deque[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def post(self, url: str, body: bytes, headers: Mapping[str, str]) -> Tuple[int, bytes]:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise TransportError(f"URL no soportada: {url}")
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        attempt = 0
+        while True:
+            retry_after: Optional[float] = None
+            try:
+                status, payload, retry_after = self._send(key, target, body, headers)
+            except (OSError, http.client.HTTPException) as exc:
+                if attempt >= self._max_retries:
+                    raise TransportError(f"{exc.__class__.__name__}: {exc}") from exc
+            else:
+                if status not in RETRY_STATUSES or attempt >= self._max_retries:
+                    return status, payload
+            self._sleep(self._backoff(attempt, retry_after))
+            attempt += 1
+
+    def close(self) -> None:
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            for conn in pool:
+                conn.close()
+
+    def _send(
+        self, key: PoolKey, target: str, body: bytes, headers: Mapping[str, str]
+    ) -> Tuple[int, bytes, Optional[float]]:
+        conn, reused = self._acquire(key)
+        try:
+            try:
+                response = self._roundtrip(conn, target, body, headers)
+            except _STALE_ERRORS:
+                if not reused:
+                    raise
+                # the server closed an idle keep-alive connection; retry once on a fresh one
+                conn.close()
+                conn, reused = self._connect(key), False
+                response = self._roundtrip(conn, target, body, headers)
+            payload = response.read()
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return response.status, payload, _retry_after(response.getheader("Retry-After"))
+
+    def _roundtrip(
+        self, conn: http.client.HTTPConnection, target: str, body: bytes, headers: Mapping[str, str]
+    ) -> http.client.HTTPResponse:
+        if conn.sock is None:
+            conn.connect()
+            conn.sock.settimeout(self._read_timeout)
+        conn.request("POST", target, body=body, headers=dict(headers))
+        return conn.getresponse()
+
+    def _acquire(self, key: PoolKey) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool:
+                return pool.pop(), True
+        return self._connect(key), False
+
+    def _connect(self, key: PoolKey) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = factory(host, port, timeout=self._connect_timeout)
+        conn.connect()
+        conn.sock.settimeout(self._read_timeout)
+        if conn.sock.family in (socket.AF_INET, socket.AF_INET6):
+            conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connections_opened += 1
+        return conn
+
+    def _release(self, key: PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            pool = self._pools.setdefault(key, deque())
+            if len(pool) < self._pool_size:
+                pool.append(conn)
+                return
+        conn.close()
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return min(retry_after, self._backoff_max)
+        ceiling = min(self._backoff_max, self._backoff_base * (2 ** attempt))
+        return ceiling * self._rng()
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
@@ -3,21 +3,76 @@ from __future__ import annotations
 import re
 from typing import List, Tuple
 
+# One argument: unquoted runs and quoted runs, possibly mixed
+# (``/Documentos/"Mis fotos"``). Nothing follows the repetition, so the
+# greedy match never backtracks.
+_TOKEN_PATTERN = re.compile(r"""(?:[^\s"']+|"[^"]*"|'[^']*')+""")
+_QUOTED_PATTERN = re.compile(r""""([^"]*)"|'([^']*)'""")
+
+
+def _unquote(match: "re.Match[str]") -> str:
+    return match.group(1) if match.group(1) is not None else match.group(2)
+
+
+def quote(token: str) -> str:
+    """Quote ``token`` if it would not survive :meth:`InputValidator.tokenize` as one word."""
+    if token and not any(char.isspace() or char in "\"'" for char in token):
+        return token
+    return '"' + token + '"' if '"' not in token else "'" + token + "'"
+
 
 class InputValidator:
-    """Normalizes raw user input and extracts command tokens."""
+    """Normalizes raw user input and extracts command tokens.
 
-    _prompt_pattern = re.compile(r"^[^:]+:(.*)")
+    Only the command word is lowercased; arguments keep their case. Double or
+    single quotes group words with spaces (``mkdir "/Documentos/Mis fotos"``).
+    """
 
     def sanitize(self, raw: str) -> str:
+        """Strip surrounding whitespace and a leading ``prompt:`` prefix."""
         text = raw.strip()
-        match = self._prompt_pattern.match(text)
-        if match:
-            text = match.group(1).strip()
-        return text.lower()
+        colon = text.find(":")
+        if colon > 0:
+            text = text[colon + 1:].strip()
+        return text
+
+    def tokenize(self, text: str) -> List[str]:
+        """Split ``text`` on whitespace in one scan, honouring quotes."""
+        if '"' not in text and "'" not in text:
+            return text.split()
+        tokens: List[str] = []
+        position = 0
+        for match in _TOKEN_PATTERN.finditer(text):
+            if text[position:match.start()].strip():
+                raise ValueError("Comillas sin cerrar")
+            token = match.group()
+            first = token[0]
+            if first in "\"'" and token.find(first, 1) == len(token) - 1:
+                token = token[1:-1]
+            elif '"' in token or "'" in token:
+                token = _QUOTED_PATTERN.sub(_unquote, token)
+            tokens.append(token)
+            position = match.end()
+        if text[position:].strip():
+            raise ValueError("Comillas sin cerrar")
+        return tokens
 
     def extract_command(self, sanitized: str) -> Tuple[str, List[str]]:
-        if not sanitized:
+        tokens = self.tokenize(sanitized)
+        if not tokens:
+            raise ValueError("Debe ingresar un comando")
+        return tokens[0].lower(), tokens[1:]
+
+    def parse(self, raw: str) -> Tuple[str, List[str]]:
+        """``sanitize`` and ``extract_command`` in one call, inlined for the common case."""
+        text = raw.strip()
+        colon = text.find(":")
+        if colon > 0:
+            text = text[colon + 1:]
+        if '"' in text or "'" in text:
+            tokens = self.tokenize(text)
+        else:
+            tokens = text.split()
+        if not tokens:
             raise ValueError("Debe ingresar un comando")
-        tokens = sanitized.split()
-        return tokens[0], tokens[1:]
+        return tokens[0].lower(), tokens[1:]
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import re
+from difflib import SequenceMatcher, get_close_matches
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .name_index import fold
+from .virtual_fs import VirtualFileSystem
+
+# Checked in order: more specific intents ("borra el historial") come first.
+DEFAULT_INTENTS: Dict[str, List[str]] = {
+    "clear": [
+        "limpia el historial", "limpiar el historial", "borra el historial",
+        "borrar el historial", "vacia el historial", "limpia historial", "borra historial",
+        "vacia historial", "limpia el log", "borra el log",
+    ],
+    "log": ["historial", "registro", "bitacora", "ultimos comandos", "ultimas acciones"],
+    "mkdir": ["crea", "crear", "creame", "haz", "hazme", "agrega", "agregar", "anade", "nueva carpeta"],
+    "rmdir": ["borra", "borrar", "borrame", "elimina", "eliminar", "eliminame", "quita", "quitar", "suprime"],
+    "find": ["busca", "buscar", "buscame", "encuentra", "encontrar", "localiza", "donde esta", "donde quedo"],
+    "dir": [
+        "muestra", "muestrame", "mostrar", "mira", "ver", "lista", "listar", "listame",
+        "ensename", "abre", "abrir", "que hay", "contenido", "explora",
+    ],
+}
+
+DEFAULT_STOPWORDS = {
+    "a", "al", "de", "del", "el", "la", "las", "los", "lo", "que", "hay", "en", "dentro",
+    "mi", "mis", "por", "favor", "carpeta", "carpetas", "directorio", "folder", "una",
+    "un", "llamada", "llamado", "se", "llama", "me", "todo", "contenido", "ruta", "y",
+    "quiero", "puedes", "podrias", "porfa", "ahora", "esta", "este", "con", "nombre",
+}
+
+_TOKEN_PATTERN = re.compile(r"/[^\s]+|[\w.\-]+")
+_NUMBER_PATTERN = re.compile(r"\b(\d{1,4})\b")
+_PARENT_PATTERN = re.compile(r"\b(?:en|dentro de)\s+(?:la\s+carpeta\s+|el\s+directorio\s+)?(/[^\s]+|[\w.\-]+)\s*$")
+
+
+class IntentMatcher:
+    """Resolves natural-language requests to commands without calling the LLM.
+
+    Intents come from a synonym table compiled into one regex per intent;
+    folder names are looked up in the filesystem's incremental
+    :class:`NameIndex`, fuzzily except for ``rmdir``, which only acts on an
+    exact name. ``match`` returns ``None`` when the phrase is not resolved
+    with enough confidence, leaving it to the LLM.
+    """
+
+    def __init__(
+        self,
+        filesystem: VirtualFileSystem,
+        intents: Optional[Dict[str, Sequence[str]]] = None,
+        stopwords: Optional[Sequence[str]] = None,
+        cutoff: float = 0.8,
+    ):
+        self._filesystem = filesystem
+        self._cutoff = cutoff
+        table = {name: list(words) for name, words in DEFAULT_INTENTS.items()}
+        for name, words in (intents or {}).items():
+            table.setdefault(name, []).extend(words)
+        self._patterns: List[Tuple[str, "re.Pattern[str]", List[str]]] = []
+        for name, words in table.items():
+            folded = sorted({fold(word) for word in words}, key=len, reverse=True)
+            pattern = re.compile(r"\b(?:" + "|".join(re.escape(word) for word in folded) + r")\b")
+            self._patterns.append((name, pattern, folded))
+        self._stopwords = {fold(word) for word in stopwords or DEFAULT_STOPWORDS}
+
+    def match(self, raw_message: str) -> Optional[Tuple[str, List[str]]]:
+        text = fold(raw_message).strip()
+        if not text:
+            return None
+        for intent, pattern, words in self._patterns:
+            found = pattern.search(text)
+            if not found:
+                continue
+            remainder = (text[: found.start()] + " " + text[found.end():]).strip()
+            resolver = getattr(self, f"_resolve_{intent}", None)
+            if resolver is None:
+                return intent, []
+            return resolver(remainder, raw_message)
+        return None
+
+    def _resolve_clear(self, remainder: str, raw: str) -> Optional[Tuple[str, List[str]]]:
+        return "clear", []
+
+    def _resolve_log(self, remainder: str, raw: str) -> Optional[Tuple[str, List[str]]]:
+        number = _NUMBER_PATTERN.search(remainder)
+        return "log", [number.group(1)] if number else []
+
+    def _resolve_dir(self, remainder: str, raw: str) -> Optional[Tuple[str, List[str]]]:
+        words = self._content_words(remainder)
+        if not words:
+            return "dir", [f"/{self._filesystem.root_name}"]
+        path = self._find_directory(words)
+        return ("dir", [path]) if path else None
+
+    def _resolve_find(self, remainder: str, raw: str) -> Optional[Tuple[str, List[str]]]:
+        words = self._content_words(remainder)
+        if len(words) != 1:
+            return None
+        return "find", [self._original_case(raw, words[0])]
+
+    def _resolve_rmdir(self, remainder: str, raw: str) -> Optional[Tuple[str, List[str]]]:
+        words = self._content_words(remainder)
+        if not words:
+            return None
+        # destructive: a typo must not pick a neighbouring folder
+        path = self._find_directory(words, fuzzy=False)
+        if not path or path == f"/{self._filesystem.root_name}":
+            return None
+        return "rmdir", [path]
+
+    def _resolve_mkdir(self, remainder: str, raw: str) -> Optional[Tuple[str, List[str]]]:
+        parent_path = f"/{self._filesystem.root_name}"
+        parent_match = _PARENT_PATTERN.search(remainder)
+        if parent_match:
+            parent_path = self._find_directory([parent_match.group(1)])
+            if not parent_path:
+                return None
+            remainder = remainder[: parent_match.start()]
+        words = self._content_words(remainder)
+        if len(words) != 1 or "/" in words[0]:
+            return None
+        name = self._original_case(raw, words[0])
+        return "mkdir", [f"{parent_path}/{name}"]
+
+    def _content_words(self, remainder: str) -> List[str]:
+        return [
+            token
+            for token in _TOKEN_PATTERN.findall(remainder)
+            if token not in self._stopwords and not token.isdigit()
+        ]
+
+    def _find_directory(self, words: List[str], fuzzy: bool = True) -> Optional[str]:
+        if len(words) == 1 and words[0].startswith("/"):
+            return self._existing_path(words[0])
+        candidate = fold(" ".join(words))
+        root_name = self._filesystem.root_name
+        if candidate == fold(root_name):
+            return f"/{root_name}"
+        try:
+            top_level = self._filesystem._resolve(f"/{root_name}/{candidate}")
+        except ValueError:
+            top_level = None
+        if top_level is not None and top_level.is_directory():
+            # the shallowest match wins, so a first-level folder is answered
+            # without building the index (which loads every lazy folder)
+            return top_level.path
+        paths = self._filesystem.folders_named(candidate)
+        if not paths:
+            if not fuzzy:
+                return None
+            shortlist = self._filesystem.name_index().similar_folded(candidate)
+            close: List[Tuple[str, List[str]]] = []
+            for name in get_close_matches(candidate, shortlist, n=5, cutoff=self._cutoff):
+                found = self._filesystem.folders_named(name)
+                if found:  # file names are indexed too
+                    close.append((name, found))
+                    if len(close) == 2:
+                        break
+            if not close:
+                return None
+            if len(close) > 1 and _ratio(candidate, close[0][0]) == _ratio(candidate, close[1][0]):
+                return None
+            paths = close[0][1]
+        if len(paths) > 1:
+            depths = sorted(path.count("/") for path in paths)
+            if depths[0] == depths[1]:
+                return None  # ambiguous: same name at the same depth
+            paths = sorted(paths, key=lambda path: path.count("/"))
+        return paths[0]
+
+    def _existing_path(self, path: str) -> Optional[str]:
+        try:
+            node = self._filesystem._resolve(path)
+        except ValueError:
+            return None
+        return path if node.is_directory() else None
+
+    @staticmethod
+    def _original_case(raw: str, folded_word: str) -> str:
+        for token in _TOKEN_PATTERN.findall(raw):
+            if fold(token) == folded_word:
+                return token
+        return folded_word
+
+
+def _ratio(left: str, right: str) -> float:
+    return SequenceMatcher(None, left, right).ratio()
@@ -1,43 +1,136 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional
 
-from ..datastructures.linked_stack import LinkedStack
+from ..datastructures.ring_buffer import RingBuffer
+
+if TYPE_CHECKING:
+    from .log_sink import LogSink
+
+_WALL_ANCHOR = time.time()
+_MONOTONIC_ANCHOR = time.monotonic()
+
+
+class LogRecord:
+    """Compact history entry; text is only built when the entry is rendered.
+
+    ``payload`` is kept by reference (any object with a useful ``str``), so
+    logging a large listing does not copy it.
+    """
+
+    __slots__ = ("created", "label", "payload")
+
+    def __init__(self, label: str, payload: Any, created: Optional[float] = None):
+        self.created = time.monotonic() if created is None else created
+        self.label = label
+        self.payload = payload
+
+    @classmethod
+    def from_wall_time(cls, label: str, payload: Any, wall_time: float) -> "LogRecord":
+        return cls(label, payload, created=_MONOTONIC_ANCHOR + (wall_time - _WALL_ANCHOR))
+
+    @property
+    def wall_time(self) -> float:
+        return _WALL_ANCHOR + (self.created - _MONOTONIC_ANCHOR)
+
+    def render(self, max_payload_chars: Optional[int] = None) -> str:
+        timestamp = datetime.fromtimestamp(self.wall_time).strftime("%Y-%m-%d %H:%M:%S")
+        payload = str(self.payload)
+        if max_payload_chars is not None and len(payload) > max_payload_chars:
+            hidden = len(payload) - max_payload_chars
+            payload = f"{payload[:max_payload_chars]}… (+{hidden} caracteres)"
+        return f"[{timestamp}] {self.label}: {payload}"
+
+    def __str__(self) -> str:
+        return self.render()
 
 
 class LogService:
-    """Stores interaction history using a stack."""
+    """Stores the most recent interactions in a fixed-size ring buffer.
+
+    With ``max_payload_chars`` long string payloads are truncated when they
+    are stored, so a huge listing does not stay alive in the history. An
+    optional :class:`LogSink` receives every entry for persistent storage;
+    the service must be its only writer, since paging reads the newest sink
+    entries back as the part of this session's history that left memory.
+    """
 
-    def __init__(self, max_entries: int = 50):
-        self._stack: LinkedStack[str] = LinkedStack()
+    def __init__(
+        self,
+        max_entries: int = 50,
+        max_payload_chars: Optional[int] = None,
+        sink: Optional["LogSink"] = None,
+    ):
+        self._entries: RingBuffer[LogRecord] = RingBuffer(max(1, max_entries))
         self._max_entries = max_entries
+        self._max_payload_chars = max_payload_chars
+        self._sink = sink
+        self._session_entries = 0  # added since start or the last clear
+
+    def add_entry(self, label: str, payload: Any) -> LogRecord:
+        limit = self._max_payload_chars
+        if limit is not None and isinstance(payload, str) and len(payload) > limit:
+            payload = f"{payload[:limit]}… (+{len(payload) - limit} caracteres)"
+        record = LogRecord(label, payload)
+        self._entries.append(record)
+        self._session_entries += 1
+        if self._sink is not None:
+            self._sink.write(record)
+        return record
 
-    def add_entry(self, label: str, payload: str) -> str:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        message = f"[{timestamp}] {label}: {payload}"
-        self._stack.push(message)
-        self._enforce_limit()
-        return message
-
-    def _enforce_limit(self) -> None:
-        if len(self._stack) <= self._max_entries:
-            return
-        buffer = list(self._stack)
-        buffer = buffer[: self._max_entries]
-        self._stack.clear()
-        for value in reversed(buffer):
-            self._stack.push(value)
+    def records(self, limit: Optional[int] = None) -> Iterator[LogRecord]:
+        """Newest records first, unformatted."""
+        return self._entries.latest(len(self._entries) if limit is None else limit)
+
+    def recent(self, limit: Optional[int] = None) -> Iterator[str]:
+        """Newest entries first, rendered; O(limit) without copying the whole history."""
+        for record in self.records(limit):
+            yield record.render()
 
     def history(self) -> List[str]:
-        return list(self._stack)
+        return list(self.recent())
+
+    def page(self, limit: int, offset: int = 0) -> Iterator[str]:
+        """Entries ``offset``..``offset + limit`` newest first.
+
+        Served from memory when possible and streamed from the persistent sink
+        when the page reaches past the in-memory window. Either way only this
+        session's entries since the last :meth:`clear` are paged; earlier
+        runs and cleared entries stay on disk but out of the history.
+        """
+        end = min(offset + limit, self._session_entries)
+        if self._sink is None or end <= len(self._entries):
+            records = islice(self.records(end), offset, None)
+        else:
+            records = islice(self._sink.iter_entries(), offset, end)
+        for record in records:
+            yield record.render()
+
+    @property
+    def sink(self) -> Optional["LogSink"]:
+        return self._sink
+
+    def close(self) -> None:
+        if self._sink is not None:
+            self._sink.close()
+
+    @property
+    def evictions(self) -> int:
+        return self._entries.evicted
 
     def clear(self) -> None:
-        self._stack.clear()
+        self._entries.clear()
+        self._session_entries = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
     def dump_to_file(self, target: Path) -> None:
         target.parent.mkdir(parents=True, exist_ok=True)
         with target.open("w", encoding="utf-8") as fh:
-            for line in reversed(list(self._stack)):
-                fh.write(f"{line}\n")
+            for record in self._entries.oldest_first():
+                fh.write(f"{record.render()}\n")
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import IO, Iterator, List, Optional
+
+from .log_service import LogRecord
+
+_BLOCK_SIZE = 64 * 1024
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+class LogSink:
+    """Append-only JSON-lines log file with batching, fsync and rotation.
+
+    Records are buffered as they are and only serialized when a batch of
+    ``batch_size`` is written, so ``write`` costs an append; the file is
+    fsynced at most every ``fsync_interval`` seconds. Once the active file
+    reaches ``max_bytes`` it is rotated to ``<name>.1`` (gzip-compressed as
+    ``<name>.1.gz`` when ``compress`` is set), keeping ``backup_count``
+    segments. Readers stream entries newest first by seeking from the end.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        batch_size: int = 32,
+        fsync_interval: float = 5.0,
+        max_bytes: int = 1024 * 1024,
+        backup_count: int = 5,
+        compress: bool = True,
+    ):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._batch_size = max(1, batch_size)
+        self._fsync_interval = fsync_interval
+        self._max_bytes = max_bytes
+        self._backup_count = max(0, backup_count)
+        self._compress = compress
+        self._buffer: List[LogRecord] = []
+        self._lock = threading.Lock()
+        self._fh: Optional[IO[str]] = None
+        self._last_fsync = time.monotonic()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def write(self, record: LogRecord) -> None:
+        with self._lock:
+            self._buffer.append(record)
+            if len(self._buffer) >= self._batch_size:
+                self._flush_locked()
+
+    def flush(self, fsync: bool = False) -> None:
+        with self._lock:
+            self._flush_locked(force_fsync=fsync)
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked(force_fsync=True)
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def tail(self, count: int) -> List[LogRecord]:
+        """The last ``count`` entries, newest first."""
+        records: List[LogRecord] = []
+        for record in self.iter_entries():
+            if len(records) >= count:
+                break
+            records.append(record)
+        return records
+
+    def iter_entries(self) -> Iterator[LogRecord]:
+        """Stream every entry newest first: buffer, active file, then rotated segments."""
+        with self._lock:
+            pending = list(self._buffer)
+            if self._fh is not None:
+                self._fh.flush()
+        yield from reversed(pending)
+        for segment in self._segments():
+            for line in _reverse_lines(segment):
+                if line.strip():
+                    yield _decode(line)
+
+    def _flush_locked(self, force_fsync: bool = False) -> None:
+        if self._buffer:
+            fh = self._open()
+            fh.write("".join(_encode(record) for record in self._buffer))
+            fh.flush()
+            self._buffer.clear()
+        now = time.monotonic()
+        if self._fh is not None and (force_fsync or now - self._last_fsync >= self._fsync_interval):
+            os.fsync(self._fh.fileno())
+            self._last_fsync = now
+        if self._fh is not None and self._fh.tell() >= self._max_bytes:
+            self._rotate()
+
+    def _open(self) -> IO[str]:
+        if self._fh is None:
+            self._fh = self._path.open("a", encoding="utf-8")
+        return self._fh
+
+    def _rotate(self) -> None:
+        assert self._fh is not None
+        os.fsync(self._fh.fileno())
+        self._fh.close()
+        self._fh = None
+        if self._backup_count == 0:
+            self._path.unlink()
+            return
+        oldest = self._segment_path(self._backup_count)
+        if oldest.exists():
+            oldest.unlink()
+        for index in range(self._backup_count - 1, 0, -1):
+            source = self._segment_path(index)
+            if source.exists():
+                source.rename(self._segment_path(index + 1))
+        target = self._segment_path(1)
+        if self._compress:
+            with self._path.open("rb") as src, gzip.open(target, "wb") as dst:
+                while True:
+                    block = src.read(_BLOCK_SIZE)
+                    if not block:
+                        break
+                    dst.write(block)
+            self._path.unlink()
+        else:
+            self._path.rename(target)
+
+    def _segment_path(self, index: int) -> Path:
+        suffix = f".{index}.gz" if self._compress else f".{index}"
+        return self._path.with_name(self._path.name + suffix)
+
+    def _segments(self) -> Iterator[Path]:
+        if self._path.exists():
+            yield self._path
+        for index in range(1, self._backup_count + 1):
+            segment = self._segment_path(index)
+            if not segment.exists():
+                break
+            yield segment
+
+
+def _encode(record: LogRecord) -> str:
+    data = {"ts": round(record.wall_time, 6), "label": record.label, "payload": str(record.payload)}
+    return _ENCODER.encode(data) + "\n"
+
+
+def _decode(line: str) -> LogRecord:
+    data = json.loads(line)
+    return LogRecord.from_wall_time(data["label"], data["payload"], data["ts"])
+
+
+def _reverse_lines(path: Path) -> Iterator[str]:
+    """Yield the lines of ``path`` last to first, reading fixed-size blocks from the end."""
+    if path.suffix == ".gz":
+        # rotated segments are bounded by max_bytes, so decompressing one is cheap
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            lines = fh.read().splitlines()
+        yield from reversed(lines)
+        return
+    with path.open("rb") as fh:
+        fh.seek(0, os.SEEK_END)
+        position = fh.tell()
+        remainder = b""
+        while position > 0:
+            step = min(_BLOCK_SIZE, position)
+            position -= step
+            fh.seek(position)
+            chunk = fh.read(step) + remainder
+            lines = chunk.split(b"\n")
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line.decode("utf-8")
+        if remainder:
+            yield remainder.decode("utf-8")
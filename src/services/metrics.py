@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple, Union
+
+# Upper bounds in seconds, doubling from 1 µs to ~67 s; one more bucket
+# catches everything slower.
+BUCKET_BOUNDS = tuple(1e-6 * 2 ** step for step in range(27))
+
+_PROMETHEUS_NAME = re.compile(r"[^a-zA-Z0-9_]")
+
+Number = Union[int, float]
+
+
+class Histogram:
+    """Fixed-bucket latency histogram; percentiles are bucket upper bounds."""
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for idx, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= rank and hits:
+                return min(BUCKET_BOUNDS[idx], self.max) if idx < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+        }
+
+
+class _StageTimer:
+    __slots__ = ("_metrics", "_stage", "_start")
+
+    def __init__(self, metrics: "Metrics", stage: str):
+        self._metrics = metrics
+        self._stage = stage
+
+    def __enter__(self) -> "_StageTimer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._metrics.observe(self._stage, time.perf_counter() - self._start)
+
+
+class Metrics:
+    """Per-stage latency histograms, counters and on-demand gauges.
+
+    ``with metrics.time("parse"):`` records one observation of a stage;
+    ``incr`` bumps a counter; gauges are callables read only when a
+    :meth:`snapshot` is taken (cache sizes, log evictions, pending backups).
+    Safe to share between threads.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Histogram] = {}
+        self._counters: Dict[str, Number] = {}
+        self._gauges: Dict[str, Callable[[], Number]] = {}
+        self._started = time.time()
+
+    def time(self, stage: str) -> _StageTimer:
+        return _StageTimer(self, stage)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = Histogram()
+            histogram.observe(seconds)
+
+    def incr(self, name: str, amount: Number = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def gauge(self, name: str, read: Callable[[], Number]) -> None:
+        self._gauges[name] = read
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+            self._started = time.time()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        return self._collect()[0]
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self, prefix: str = "chatbot") -> str:
+        data, buckets = self._collect()
+        lines: List[str] = [f"# TYPE {prefix}_stage_seconds histogram"]
+        for stage, summary in data["stages"].items():
+            cumulative = 0
+            for bound, hits in zip(BUCKET_BOUNDS, buckets[stage]):
+                cumulative += hits
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {summary["count"]}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {summary["total"]:.9f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {summary["count"]}')
+        for name, value in data["counters"].items():
+            metric = f"{prefix}_{_PROMETHEUS_NAME.sub('_', name)}_total"
+            lines.extend([f"# TYPE {metric} counter", f"{metric} {value}"])
+        for name, value in data["gauges"].items():
+            metric = f"{prefix}_{_PROMETHEUS_NAME.sub('_', name)}"
+            lines.extend([f"# TYPE {metric} gauge", f"{metric} {value}"])
+        return "\n".join(lines) + "\n"
+
+    def _collect(self) -> Tuple[Dict[str, Dict], Dict[str, List[int]]]:
+        with self._lock:
+            stages = {name: histogram.summary() for name, histogram in sorted(self._stages.items())}
+            buckets = {name: list(histogram.buckets) for name, histogram in self._stages.items()}
+            counters = dict(sorted(self._counters.items()))
+        gauges = {name: read() for name, read in sorted(self._gauges.items())}
+        data = {
+            "uptime": time.time() - self._started,
+            "stages": stages,
+            "counters": counters,
+            "gauges": gauges,
+        }
+        return data, buckets
+
+    def dump(self, target: Path) -> None:
+        """Write :meth:`to_prometheus` for ``.prom`` files, JSON otherwise."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        text = self.to_prometheus() if target.suffix == ".prom" else self.to_json()
+        target.write_text(text, encoding="utf-8")
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class NullMetrics(Metrics):
+    """Disabled metrics: every call is a no-op and :meth:`time` allocates nothing."""
+
+    enabled = False
+
+    def time(self, stage: str) -> _NullTimer:  # type: ignore[override]
+        return _NULL_TIMER
+
+    def observe(self, stage: str, seconds: float) -> None:
+        return None
+
+    def incr(self, name: str, amount: Number = 1) -> None:
+        return None
+
+    def gauge(self, name: str, read: Callable[[], Number]) -> None:
+        return None
+
+    def dump(self, target: Path) -> None:
+        return None
+
+
+NULL_METRICS = NullMetrics()
+
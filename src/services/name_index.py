@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import fnmatch
+import re
+import unicodedata
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, KeysView, List, Optional, Set
+
+if TYPE_CHECKING:
+    from .virtual_fs import FileSystemNode
+
+FIND_MODES = ("exact", "prefix", "glob", "substring")
+_GLOB_LITERAL = re.compile(r"[^*?\[\]]+")
+_GLOB_CLASS = re.compile(r"\[!?\]?[^\]]*\]")  # same bracket syntax fnmatch accepts
+
+
+def fold(text: str) -> str:
+    """Case-fold and strip accents so "Muéstrame" matches "muestrame"."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[idx:idx + 3] for idx in range(len(text) - 2)}
+
+
+class NameIndex:
+    """Inverted index from case-folded names to the nodes carrying them.
+
+    A trigram index over the distinct names narrows substring, prefix and
+    glob queries down to the candidate names before they are checked, so a
+    query only touches names that share every trigram of its literal parts.
+    Nodes (not paths) are indexed, which keeps moves and renames cheap:
+    paths are rebuilt from ``FileSystemNode.parent`` for the results only.
+    Accent-insensitive lookups (:meth:`search_folded`) use a second map that
+    is built on first use and then maintained like the trigrams.
+    """
+
+    def __init__(self, use_trigrams: bool = True):
+        self._nodes: Dict[str, Set["FileSystemNode"]] = {}
+        self._trigrams: Optional[Dict[str, Set[str]]] = {} if use_trigrams else None
+        self._folded: Optional[Dict[str, Set[str]]] = None  # fold(name) -> case-folded names
+
+    def __len__(self) -> int:
+        return sum(len(nodes) for nodes in self._nodes.values())
+
+    def __contains__(self, node: "FileSystemNode") -> bool:
+        return node in self._nodes.get(node.name.casefold(), ())
+
+    def add_tree(self, root: "FileSystemNode", include_root: bool = True) -> None:
+        pending = [root]
+        while pending:
+            node = pending.pop()
+            if node is not root or include_root:
+                self.add(node)
+            if node.is_directory():
+                pending.extend(node.children)
+
+    def remove_tree(self, root: "FileSystemNode") -> None:
+        pending = [root]
+        while pending:
+            node = pending.pop()
+            self.remove(node)
+            if node.is_directory():
+                pending.extend(node.children)
+
+    def add(self, node: "FileSystemNode", name: Optional[str] = None) -> None:
+        key = (name or node.name).casefold()
+        nodes = self._nodes.get(key)
+        if nodes is None:
+            nodes = self._nodes[key] = set()
+            if self._trigrams is not None:
+                for gram in trigrams(key):
+                    self._trigrams.setdefault(gram, set()).add(key)
+            if self._folded is not None:
+                self._folded.setdefault(fold(key), set()).add(key)
+        nodes.add(node)
+
+    def remove(self, node: "FileSystemNode", name: Optional[str] = None) -> None:
+        key = (name or node.name).casefold()
+        nodes = self._nodes.get(key)
+        if nodes is None:
+            return
+        nodes.discard(node)
+        if nodes:
+            return
+        del self._nodes[key]
+        if self._trigrams is not None:
+            for gram in trigrams(key):
+                names = self._trigrams.get(gram)
+                if names is not None:
+                    names.discard(key)
+                    if not names:
+                        del self._trigrams[gram]
+        if self._folded is not None:
+            folded = fold(key)
+            keys = self._folded.get(folded)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._folded[folded]
+
+    def search(self, pattern: str, mode: str = "substring") -> Iterator["FileSystemNode"]:
+        """Yield nodes whose name matches ``pattern`` (case-insensitive)."""
+        if mode not in FIND_MODES:
+            raise ValueError(f"Modo de búsqueda no soportado: {mode}")
+        query = pattern.casefold()
+        if mode == "exact":
+            yield from self._nodes.get(query, ())
+            return
+        regex = re.compile(fnmatch.translate(query)) if mode == "glob" else None
+        if regex is not None:
+            # a character class matches one unknown character, never its own text
+            literals = _GLOB_LITERAL.findall(_GLOB_CLASS.sub("?", query))
+        else:
+            literals = [query]
+        for name in self._candidates(literals):
+            if regex is not None:
+                matched = regex.match(name) is not None
+            elif mode == "prefix":
+                matched = name.startswith(query)
+            else:
+                matched = query in name
+            if matched:
+                yield from self._nodes[name]
+
+    def search_folded(self, name: str) -> Iterator["FileSystemNode"]:
+        """Yield nodes whose name equals ``name`` ignoring case and accents."""
+        for key in self._folded_map().get(fold(name), ()):
+            yield from self._nodes[key]
+
+    def folded_names(self) -> KeysView[str]:
+        """Every distinct indexed name, case- and accent-folded."""
+        return self._folded_map().keys()
+
+    def similar_folded(self, name: str, limit: int = 32) -> List[str]:
+        """Folded names sharing the most trigrams with ``name``: a shortlist for fuzzy matching.
+
+        A close name shares at least half of the query's trigrams, so it sits
+        in one of the rarest ``n - n // 2`` postings: only those are read and
+        counted, and the cost follows how rare the query's trigrams are
+        rather than the size of the index.
+        """
+        if self._trigrams is None:
+            return list(self.folded_names())
+        grams = sorted(trigrams(fold(name)), key=lambda gram: len(self._trigrams.get(gram, ())))
+        if not grams:
+            return []
+        shared: Counter = Counter()
+        for gram in grams[: len(grams) - len(grams) // 2]:
+            shared.update(self._trigrams.get(gram, ()))
+        return list(dict.fromkeys(fold(key) for key, _ in shared.most_common(limit)))
+
+    def _folded_map(self) -> Dict[str, Set[str]]:
+        if self._folded is None:
+            folded: Dict[str, Set[str]] = {}
+            for key in self._nodes:
+                folded.setdefault(fold(key), set()).add(key)
+            self._folded = folded  # published whole: concurrent readers may build it twice
+        return self._folded
+
+    def _candidates(self, literals: Iterable[str]) -> Iterable[str]:
+        grams: Set[str] = set()
+        for literal in literals:
+            grams |= trigrams(literal)
+        if self._trigrams is None or not grams:
+            return list(self._nodes)
+        # intersect starting from the rarest trigram
+        postings = sorted((self._trigrams.get(gram, set()) for gram in grams), key=len)
+        if not postings[0]:
+            return []
+        candidates = set(postings[0])
+        for names in postings[1:]:
+            candidates &= names
+            if not candidates:
+                break
+        return candidates
+
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import BinaryIO, List, Optional
+
+from .virtual_fs import FileSystemNode, VirtualFileSystem
+
+_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.S)
+_SCALAR = re.compile(rb"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?|true|false|null")
+# complete strings are skipped whole; a lone quote means the string continues in the next chunk
+_STRUCTURE = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]{}]|"', re.S)
+
+
+class _Scanner:
+    """Chunked JSON token reader over a binary file that tracks byte offsets."""
+
+    def __init__(self, fh: BinaryIO, offset: int = 0):
+        fh.seek(offset)
+        self._fh = fh
+        self._buffer = b""
+        self._pos = 0
+        self._base = offset
+        self._eof = False
+
+    @property
+    def offset(self) -> int:
+        return self._base + self._pos
+
+    def peek(self) -> bytes:
+        """Next significant byte (whitespace skipped) or ``b""`` at end of file."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos:self._pos + 1]
+            if not self._fill():
+                return b""
+
+    def expect(self, token: bytes) -> None:
+        if self.peek() != token:
+            raise ValueError(f"Seed inválida: se esperaba {token.decode()} en el byte {self.offset}")
+        self._pos += 1
+
+    def read_string(self) -> str:
+        if self.peek() != b'"':
+            raise ValueError(f"Seed inválida: se esperaba un texto en el byte {self.offset}")
+        match = self._match(_STRING)
+        self._pos = match.end()
+        return json.loads(match.group(0))
+
+    def skip_value(self) -> None:
+        token = self.peek()
+        if token == b'"':
+            self._pos = self._match(_STRING).end()
+        elif token in (b"[", b"{"):
+            self._skip_container()
+        else:
+            match = self._match(_SCALAR)
+            self._pos = match.end()
+
+    def _skip_container(self) -> None:
+        depth = 0
+        while True:
+            for match in _STRUCTURE.finditer(self._buffer, self._pos):
+                char = match.group(0)
+                if char[0] == 0x22:  # '"'
+                    if len(char) == 1:
+                        self._pos = match.start()
+                        break
+                    continue
+                depth += 1 if char in (b"[", b"{") else -1
+                if depth == 0:
+                    self._pos = match.end()
+                    return
+            else:
+                self._pos = len(self._buffer)
+            if not self._fill():
+                raise ValueError("Seed inválida: estructura sin cerrar")
+
+    def _match(self, pattern: "re.Pattern[bytes]") -> "re.Match[bytes]":
+        while True:
+            match = pattern.match(self._buffer, self._pos)
+            # a token touching the end of the buffer may continue in the next chunk
+            if match is not None and (match.end() < len(self._buffer) or self._eof):
+                return match
+            if not self._fill():
+                if match is not None:
+                    return match
+                raise ValueError(f"Seed inválida: token incompleto en el byte {self.offset}")
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        data = self._fh.read(_CHUNK_SIZE)
+        self._base += self._pos
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        if not data:
+            self._eof = True
+        return bool(data)
+
+
+class _Frame:
+    __slots__ = ("name", "type", "children", "children_offset")
+
+    def __init__(self):
+        self.name: Optional[str] = None
+        self.type: Optional[str] = None
+        self.children: List[FileSystemNode] = []
+        self.children_offset: Optional[int] = None
+
+
+class SeedFileLoader:
+    """Builds the tree straight from a seed file without ``json.load``.
+
+    Parsing is iterative, so depth is not limited by the recursion limit.
+    With ``lazy=True`` each folder only records where its ``children`` array
+    starts; the array is parsed the first time the folder is accessed, so
+    start-up cost and memory grow with the folders actually visited.
+    """
+
+    def __init__(self, path: Path, lazy: bool = False):
+        self._path = Path(path)
+        self._lazy = lazy
+
+    def load_root(self) -> FileSystemNode:
+        with self._path.open("rb") as fh:
+            scanner = _Scanner(fh)
+            scanner.expect(b"{")
+            while scanner.peek() != b"}":
+                key = scanner.read_string()
+                scanner.expect(b":")
+                if key == "root":
+                    return self._read_node(scanner, stop_at_children=self._lazy)
+                scanner.skip_value()
+                if scanner.peek() == b",":
+                    scanner.expect(b",")
+        raise ValueError("Seed inválida: falta 'root'")
+
+    def load_children(self, offset: int) -> List[FileSystemNode]:
+        """Parse one ``children`` array starting at byte ``offset``."""
+        children: List[FileSystemNode] = []
+        with self._path.open("rb") as fh:
+            scanner = _Scanner(fh, offset)
+            scanner.expect(b"[")
+            while scanner.peek() != b"]":
+                children.append(self._read_node(scanner))
+                if scanner.peek() == b",":
+                    scanner.expect(b",")
+        return children
+
+    def _read_node(self, scanner: _Scanner, stop_at_children: bool = False) -> FileSystemNode:
+        """Parse one node object.
+
+        ``stop_at_children`` (lazy root only) returns as soon as the children
+        array is reached once name and type are known, instead of skipping the
+        array to find the end of the object; start-up then reads a few bytes.
+        """
+        scanner.expect(b"{")
+        stack = [_Frame()]
+        while True:
+            frame = stack[-1]
+            token = scanner.peek()
+            if token == b",":
+                scanner.expect(b",")
+                token = scanner.peek()
+            if token == b"}":
+                scanner.expect(b"}")
+                node = self._build(frame)
+                stack.pop()
+                if not stack:
+                    return node
+                stack[-1].children.append(node)
+                # back inside the parent's children array
+                if scanner.peek() == b",":
+                    scanner.expect(b",")
+                    scanner.expect(b"{")
+                    stack.append(_Frame())
+                else:
+                    scanner.expect(b"]")
+                continue
+            key = scanner.read_string()
+            scanner.expect(b":")
+            if key == "children":
+                if self._lazy:
+                    frame.children_offset = scanner.offset if scanner.peek() == b"[" else None
+                    if stop_at_children and frame.name is not None and frame.type is not None:
+                        return self._build(frame)
+                    scanner.skip_value()
+                    continue
+                scanner.expect(b"[")
+                if scanner.peek() == b"]":
+                    scanner.expect(b"]")
+                    continue
+                scanner.expect(b"{")
+                stack.append(_Frame())
+            elif key in ("name", "type"):
+                setattr(frame, key, scanner.read_string())
+            else:
+                scanner.skip_value()
+
+    def _build(self, frame: _Frame) -> FileSystemNode:
+        if frame.name is None or frame.type is None:
+            raise ValueError("Seed inválida: cada nodo necesita 'name' y 'type'")
+        node = FileSystemNode(name=frame.name, type=frame.type)
+        for child in frame.children:
+            node.add_child(child)
+        if frame.children_offset is not None and node.is_directory():
+            node.defer_children(self, frame.children_offset)
+        return node
+
+
+def load_filesystem(path: Path, mode: str = "eager") -> VirtualFileSystem:
+    """Load a seed file.
+
+    ``eager`` parses it with ``json.load`` (fastest for small seeds),
+    ``stream`` builds nodes while reading without keeping the parsed JSON,
+    and ``lazy`` materializes folders on first access.
+    """
+    if mode == "eager":
+        with Path(path).open("r", encoding="utf-8") as fh:
+            return VirtualFileSystem.from_seed(json.load(fh))
+    if mode not in ("stream", "lazy"):
+        raise ValueError(f"Modo de carga no soportado: {mode}")
+    return VirtualFileSystem(SeedFileLoader(path, lazy=mode == "lazy").load_root())
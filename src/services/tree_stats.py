@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from .virtual_fs import FileSystemNode
+
+# per-folder aggregate: [descendant folders, descendant files, height]
+_FOLDERS, _FILES, _HEIGHT = 0, 1, 2
+
+
+class TreeStats:
+    """Descendant folder/file counts and subtree height for every folder.
+
+    Built once with a post-order walk, then maintained incrementally:
+    linking or unlinking a subtree only updates the ancestors of the
+    change point, so the totals of any folder are read in O(1). Height
+    (levels below a folder) may need to look at the siblings of a removed
+    branch, but stops climbing as soon as an ancestor is unaffected.
+    """
+
+    def __init__(self, root: "FileSystemNode"):
+        self._totals: Dict["FileSystemNode", List[int]] = {}
+        self._measure(root)
+
+    def totals(self, node: "FileSystemNode") -> Dict[str, int]:
+        folders, files, height = self._totals[node]
+        return {"folders": folders, "files": files, "height": height}
+
+    def attach(self, node: "FileSystemNode") -> None:
+        """Account for ``node`` (and its subtree) after it was linked under its parent.
+
+        A subtree that kept its aggregates (see :meth:`detach`) is not re-measured.
+        """
+        if not node.is_directory():
+            self._propagate(node, 0, 1, 1)
+            return
+        folders, files, height = self._totals.get(node) or self._measure(node)
+        self._propagate(node, folders + 1, files, height + 1)
+
+    def detach(self, node: "FileSystemNode", parent: "FileSystemNode", forget: bool = True) -> None:
+        """Remove ``node``'s subtree from the totals after it was unlinked from ``parent``.
+
+        With ``forget=False`` the subtree keeps its own aggregates, as a move
+        re-attaches it elsewhere right away.
+        """
+        if node.is_directory():
+            folders, files, height = self._totals[node]
+            folders += 1
+        else:
+            folders, files, height = 0, 1, 0
+        ancestor = parent
+        while ancestor is not None:
+            totals = self._totals[ancestor]
+            totals[_FOLDERS] -= folders
+            totals[_FILES] -= files
+            ancestor = ancestor.parent
+        self._shrink_heights(parent, height + 1)
+        if forget:
+            self.forget(node)
+
+    def forget(self, node: "FileSystemNode") -> None:
+        """Drop the aggregates of a detached subtree."""
+        pending = [node] if node.is_directory() else []
+        while pending:
+            current = pending.pop()
+            self._totals.pop(current, None)
+            pending.extend(child for child in current.children if child.is_directory())
+
+    def _measure(self, root: "FileSystemNode") -> List[int]:
+        """Post-order walk that (re)computes the aggregates of every folder under ``root``."""
+        order = []
+        pending = [root]
+        while pending:
+            node = pending.pop()
+            order.append(node)
+            pending.extend(child for child in node.children if child.is_directory())
+        for node in reversed(order):
+            totals = [0, 0, 0]
+            for child in node.children:
+                if child.is_directory():
+                    child_totals = self._totals[child]
+                    totals[_FOLDERS] += child_totals[_FOLDERS] + 1
+                    totals[_FILES] += child_totals[_FILES]
+                    totals[_HEIGHT] = max(totals[_HEIGHT], child_totals[_HEIGHT] + 1)
+                else:
+                    totals[_FILES] += 1
+                    totals[_HEIGHT] = max(totals[_HEIGHT], 1)
+            self._totals[node] = totals
+        return self._totals[root]
+
+    def _propagate(self, node: "FileSystemNode", folders: int, files: int, height: int) -> None:
+        ancestor = node.parent
+        while ancestor is not None:
+            totals = self._totals[ancestor]
+            totals[_FOLDERS] += folders
+            totals[_FILES] += files
+            totals[_HEIGHT] = max(totals[_HEIGHT], height)
+            height += 1
+            ancestor = ancestor.parent
+
+    def _shrink_heights(self, node: "FileSystemNode", lost: int) -> None:
+        # ``lost`` is the height the removed branch contributed to ``node``
+        while node is not None:
+            totals = self._totals[node]
+            if lost < totals[_HEIGHT]:
+                return  # another branch is at least as tall
+            height = 0
+            for child in node.children:
+                child_height = self._totals[child][_HEIGHT] + 1 if child.is_directory() else 1
+                height = max(height, child_height)
+            if totals[_HEIGHT] == height:
+                return
+            lost, totals[_HEIGHT] = totals[_HEIGHT] + 1, height
+            node = node.parent
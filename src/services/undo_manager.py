@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ..datastructures.linked_stack import LinkedStack
+
+if TYPE_CHECKING:
+    from .virtual_fs import FileSystemNode, Placement, VirtualFileSystem
+
+
+class UndoEntry:
+    """One reversible mutation: where ``node`` was before and after it."""
+
+    __slots__ = ("label", "node", "before", "after")
+
+    def __init__(
+        self,
+        label: str,
+        node: "FileSystemNode",
+        before: Optional["Placement"],
+        after: Optional["Placement"],
+    ):
+        self.label = label
+        self.node = node
+        self.before = before
+        self.after = after
+
+
+class UndoManager:
+    """Undo/redo stacks for the mutations of a :class:`VirtualFileSystem`.
+
+    Every ``mkdir``, ``rmdir`` and ``mv`` is a relink of one node, so an
+    entry only stores that node and its two placements; a removed subtree
+    is kept by reference and undo/redo relink it in O(depth) without copying
+    or reloading snapshots. The undo stack never holds more than
+    ``max_depth`` entries: once full, each new entry truncates the oldest one
+    in O(max_depth) without rebuilding the stack.
+    """
+
+    def __init__(self, filesystem: "VirtualFileSystem", max_depth: int = 50):
+        self._filesystem = filesystem
+        self._max_depth = max(1, max_depth)
+        self._undo: LinkedStack[UndoEntry] = LinkedStack()
+        self._redo: LinkedStack[UndoEntry] = LinkedStack()
+
+    def record(
+        self,
+        label: str,
+        node: "FileSystemNode",
+        before: Optional["Placement"],
+        after: Optional["Placement"],
+    ) -> None:
+        self._undo.push(UndoEntry(label, node, before, after))
+        self._discard(self._redo.truncate(0))
+        if len(self._undo) > self._max_depth:
+            self._trim()
+
+    def undo(self, journal: bool = True) -> Tuple[str, Dict[str, Any]]:
+        """Revert the latest mutation; returns its label and the journal change.
+
+        Pass ``journal=False`` when the change will not be journaled, so an
+        undone removal does not serialize the restored subtree.
+        """
+        if not len(self._undo):
+            raise ValueError("No hay acciones para deshacer")
+        entry = self._undo.peek()
+        change = self._filesystem.relink(entry.node, entry.before, with_tree=journal)
+        self._redo.push(self._undo.pop())
+        return entry.label, change
+
+    def redo(self, journal: bool = True) -> Tuple[str, Dict[str, Any]]:
+        if not len(self._redo):
+            raise ValueError("No hay acciones para rehacer")
+        entry = self._redo.peek()
+        change = self._filesystem.relink(entry.node, entry.after, with_tree=journal)
+        self._undo.push(self._redo.pop())
+        return entry.label, change
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    def _trim(self) -> None:
+        for entry in self._undo.truncate(self._max_depth):
+            if entry.after is None:
+                # a subtree removed that long ago can no longer come back
+                self._filesystem.forget_detached(entry.node)
+
+    def _discard(self, entries: List[UndoEntry]) -> None:
+        for entry in entries:
+            if entry.before is None:
+                # an undone creation: its node is detached for good now
+                self._filesystem.forget_detached(entry.node)
@@ -1,43 +1,339 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+import sys
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .name_index import NameIndex
+from .tree_stats import TreeStats
+
+if TYPE_CHECKING:
+    from .undo_manager import UndoManager
+
+Placement = Tuple["FileSystemNode", str]  # (parent folder, name)
+
+
+DIRECTORY = "directory"
+FILE = "file"
+DEFAULT_PATH_CACHE_SIZE = 1024
+# guards lazy loads and sorted-list builds of every node: both happen at most
+# once per folder, and a lock per node would undo the savings of __slots__
+_MATERIALIZE_LOCK = threading.Lock()
 
 
-@dataclass
 class FileSystemNode:
-    name: str
-    type: str  # "directory" | "file"
-    children: List["FileSystemNode"] = field(default_factory=list)
+    """Compact tree node that indexes its children by case-folded name.
+
+    Nodes use ``__slots__``, interned names and a boolean kind flag. Files
+    carry no child containers, empty folders allocate their index on the
+    first insert, and the sorted name lists behind listings are only built
+    the first time a folder is listed (then kept ordered on every change).
+
+    A folder may also be *lazy*: ``_lazy`` holds a loader whose
+    ``load_children(token)`` returns the children the first time they are
+    needed (see ``seed_loader``). Loading is thread-safe, and a loader that
+    raises leaves the folder lazy so the next access retries. ``parent``
+    points back to the folder the node is linked into, so a node's path can
+    be rebuilt without a search.
+    """
+
+    __slots__ = ("name", "parent", "_is_dir", "_index", "_folders", "_files", "_lazy")
+
+    def __init__(
+        self,
+        name: str,
+        type: str,  # "directory" | "file"
+        children: Optional[Iterable["FileSystemNode"]] = None,
+    ):
+        if type not in (DIRECTORY, FILE):
+            raise ValueError(f"Tipo de nodo inválido: {type}")
+        self.name = sys.intern(name)
+        self.parent: Optional[FileSystemNode] = None
+        self._is_dir = type == DIRECTORY
+        self._index: Optional[Dict[str, FileSystemNode]] = None
+        self._folders: Optional[List[str]] = None
+        self._files: Optional[List[str]] = None
+        self._lazy: Optional[Tuple[Any, Any]] = None
+        for child in children or ():
+            self.add_child(child)
+
+    def defer_children(self, loader: Any, token: Any) -> None:
+        """Load children through ``loader.load_children(token)`` on first access."""
+        if not self._is_dir:
+            raise ValueError("Solo las carpetas pueden contener elementos")
+        self._lazy = (loader, token)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._lazy is None
+
+    def _load(self) -> None:
+        with _MATERIALIZE_LOCK:
+            if self._lazy is None:
+                return  # another thread loaded the folder while this one waited
+            loader, token = self._lazy
+            index: Dict[str, FileSystemNode] = {}
+            for child in loader.load_children(token):
+                key = sys.intern(child.name.casefold())
+                if key in index:
+                    raise ValueError(f"Ya existe '{child.name}' en la ruta indicada")
+                index[key] = child
+            for child in index.values():
+                child.parent = self
+            if index:
+                self._index = index
+            # cleared last: a failed load is retried, and a thread that sees
+            # ``_lazy is None`` without the lock already sees every child
+            self._lazy = None
+
+    def __repr__(self) -> str:
+        return f"FileSystemNode(name={self.name!r}, type={self.type!r}, children={len(self._index or ())})"
+
+    @property
+    def path(self) -> str:
+        """Absolute path rebuilt through the ``parent`` links."""
+        parts = []
+        node: Optional[FileSystemNode] = self
+        while node is not None:
+            parts.append(node.name)
+            node = node.parent
+        return "/" + "/".join(reversed(parts))
+
+    @property
+    def type(self) -> str:
+        return DIRECTORY if self._is_dir else FILE
+
+    @property
+    def children(self) -> List["FileSystemNode"]:
+        if self._lazy is not None:
+            self._load()
+        return list(self._index.values()) if self._index else []
 
     def is_directory(self) -> bool:
-        return self.type == "directory"
+        return self._is_dir
 
     def find_child(self, name: str) -> Optional["FileSystemNode"]:
-        for child in self.children:
-            if child.name.lower() == name.lower():
-                return child
-        return None
+        if self._lazy is not None:
+            self._load()
+        if not self._index:
+            return None
+        return self._index.get(name.casefold())
+
+    def add_child(self, child: "FileSystemNode") -> None:
+        if not self._is_dir:
+            raise ValueError("Solo las carpetas pueden contener elementos")
+        if self._lazy is not None:
+            self._load()
+        key = sys.intern(child.name.casefold())
+        if self._index is None:
+            self._index = {}
+        elif key in self._index:
+            raise ValueError(f"Ya existe '{child.name}' en la ruta indicada")
+        self._index[key] = child
+        child.parent = self
+        names = self._folders if child._is_dir else self._files
+        if names is not None:
+            insort(names, child.name)
+
+    def remove_child(self, child: "FileSystemNode") -> None:
+        if self._lazy is not None:
+            self._load()
+        key = child.name.casefold()
+        if not self._index or self._index.get(key) is not child:
+            raise ValueError(f"'{child.name}' no pertenece a esta carpeta")
+        del self._index[key]
+        child.parent = None
+        names = self._folders if child._is_dir else self._files
+        if names is not None:
+            del names[bisect_left(names, child.name)]
+
+    def folder_names(self) -> List[str]:
+        """Sorted child folder names."""
+        self._ensure_sorted()
+        return list(self._folders or ())
+
+    def file_names(self) -> List[str]:
+        self._ensure_sorted()
+        return list(self._files or ())
+
+    def iter_sorted(
+        self, offset: int = 0, after: Optional[Tuple[bool, str]] = None
+    ) -> Iterator[Tuple[bool, str]]:
+        """Yield ``(is_directory, name)`` in listing order: folders, then files.
+
+        Reads the persistent sorted lists in place, so the first item costs
+        O(log n) however large the folder is. ``after`` resumes right past a
+        previously returned item, which stays correct if siblings are added
+        or removed between pages; otherwise ``offset`` items are skipped.
+        """
+        self._ensure_sorted()
+        folders, files = self._folders or [], self._files or []
+        if after is not None:
+            is_dir, name = after
+            folder_start = bisect_right(folders, name) if is_dir else len(folders)
+            file_start = 0 if is_dir else bisect_right(files, name)
+        else:
+            folder_start = min(offset, len(folders))
+            file_start = max(0, offset - len(folders))
+        # index loops instead of islice: skipping to the start stays O(1)
+        idx = folder_start
+        while idx < len(folders):
+            yield True, folders[idx]
+            idx += 1
+        idx = file_start
+        while idx < len(files):
+            yield False, files[idx]
+            idx += 1
+
+    def _ensure_sorted(self) -> None:
+        if self._folders is not None or not self._is_dir:
+            return
+        if self._lazy is not None:
+            self._load()
+        with _MATERIALIZE_LOCK:
+            if self._folders is not None:
+                return
+            children = self._index.values() if self._index else ()
+            self._files = sorted(child.name for child in children if not child._is_dir)
+            # assigned last: readers that skip the lock test ``_folders`` only
+            self._folders = sorted(child.name for child in children if child._is_dir)
 
     def to_dict(self) -> Dict:
-        data = {"name": self.name, "type": self.type}
-        if self.is_directory():
-            data["children"] = [child.to_dict() for child in self.children]
-        return data
+        """Serialize the subtree; iterative, so deep trees do not hit the recursion limit."""
+        root = self._shallow_dict()
+        pending = [(self, root)]
+        while pending:
+            node, data = pending.pop()
+            for child in node.children:
+                child_data = child._shallow_dict()
+                data["children"].append(child_data)
+                if child._is_dir:
+                    pending.append((child, child_data))
+        return root
+
+    def _shallow_dict(self) -> Dict:
+        if self._is_dir:
+            return {"name": self.name, "type": DIRECTORY, "children": []}
+        return {"name": self.name, "type": FILE}
 
     @classmethod
     def from_dict(cls, data: Dict) -> "FileSystemNode":
-        children = [cls.from_dict(child) for child in data.get("children", [])]
-        return cls(name=data["name"], type=data["type"], children=children)
+        """Build a subtree from seed data without recursion."""
+        root = cls(name=data["name"], type=data["type"])
+        pending = [(root, data.get("children") or ())]
+        while pending:
+            node, children = pending.pop()
+            for child_data in children:
+                child = cls(name=child_data["name"], type=child_data["type"])
+                node.add_child(child)
+                grandchildren = child_data.get("children")
+                if grandchildren:
+                    pending.append((child, grandchildren))
+        return root
+
+
+class PathCache:
+    """Bounded LRU map from a normalized path to its ``(parent, node)`` pair.
+
+    Only successful lookups are stored, so creating a folder never makes an
+    entry stale. Removing or moving one calls :meth:`invalidate`, which bumps
+    a generation counter in O(1) instead of searching for the paths below
+    it; entries from an older generation count as misses and are dropped
+    when they are next looked up (or aged out by the LRU bound).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PATH_CACHE_SIZE):
+        self._max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[str, Tuple[int, FileSystemNode, FileSystemNode]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: str) -> Optional[Tuple[FileSystemNode, FileSystemNode]]:
+        if not self._max_entries:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != self._generation:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1], entry[2]
+
+    def put(self, key: str, entry: Tuple[FileSystemNode, FileSystemNode], generation: int) -> None:
+        """Store ``entry``, resolved while :attr:`generation` was ``generation``."""
+        if not self._max_entries:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return  # the tree changed while the path was being resolved
+            self._entries[key] = (generation, *entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self) -> None:
+        """Make every cached path stale in O(1)."""
+        with self._lock:
+            if self._entries:
+                self._generation += 1
+                self._invalidations += 1
+
+    def resize(self, max_entries: int) -> None:
+        with self._lock:
+            self._max_entries = max(0, max_entries)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "size": len(self._entries),
+            }
 
 
 class VirtualFileSystem:
-    """In-memory tree with validation helpers."""
+    """In-memory tree with validation helpers.
 
-    def __init__(self, root: FileSystemNode):
+    Path lookups go through a bounded :class:`PathCache`; removals and
+    moves invalidate it as a whole in O(1). The :class:`NameIndex` behind
+    :meth:`find` is built on the first search and then updated by every
+    mutation.
+    """
+
+    def __init__(self, root: FileSystemNode, path_cache_size: int = DEFAULT_PATH_CACHE_SIZE):
         if not root.is_directory():
             raise ValueError("La raíz debe ser una carpeta")
         self._root = root
+        self._version = 0
+        self._paths = PathCache(path_cache_size)
+        self._names: Optional[NameIndex] = None
+        self._stats: Optional[TreeStats] = None
+        # read-only calls may run on several threads (see ``async_engine``);
+        # this guards the lazily built index and aggregates
+        self._build_lock = threading.Lock()
+        self.undo_log: Optional["UndoManager"] = None
 
     @classmethod
     def from_seed(cls, data: Dict) -> "VirtualFileSystem":
@@ -50,17 +346,26 @@ class VirtualFileSystem:
         node = self._resolve(path)
         if not node.is_directory():
             raise ValueError(f"La ruta {path} no es una carpeta")
-        folders = [child.name for child in node.children if child.is_directory()]
-        files = [child.name for child in node.children if not child.is_directory()]
-        return {"folders": sorted(folders), "files": sorted(files)}
+        return {"folders": node.folder_names(), "files": node.file_names()}
+
+    def iter_directory(
+        self, path: str, offset: int = 0, after: Optional[Tuple[bool, str]] = None
+    ) -> Iterator[Tuple[bool, str]]:
+        """Lazy, paginable counterpart of :meth:`list_directory` (see ``FileSystemNode.iter_sorted``)."""
+        node = self._resolve(path)
+        if not node.is_directory():
+            raise ValueError(f"La ruta {path} no es una carpeta")
+        return node.iter_sorted(offset=offset, after=after)
 
     def remove_directory(self, path: str) -> str:
         if path.strip() in ("", "/"):
             raise ValueError("No se puede eliminar la raíz")
         parent, node = self._resolve_with_parent(path)
+        if node is self._root:
+            raise ValueError("No se puede eliminar la raíz")
         if not node.is_directory():
             raise ValueError("Solo se pueden eliminar carpetas")
-        parent.children = [child for child in parent.children if child is not node]
+        self._detach(f"rmdir {path}", parent, node)
         return node.name
 
     def make_directory(self, path: str) -> str:
@@ -77,28 +382,334 @@ class VirtualFileSystem:
             raise ValueError("Solo se pueden crear carpetas dentro de otras carpetas")
         if parent.find_child(new_name):
             raise ValueError(f"Ya existe '{new_name}' en la ruta indicada")
-        parent.children.append(FileSystemNode(name=new_name, type="directory"))
+        child = FileSystemNode(name=new_name, type="directory")
+        parent.add_child(child)
+        if self._names is not None:
+            self._names.add(child)
+        if self._stats is not None:
+            self._stats.attach(child)
+        self._version += 1
+        if self.undo_log is not None:
+            self.undo_log.record(f"mkdir {path}", child, None, (parent, child.name))
         return new_name
 
+    def make_directories(self, path: str) -> int:
+        """``mkdir -p``: create every missing folder along ``path``; returns how many were created."""
+        parts = self._split(path.strip())
+        if len(parts) < 2:
+            raise ValueError("La ruta debe incluir la carpeta raíz y el nombre a crear")
+        if parts[0].casefold() != self._root.name.casefold():
+            raise ValueError(f"La ruta debe iniciar en /{self._root.name}")
+        node = self._root
+        for depth, part in enumerate(parts[1:], start=1):
+            child = node.find_child(part)
+            if child is None:
+                break
+            if not child.is_directory():
+                raise ValueError(f"'{'/'.join(parts[:depth + 1])}' es un archivo, no una carpeta")
+            node = child
+        else:
+            return 0
+        # everything below the first missing segment is new, so no more lookups are needed
+        top = None
+        for part in parts[depth:]:
+            child = FileSystemNode(name=part, type=DIRECTORY)
+            node.add_child(child)
+            if self._names is not None:
+                self._names.add(child)
+            top = top or child
+            node = child
+        if self._stats is not None:
+            self._stats.attach(top)
+        self._version += 1
+        if self.undo_log is not None:
+            self.undo_log.record(f"mkdir -p {path}", top, None, (top.parent, top.name))
+        return len(parts) - depth
+
+    def remove_tree(self, path: str) -> Tuple[str, int]:
+        """``rmdir -r``: unlink a folder and return its name and the number of removed nodes."""
+        if path.strip() in ("", "/"):
+            raise ValueError("No se puede eliminar la raíz")
+        parent, node = self._resolve_with_parent(path)
+        if node is self._root:
+            raise ValueError("No se puede eliminar la raíz")
+        if not node.is_directory():
+            raise ValueError("Solo se pueden eliminar carpetas")
+        removed = _count_nodes(node)
+        self._detach(f"rmdir -r {path}", parent, node)
+        return node.name, removed
+
+    def move(self, source: str, destination: str) -> str:
+        """Move (or rename) ``source``; returns the new path.
+
+        An existing folder as ``destination`` receives the node under its own
+        name; otherwise the last segment of ``destination`` is the new name.
+        Only the two parent folders change, whatever the subtree size.
+        """
+        source_chain = self._resolve_chain(source)
+        node = source_chain[-1]
+        if len(source_chain) < 2:
+            raise ValueError("No se puede mover la raíz")
+        parts = self._split(destination.strip())
+        try:
+            target_chain = self._resolve_chain(destination)
+        except ValueError:
+            target_chain = None
+        if target_chain is not None and target_chain[-1].is_directory() and target_chain[-1] is not node:
+            new_parent_chain, new_name = target_chain, node.name
+            parts = [*parts, new_name]
+        else:
+            if len(parts) < 2:
+                raise ValueError("Debe indicar la ruta completa del destino")
+            new_parent_chain, new_name = self._resolve_chain("/" + "/".join(parts[:-1])), parts[-1]
+        new_parent = new_parent_chain[-1]
+        if not new_parent.is_directory():
+            raise ValueError("Solo se pueden mover elementos dentro de otras carpetas")
+        if any(ancestor is node for ancestor in new_parent_chain):
+            raise ValueError("No se puede mover una carpeta dentro de sí misma")
+        before = (source_chain[-2], node.name)
+        self._relink(node, (new_parent, new_name))
+        if self.undo_log is not None:
+            self.undo_log.record(f"mv {source} {destination}", node, before, (new_parent, node.name))
+        return "/" + "/".join(parts)
+
+    def relink(self, node: FileSystemNode, target: Optional[Placement], with_tree: bool = True) -> Dict[str, Any]:
+        """Put ``node`` at ``target`` (``None`` detaches it), keeping its subtree by reference.
+
+        This is the O(depth) primitive behind undo/redo; it is not recorded in
+        :attr:`undo_log`. Returns the equivalent journal change; re-attaching
+        a subtree serializes it into the change (O(subtree)) only ``with_tree``.
+        """
+        before = node.path if node.parent is not None else None
+        self._relink(node, target)
+        if target is None:
+            return {"op": "rmdir", "path": before}
+        if before is None:
+            change = {"op": "attach", "path": node.path}
+            if with_tree:
+                change["tree"] = node.to_dict()
+            return change
+        return {"op": "mv", "path": before, "destination": node.path}
+
+    def forget_detached(self, node: FileSystemNode) -> None:
+        """Drop index and aggregate entries of a detached subtree nobody can relink anymore."""
+        if node.parent is not None or node is self._root:
+            return
+        if self._names is not None:
+            self._names.remove_tree(node)
+        if self._stats is not None:
+            self._stats.forget(node)
+
+    def find(self, pattern: str, mode: str = "substring", within: Optional[str] = None) -> List[str]:
+        """Sorted paths of every node whose name matches ``pattern``.
+
+        ``mode`` is ``exact``, ``prefix``, ``glob`` or ``substring`` (all
+        case-insensitive); ``within`` limits the results to one folder.
+        """
+        scope = self._resolve(within) if within else None
+        if scope is not None and not scope.is_directory():
+            raise ValueError(f"La ruta {within} no es una carpeta")
+        paths = []
+        for node in self.name_index().search(pattern, mode):
+            # subtrees detached but kept for undo stay indexed until they are forgotten
+            if not _is_descendant(node, scope or self._root):
+                continue
+            paths.append(node.path)
+        return sorted(paths, key=str.casefold)
+
+    def folders_named(self, name: str) -> List[str]:
+        """Paths of the folders called ``name``, ignoring case and accents (root excluded)."""
+        return [
+            node.path
+            for node in self.name_index().search_folded(name)
+            if node.is_directory() and _is_descendant(node, self._root)
+        ]
+
+    def name_index(self) -> NameIndex:
+        """The name index, built (loading every lazy folder) on first use."""
+        if self._names is None:
+            with self._build_lock:
+                if self._names is None:
+                    names = NameIndex()
+                    names.add_tree(self._root, include_root=False)
+                    self._names = names
+        return self._names
+
+    def usage(self, path: str) -> Dict[str, int]:
+        """Aggregates of a folder: descendant ``folders`` and ``files``, ``height`` and ``depth``.
+
+        The totals are computed for the whole tree on the first call (loading
+        every lazy folder) and kept up to date by each mutation afterwards.
+        """
+        node = self._resolve(path)
+        if not node.is_directory():
+            raise ValueError(f"La ruta {path} no es una carpeta")
+        if self._stats is None:
+            with self._build_lock:
+                if self._stats is None:
+                    self._stats = TreeStats(self._root)
+        totals = self._stats.totals(node)
+        depth = 0
+        ancestor = node.parent
+        while ancestor is not None:
+            depth += 1
+            ancestor = ancestor.parent
+        totals["depth"] = depth
+        return totals
+
+    def apply_change(self, change: Dict) -> None:
+        """Replay a journaled mutation produced by the shell commands."""
+        op = change.get("op")
+        if op == "mkdir":
+            if change.get("parents"):
+                self.make_directories(change["path"])
+            else:
+                self.make_directory(change["path"])
+        elif op == "rmdir":
+            self.remove_directory(change["path"])
+        elif op == "mv":
+            self.move(change["path"], change["destination"])
+        elif op == "attach":
+            parts = self._split(change["path"])
+            parent = self._resolve("/" + "/".join(parts[:-1]))
+            node = FileSystemNode.from_dict(change["tree"])
+            if not parent.is_directory():
+                raise ValueError("Solo se pueden crear carpetas dentro de otras carpetas")
+            self._relink(node, (parent, parts[-1]))
+        else:
+            raise ValueError(f"Operación de journal desconocida: {op}")
+
     def snapshot(self) -> Dict:
         return {"root": self._root.to_dict()}
 
+    def snapshot_binary(self) -> bytes:
+        """The tree encoded in the compact ``VFSB`` format (see ``binary_snapshot``)."""
+        from .binary_snapshot import encode_tree
+
+        return encode_tree(self._root)
+
+    def save_binary(self, path: Union[str, Path]) -> int:
+        """Write a ``VFSB`` snapshot to ``path``; returns its size in bytes."""
+        from .binary_snapshot import write_snapshot
+
+        return write_snapshot(self._root, Path(path))
+
+    @classmethod
+    def load_binary(cls, source: Union[str, Path, bytes], lazy: bool = True) -> "VirtualFileSystem":
+        """Open a ``VFSB`` snapshot (a path, mapped with ``mmap``, or raw bytes).
+
+        With ``lazy`` only the root is decoded up front; every folder reads its
+        children from the mapping the first time it is visited.
+        """
+        from .binary_snapshot import BinarySnapshotLoader
+
+        return cls(BinarySnapshotLoader(source).load_root(lazy=lazy))
+
+    def walk_directories(self, loaded_only: bool = False) -> Iterator[Tuple[str, FileSystemNode]]:
+        """Yield ``(path, node)`` for every folder, breadth first, without recursion.
+
+        With ``loaded_only`` lazy folders are reported but not expanded, so the
+        walk never forces the rest of a lazily loaded seed into memory.
+        """
+        pending = deque([(f"/{self._root.name}", self._root)])
+        while pending:
+            path, node = pending.popleft()
+            yield path, node
+            if loaded_only and not node.is_loaded:
+                continue
+            for child in node.children:
+                if child.is_directory():
+                    pending.append((f"{path}/{child.name}", child))
+
     @property
     def root_name(self) -> str:
         return self._root.name
 
+    def path_cache_stats(self) -> Dict[str, float]:
+        return self._paths.stats()
+
+    def resize_path_cache(self, max_entries: int) -> None:
+        """Change the path cache bound; ``0`` disables it."""
+        self._paths.resize(max_entries)
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every mutation; lets callers invalidate derived data."""
+        return self._version
+
     def _resolve(self, path: str) -> FileSystemNode:
         parent, node = self._resolve_with_parent(path)
         return node
 
+    def _detach(self, label: str, parent: FileSystemNode, node: FileSystemNode) -> None:
+        if self.undo_log is not None:
+            # keep the subtree indexed: undo relinks this very node
+            self._relink(node, None)
+            self.undo_log.record(label, node, (parent, node.name), None)
+            return
+        self._paths.invalidate()
+        parent.remove_child(node)
+        if self._names is not None:
+            self._names.remove_tree(node)
+        if self._stats is not None:
+            self._stats.detach(node, parent)
+        self._version += 1
+
+    def _relink(self, node: FileSystemNode, target: Optional[Placement]) -> None:
+        if target is not None:
+            new_parent, new_name = target
+            existing = new_parent.find_child(new_name)
+            if existing is not None and existing is not node:
+                raise ValueError(f"Ya existe '{new_name}' en la ruta indicada")
+        indexed = self._names is not None and node in self._names
+        old_parent = node.parent
+        if old_parent is not None:
+            self._paths.invalidate()
+            old_parent.remove_child(node)
+            if self._stats is not None:
+                self._stats.detach(node, old_parent, forget=False)
+        if target is not None:
+            old_name, node.name = node.name, sys.intern(new_name)
+            new_parent.add_child(node)
+            if self._stats is not None:
+                self._stats.attach(node)
+            if self._names is not None:
+                if not indexed:
+                    self._names.add_tree(node)
+                elif old_name != node.name:
+                    self._names.remove(node, old_name)
+                    self._names.add(node)
+        self._version += 1
+
+    def _resolve_chain(self, path: str) -> List[FileSystemNode]:
+        """Nodes from the root down to ``path``, inclusive."""
+        parts = self._split(path.strip())
+        chain = [self._root]
+        if not parts:
+            return chain
+        if parts[0].casefold() != self._root.name.casefold():
+            raise ValueError(f"La ruta debe iniciar en /{self._root.name}")
+        for idx, part in enumerate(parts[1:], start=1):
+            next_node = chain[-1].find_child(part)
+            if not next_node:
+                raise ValueError(f"Ruta inválida: {'/'.join(parts[:idx + 1])}")
+            chain.append(next_node)
+        return chain
+
     def _resolve_with_parent(self, path: str) -> (FileSystemNode, FileSystemNode):
         normalized = path.strip()
-        parts = self._split(normalized)
-        if not parts:
+        # the cache key needs no split, so a hit skips building the segment list
+        key = normalized.strip("/").casefold()
+        if not key:
             return self._root, self._root
+        generation = self._paths.generation
+        cached = self._paths.get(key)
+        if cached is not None:
+            return cached
+        parts = self._split(normalized)
         node = self._root
         parent = self._root
-        if parts[0].lower() != self._root.name.lower():
+        if parts[0].casefold() != self._root.name.casefold():
             raise ValueError(f"La ruta debe iniciar en /{self._root.name}")
         for idx, part in enumerate(parts[1:], start=1):
             parent = node
@@ -106,6 +717,7 @@ class VirtualFileSystem:
             if not next_node:
                 raise ValueError(f"Ruta inválida: {'/'.join(parts[:idx + 1])}")
             node = next_node
+        self._paths.put(key, (parent, node), generation)
         return parent, node
 
     @staticmethod
@@ -114,3 +726,23 @@ class VirtualFileSystem:
             return []
         cleaned = path.strip("/")
         return [segment for segment in cleaned.split("/") if segment]
+
+
+def _count_nodes(node: FileSystemNode) -> int:
+    count = 0
+    pending = [node]
+    while pending:
+        current = pending.pop()
+        count += 1
+        if current.is_directory():
+            pending.extend(current.children)
+    return count
+
+
+def _is_descendant(node: FileSystemNode, ancestor: FileSystemNode) -> bool:
+    current = node.parent
+    while current is not None:
+        if current is ancestor:
+            return True
+        current = current.parent
+    return False
@@ -0,0 +1,36 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.services.chatbot_shell import ChatbotShell
+
+SEED_PATH = Path(__file__).resolve().parents[1] / "data" / "default_fs.json"
+
+
+@pytest.fixture
+def seed():
+    return json.loads(SEED_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def make_shell(tmp_path):
+    """Builds a ChatbotShell whose config and backups live under ``tmp_path``."""
+
+    def factory(**overrides):
+        settings = {
+            "filesystem_seed": str(SEED_PATH),
+            "backup_dir": str(tmp_path / "backups"),
+            "max_log_entries": 50,
+            "auto_backup_commands": ["dir", "mkdir", "rmdir", "mv", "undo", "redo"],
+            "ai": {"enabled": False},
+            "default_commands": [],
+        }
+        settings.update(overrides)
+        config_dir = tmp_path / "config"
+        config_dir.mkdir(exist_ok=True)
+        config_path = config_dir / "settings.json"
+        config_path.write_text(json.dumps(settings), encoding="utf-8")
+        return ChatbotShell(str(config_path))
+
+    return factory
@@ -0,0 +1,112 @@
+import threading
+
+from src.services.ai_cache import ResponseCache
+from src.services.ai_service import AIError, AIService, AISettings
+
+
+def _settings(**overrides):
+    values = dict(
+        enabled=True,
+        endpoint="http://127.0.0.1:9/v1/chat",
+        model="modelo",
+        api_key_env="TEST_AI_KEY",
+        system_prompt="prompt",
+        provider="openai",
+    )
+    values.update(overrides)
+    return AISettings(**values)
+
+
+def test_cache_key_collapses_whitespace_but_keeps_case():
+    first = ResponseCache.make_key("openai", "m", "p", "  Borra   la carpeta Fotos ")
+    assert first == ResponseCache.make_key("openai", "m", "p", "Borra la carpeta Fotos")
+    assert first != ResponseCache.make_key("openai", "m", "p", "borra la carpeta fotos")
+    assert first != ResponseCache.make_key("gemini", "m", "p", "Borra la carpeta Fotos")
+
+
+def test_cache_lru_and_ttl():
+    now = [0.0]
+    cache = ResponseCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    cache.put("a", "dir /a")
+    cache.put("b", "dir /b")
+    assert cache.get("a") == "dir /a"
+    cache.put("c", "dir /c")
+    assert cache.get("b") is None
+    now[0] = 11
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["expired"] == 1
+
+
+def test_cache_persistent_tier(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    ResponseCache(persist_path=path).put("k", "log 3")
+    assert ResponseCache(persist_path=path).get("k") == "log 3"
+
+
+def test_concurrent_identical_requests_are_coalesced():
+    cache = ResponseCache()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(2)
+        return "dir /Documentos"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    while cache.stats()["coalesced"] < 7:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert calls == [1]
+    assert results == ["dir /Documentos"] * 8
+
+
+def test_suggest_command_uses_cache(monkeypatch):
+    monkeypatch.setenv("TEST_AI_KEY", "secreto")
+    service = AIService(_settings(), cache=ResponseCache())
+    calls = []
+
+    def fake_request(message):
+        calls.append(message)
+        return "dir /Documentos"
+
+    monkeypatch.setattr(service, "_request_suggestion", fake_request)
+    assert service.suggest_command("muestra documentos") == "dir /Documentos"
+    assert service.suggest_command(" muestra  documentos") == "dir /Documentos"
+    assert len(calls) == 1
+    assert service.cache_stats()["hits"] == 1
+
+
+def test_suggest_reports_errors_to_each_caller_only(monkeypatch):
+    monkeypatch.setenv("TEST_AI_KEY", "secreto")
+    service = AIService(_settings(), cache=ResponseCache())
+    failing_started = threading.Event()
+    release = threading.Event()
+
+    def fake_request(message):
+        if message == "falla":
+            failing_started.set()
+            release.wait(2)
+            raise AIError("Error HTTP 500 desde el proveedor IA")
+        return "dir /Documentos"
+
+    monkeypatch.setattr(service, "_request_suggestion", fake_request)
+    results = {}
+    thread = threading.Thread(target=lambda: results.update(falla=service.suggest("falla")))
+    thread.start()
+    failing_started.wait(2)
+    ok = service.suggest("muestra documentos")
+    release.set()
+    thread.join()
+    assert ok.command == "dir /Documentos" and ok.error is None
+    assert results["falla"].command is None
+    assert results["falla"].error == "Error HTTP 500 desde el proveedor IA"
@@ -0,0 +1,87 @@
+import asyncio
+import json
+
+from src.services.async_engine import AsyncChatbotEngine, AsyncRWLock
+
+
+def test_sessions_share_filesystem_but_not_history(make_shell):
+    async def scenario():
+        engine = AsyncChatbotEngine(make_shell(backup_mode="journal"))
+        first, second = engine.open_session(), engine.open_session()
+        await engine.process(first, "mkdir /Documentos/Compartida")
+        listing = await engine.process(second, "dir /Documentos")
+        await engine.aclose()
+        return engine, first, second, listing
+
+    engine, first, second, listing = asyncio.run(scenario())
+    assert "Compartida" in listing
+    assert any("mkdir" in entry for entry in engine.history(first))
+    assert not any("mkdir" in entry for entry in engine.history(second))
+
+
+def test_concurrent_mutations_are_all_applied(make_shell):
+    shell = make_shell(backup_mode="journal")
+
+    async def scenario():
+        engine = AsyncChatbotEngine(shell)
+        sessions = [engine.open_session() for _ in range(20)]
+        await asyncio.gather(
+            *(engine.process(session, f"mkdir /Documentos/S{idx}") for idx, session in enumerate(sessions))
+        )
+        await engine.aclose()
+
+    asyncio.run(scenario())
+    assert len(shell._filesystem.list_directory("/Documentos")["folders"]) == 22
+
+
+def test_concurrent_reads_of_a_lazy_tree_see_complete_folders(make_shell, tmp_path):
+    seed = {"root": {"name": "Documentos", "type": "directory", "children": [
+        {"name": f"C{i}", "type": "directory", "children": [
+            {"name": f"S{j}", "type": "directory", "children": [{"name": "a.txt", "type": "file"}]}
+            for j in range(40)
+        ]}
+        for i in range(6)
+    ]}}
+    seed_path = tmp_path / "seed.json"
+    seed_path.write_text(json.dumps(seed), encoding="utf-8")
+    messages = [f"dir /Documentos/C{i % 6}" for i in range(24)] + ["find s3", "find a.txt", "du /Documentos"] * 4
+    expected_shell = make_shell(filesystem_seed=str(seed_path))
+    expected = [expected_shell.process_message(message) for message in messages]
+
+    async def scenario(shell):
+        engine = AsyncChatbotEngine(shell)
+        sessions = [engine.open_session() for _ in messages]
+        results = await asyncio.gather(
+            *(engine.process(session, message) for session, message in zip(sessions, messages))
+        )
+        await engine.aclose()
+        return results
+
+    for _ in range(5):
+        shell = make_shell(filesystem_seed=str(seed_path), seed_loading="lazy", auto_backup_commands=[])
+        assert asyncio.run(scenario(shell)) == expected
+
+
+def test_rw_lock_excludes_writers_from_readers():
+    events = []
+
+    async def reader(lock, tag):
+        async with lock.read():
+            events.append(f"{tag}+")
+            await asyncio.sleep(0.01)
+            events.append(f"{tag}-")
+
+    async def writer(lock):
+        async with lock.write():
+            events.append("w+")
+            await asyncio.sleep(0.01)
+            events.append("w-")
+
+    async def scenario():
+        lock = AsyncRWLock()
+        await asyncio.gather(reader(lock, "a"), reader(lock, "b"), writer(lock), reader(lock, "c"))
+
+    asyncio.run(scenario())
+    start, end = events.index("w+"), events.index("w-")
+    assert end == start + 1
+    assert events[:2] == ["a+", "b+"]
@@ -0,0 +1,110 @@
+import json
+import threading
+
+from src.services.backup_service import BackupService, restore_from_journal
+
+
+def test_full_mode_writes_snapshot_per_command(make_shell, tmp_path):
+    shell = make_shell()
+    shell.process_message("dir /Documentos")
+    files = list((tmp_path / "backups").glob("backup_*_dir.json"))
+    assert len(files) == 1
+
+
+def test_journal_mode_skips_read_only_commands(make_shell, tmp_path):
+    shell = make_shell(backup_mode="journal", journal_base_every=2)
+    shell.process_message("dir /Documentos")
+    journal_dir = tmp_path / "backups" / BackupService.JOURNAL_DIR
+    assert not (journal_dir / BackupService.JOURNAL_FILE).exists()
+    assert not list(journal_dir.glob("base_*.json"))
+
+    shell.process_message("mkdir /Documentos/Uno")
+    shell.process_message("mkdir /Documentos/Dos")
+    shell.process_message("rmdir /Documentos/Fotos")
+    lines = (journal_dir / BackupService.JOURNAL_FILE).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["op"] for line in lines] == ["mkdir", "mkdir", "rmdir"]
+    # base after the first mutation, then again once two more have accumulated
+    assert len(list(journal_dir.glob("base_*.json"))) == 2
+
+
+def test_restore_replays_base_and_deltas(make_shell, tmp_path):
+    shell = make_shell(backup_mode="journal", journal_base_every=100)
+    for command in ("mkdir /Documentos/Uno", "mkdir /Documentos/Uno/Dos", "rmdir /Documentos/Fotos"):
+        shell.process_message(command)
+    journal_path = tmp_path / "backups" / BackupService.JOURNAL_DIR / BackupService.JOURNAL_FILE
+    deltas = [json.loads(line) for line in journal_path.read_text(encoding="utf-8").splitlines()]
+
+    restored = restore_from_journal(str(tmp_path / "backups"))
+    assert restored.snapshot() == shell._filesystem.snapshot()
+
+    partial = restore_from_journal(str(tmp_path / "backups"), until=deltas[1]["timestamp"])
+    assert "Fotos" in partial.list_directory("/Documentos")["folders"]
+    assert len(partial.list_directory("/Documentos/Uno")["folders"]) == 1
+
+
+def test_journal_sequence_continues_after_restart(tmp_path):
+    first = BackupService(str(tmp_path), mode="journal")
+    first.record("mkdir", [{"op": "mkdir", "path": "/Documentos/A"}], lambda: {"root": {}})
+    first.process()
+    second = BackupService(str(tmp_path), mode="journal")
+    second.record("mkdir", [{"op": "mkdir", "path": "/Documentos/B"}], lambda: {"root": {}})
+    second.process()
+    journal_path = tmp_path / BackupService.JOURNAL_DIR / BackupService.JOURNAL_FILE
+    seqs = [json.loads(line)["seq"] for line in journal_path.read_text(encoding="utf-8").splitlines()]
+    assert seqs == [1, 2]
+
+
+def test_background_writer_coalesces_and_flushes(tmp_path):
+    service = BackupService(str(tmp_path), background=True)
+    service._cond.acquire()  # hold the worker so the burst piles up
+    try:
+        for idx in range(5):
+            service._queue.enqueue({"command": "dir", "timestamp": f"t{idx}", "snapshot": {"n": idx}})
+    finally:
+        service._cond.release()
+    service.close()
+    written = sorted(tmp_path.glob("backup_*.json"))
+    assert len(written) >= 1
+    latest = json.loads(written[-1].read_text(encoding="utf-8"))
+    assert latest["snapshot"] == {"n": 4}
+    assert service.stats()["coalesced"] == 5 - len(written)
+
+
+def test_background_writer_never_drops_deltas(tmp_path):
+    service = BackupService(str(tmp_path), mode="journal", background=True, max_pending=2, overflow="drop_oldest")
+    for idx in range(50):
+        service.record("mkdir", [{"op": "mkdir", "path": f"/Documentos/C{idx}"}], lambda: {"root": {}})
+        service.process()
+    service.close()
+    journal_path = tmp_path / BackupService.JOURNAL_DIR / BackupService.JOURNAL_FILE
+    assert len(journal_path.read_text(encoding="utf-8").splitlines()) == 50
+
+
+def test_background_writer_survives_unexpected_errors(tmp_path):
+    service = BackupService(str(tmp_path), background=True)
+    service.queue_snapshot("dir", {"raro": object()})  # json cannot serialize it
+    service.flush()
+    assert "TypeError" in service.last_error
+    service.queue_snapshot("mkdir", {"n": 1})
+    closer = threading.Thread(target=service.close)
+    closer.start()
+    closer.join(timeout=5)
+    assert not closer.is_alive()
+    assert list(tmp_path.glob("backup_*_mkdir.json"))
+
+
+def test_shell_close_flushes_background_backups(make_shell, tmp_path):
+    shell = make_shell(backup_background=True)
+    shell.process_message("mkdir /Documentos/Nueva")
+    shell.close()
+    assert list((tmp_path / "backups").glob("backup_*_mkdir.json"))
+
+
+def test_recursive_commands_journal_one_delta_each(make_shell, tmp_path):
+    shell = make_shell(backup_mode="journal")
+    for command in ("mkdir -p /Documentos/Uno/Dos/Tres", "mv /Documentos/Uno /Documentos/Proyectos", "rmdir -r /Documentos/Fotos"):
+        assert not shell.process_message(command).startswith("Error")
+    journal_path = tmp_path / "backups" / BackupService.JOURNAL_DIR / BackupService.JOURNAL_FILE
+    deltas = [json.loads(line) for line in journal_path.read_text(encoding="utf-8").splitlines()]
+    assert [delta["op"] for delta in deltas] == ["mkdir", "mv", "rmdir"]
+    assert restore_from_journal(str(tmp_path / "backups")).snapshot() == shell._filesystem.snapshot()
@@ -0,0 +1,66 @@
+import io
+
+from src.services.batch_runner import BatchRunner, read_script
+
+SCRIPT = """# migración
+mkdir /Documentos/Uno
+mkdir /Documentos/Uno/Dos
+
+rmdir /Documentos/Fotos
+rmdir /Documentos/NoExiste
+salir
+mkdir /Documentos/Nunca
+"""
+
+
+def test_read_script_skips_comments_and_stops_at_exit():
+    lines = list(read_script(io.StringIO(SCRIPT)))
+    assert [number for number, _ in lines] == [2, 3, 5, 6]
+
+
+def test_batch_coalesces_backups_until_the_end(make_shell, tmp_path):
+    shell = make_shell()
+    runner = BatchRunner(shell)
+    results = list(runner.run(read_script(io.StringIO(SCRIPT))))
+    assert [result.ok for result in results] == [True, True, True, False]
+    assert runner.report.commands == 4
+    assert runner.report.errors == 1
+    assert runner.report.mutations == 3
+    assert len(list((tmp_path / "backups").glob("backup_*.json"))) == 1
+
+
+def test_batch_backup_every_n_mutations(make_shell, tmp_path):
+    shell = make_shell(backup_mode="journal")
+    runner = BatchRunner(shell, backup_every=2)
+    results = runner.run(read_script(io.StringIO(SCRIPT)))
+    next(results)
+    assert runner.report.backups == 0
+    next(results)
+    assert runner.report.backups == 1
+    list(results)
+    assert runner.report.backups == 2
+
+
+def test_dry_run_validates_without_mutating(make_shell, tmp_path):
+    shell = make_shell()
+    before = shell.context.filesystem.snapshot()
+    runner = BatchRunner(shell, dry_run=True)
+    results = list(runner.run(read_script(io.StringIO(SCRIPT))))
+    # the second mkdir depends on the first one, which only happened in the copy
+    assert [result.ok for result in results] == [True, True, True, False]
+    assert shell.context.filesystem.snapshot() == before
+    assert not list((tmp_path / "backups").glob("backup_*.json"))
+
+
+def test_dry_run_matches_phrases_against_the_copy_and_skips_the_llm(make_shell, monkeypatch):
+    shell = make_shell()
+
+    def no_network(plan, logger):
+        raise AssertionError("dry-run must not call the LLM")
+
+    monkeypatch.setattr(shell, "plan_with_ai", no_network)
+    runner = BatchRunner(shell, dry_run=True)
+    script = "mkdir /Documentos/Viajes\nabre Viajes\ncuéntame un chiste\n"
+    results = list(runner.run(read_script(io.StringIO(script))))
+    assert [result.ok for result in results] == [True, True, False]
+    assert "modo simulación" in results[2].response
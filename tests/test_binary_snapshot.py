@@ -0,0 +1,42 @@
+import pytest
+
+from src.services.backup_service import BackupService, restore_from_journal
+from src.services.virtual_fs import VirtualFileSystem
+
+
+def test_binary_roundtrip_lazy_and_eager(seed, tmp_path):
+    fs = VirtualFileSystem.from_seed(seed)
+    path = tmp_path / "snapshot.vfsb"
+    assert fs.save_binary(path) == path.stat().st_size
+
+    lazy = VirtualFileSystem.load_binary(path)
+    assert lazy.list_directory("/Documentos") == fs.list_directory("/Documentos")
+    assert lazy.snapshot() == fs.snapshot()
+    assert VirtualFileSystem.load_binary(path, lazy=False).snapshot() == fs.snapshot()
+
+
+def test_lazy_binary_load_decodes_only_visited_folders(seed):
+    lazy = VirtualFileSystem.load_binary(VirtualFileSystem.from_seed(seed).snapshot_binary())
+    lazy.list_directory("/Documentos")
+    states = {path: node.is_loaded for path, node in lazy.walk_directories(loaded_only=True)}
+    assert states["/Documentos"] is True
+    assert not all(states.values())
+
+
+def test_invalid_binary_snapshot_is_rejected(tmp_path):
+    path = tmp_path / "broken.vfsb"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        VirtualFileSystem.load_binary(path)
+    with pytest.raises(ValueError):
+        VirtualFileSystem.load_binary(b"JSON" + b"\0" * 64)
+
+
+def test_binary_backups_restore_from_journal(make_shell, tmp_path):
+    shell = make_shell(backup_mode="journal", backup_format="binary", journal_base_every=2)
+    for command in ("mkdir /Documentos/Uno", "mkdir /Documentos/Dos", "rmdir /Documentos/Fotos"):
+        shell.process_message(command)
+    journal_dir = tmp_path / "backups" / BackupService.JOURNAL_DIR
+    assert len(list(journal_dir.glob("base_*.vfsb"))) == 2
+    assert not list(journal_dir.glob("base_*.json"))
+    assert restore_from_journal(str(tmp_path / "backups")).snapshot() == shell._filesystem.snapshot()
@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+
+from src.datastructures.blocking_queue import BlockingQueue, Empty, Full, QueueClosed
+
+
+def test_timeouts_and_capacity():
+    queue = BlockingQueue(capacity=2)
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01)
+    queue.put("a")
+    queue.put("b")
+    with pytest.raises(Full):
+        queue.put("c", timeout=0.01)
+    assert len(queue) == 2
+    assert queue.get_many(10) == ["a", "b"]
+
+
+def test_blocked_producer_resumes_when_space_frees():
+    queue = BlockingQueue(capacity=1)
+    queue.put(1)
+    producer = threading.Thread(target=queue.put, args=(2,))
+    producer.start()
+    time.sleep(0.02)
+    assert queue.get() == 1
+    producer.join(timeout=1)
+    assert not producer.is_alive()
+    assert queue.get(timeout=1) == 2
+
+
+def test_close_drains_then_raises_and_wakes_waiters():
+    queue = BlockingQueue()
+    results = []
+
+    def consumer():
+        try:
+            while True:
+                results.append(queue.get())
+        except QueueClosed:
+            results.append("cerrada")
+
+    thread = threading.Thread(target=consumer)
+    thread.start()
+    queue.put(1)
+    queue.close()
+    thread.join(timeout=1)
+    assert results == [1, "cerrada"]
+    with pytest.raises(QueueClosed):
+        queue.put(2)
+
+
+def test_many_producers_and_consumers_lose_nothing():
+    producers, consumers, per_producer = 8, 8, 3000
+    queue = BlockingQueue(capacity=64)
+    received = defaultdict(list)
+
+    def produce(producer_id):
+        for seq in range(per_producer):
+            queue.put((producer_id, seq))
+
+    def consume(consumer_id):
+        try:
+            while True:
+                batch = queue.get_many(16) if consumer_id % 2 else [queue.get()]
+                received[consumer_id].extend(batch)
+        except QueueClosed:
+            pass
+
+    consumer_threads = [threading.Thread(target=consume, args=(idx,)) for idx in range(consumers)]
+    producer_threads = [threading.Thread(target=produce, args=(idx,)) for idx in range(producers)]
+    for thread in consumer_threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join(timeout=30)
+    queue.close()
+    for thread in consumer_threads:
+        thread.join(timeout=30)
+
+    items = [item for batch in received.values() for item in batch]
+    assert len(items) == producers * per_producer
+    assert set(items) == {(p, s) for p in range(producers) for s in range(per_producer)}
+    for batch in received.values():  # FIFO: each consumer sees every producer in order
+        for producer_id in range(producers):
+            seqs = [seq for pid, seq in batch if pid == producer_id]
+            assert seqs == sorted(seqs)
+    assert len(queue) == 0
@@ -5,6 +5,8 @@ import pytest
 
 from src.datastructures.linked_queue import LinkedQueue
 from src.datastructures.linked_stack import LinkedStack
+from src.datastructures.nodes import NodePool
+from src.datastructures.ring_buffer import RingBuffer
 from src.services.virtual_fs import VirtualFileSystem
 
 
@@ -25,6 +27,56 @@ def test_linked_queue_basic_operations():
     assert queue.dequeue() == 2
 
 
+def test_linked_stack_bulk_operations():
+    stack = LinkedStack(range(5))
+    stack.extend([5, 6])
+    assert stack.pop_many(2) == [6, 5]
+    assert stack.truncate(3) == [1, 0]
+    assert list(stack) == [4, 3, 2]
+    other = LinkedStack(["a", "b"])
+    stack.splice(other)
+    assert list(stack) == ["b", "a", 4, 3, 2] and len(stack) == 5
+    assert len(other) == 0
+    assert stack.pop_many(10) == ["b", "a", 4, 3, 2]
+    stack.splice(LinkedStack(["x"]))
+    stack.push("y")
+    assert list(stack) == ["y", "x"]
+    for bad_call in (lambda: stack.pop_many(-1), lambda: stack.truncate(-1)):
+        with pytest.raises(ValueError):
+            bad_call()
+    assert list(stack) == ["y", "x"]
+
+
+def test_linked_queue_bulk_operations():
+    queue = LinkedQueue([1, 2])
+    queue.extend(iter([3, 4]))
+    assert queue.drain(3) == [1, 2, 3]
+    queue.splice(LinkedQueue([5, 6]))
+    queue.enqueue(7)
+    assert len(queue) == 4
+    assert queue.drain() == [4, 5, 6, 7]
+    assert queue.drain() == []
+    queue.extend([8])
+    assert queue.peek() == 8
+    with pytest.raises(ValueError):
+        queue.drain(-2)
+    assert len(queue) == 1
+
+
+def test_node_pool_recycles_nodes():
+    pool = NodePool(max_size=2)
+    stack = LinkedStack(pool=pool)
+    queue = LinkedQueue(pool=pool)
+    stack.extend(range(4))
+    assert stack.pop_many(4) == [3, 2, 1, 0]
+    assert len(pool) == 2
+    queue.extend(["a", "b", "c"])
+    assert len(pool) == 0
+    assert queue.dequeue() == "a"
+    assert queue.drain() == ["b", "c"]
+    assert len(pool) == 2
+
+
 def test_virtual_filesystem_removal(tmp_path):
     seed_path = Path(__file__).resolve().parents[1] / "data" / "default_fs.json"
     seed = json.loads(seed_path.read_text(encoding="utf-8"))
@@ -45,3 +97,15 @@ def test_virtual_filesystem_creation(tmp_path):
     assert "Nueva" in listing["folders"]
     with pytest.raises(ValueError):
         fs.make_directory(f"/{fs.root_name}/Nueva")
+
+
+def test_ring_buffer_evicts_oldest_and_iterates_newest_first():
+    buffer = RingBuffer(3)
+    for value in range(5):
+        buffer.append(value)
+    assert len(buffer) == 3
+    assert list(buffer) == [4, 3, 2]
+    assert list(buffer.latest(2)) == [4, 3]
+    assert list(buffer.oldest_first()) == [2, 3, 4]
+    assert buffer.evicted == 2
+    assert buffer.peek() == 4
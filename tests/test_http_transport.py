@@ -0,0 +1,148 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.services.ai_cache import ResponseCache
+from src.services.ai_service import AIService, AISettings
+from src.services.http_transport import CircuitBreaker, PooledHttpTransport
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        server.connections.add(self.client_address)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server.requests.append((self.path, body))
+        status = server.statuses.pop(0) if server.statuses else 200
+        if status != 200:
+            payload = b'{"error": "ocupado"}'
+        elif "contents" in body:
+            payload = json.dumps(
+                {"candidates": [{"content": {"parts": [{"text": "dir /Documentos"}]}}]}
+            ).encode("utf-8")
+        else:
+            payload = json.dumps(
+                {"choices": [{"message": {"content": "log 3"}}]}
+            ).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.connections = set()
+    server.requests = []
+    server.statuses = []
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _service(server, provider, monkeypatch, **transport):
+    monkeypatch.setenv("STUB_AI_KEY", "secreto")
+    settings = AISettings(
+        enabled=True,
+        endpoint=f"http://127.0.0.1:{server.server_port}/v1/generate",
+        model="stub",
+        api_key_env="STUB_AI_KEY",
+        system_prompt="prompt",
+        provider=provider,
+    )
+    transport = PooledHttpTransport(sleep=lambda _: None, **transport)
+    return AIService(settings, transport=transport), transport
+
+
+@pytest.mark.parametrize("provider, expected", [("openai", "log 3"), ("gemini", "dir /Documentos")])
+def test_keep_alive_reuses_connection(stub_server, monkeypatch, provider, expected):
+    service, transport = _service(stub_server, provider, monkeypatch)
+    for _ in range(3):
+        assert service.suggest_command("muestra el historial") == expected
+    assert transport.connections_opened == 1
+    assert len(stub_server.connections) == 1
+    if provider == "gemini":
+        assert "key=secreto" in stub_server.requests[0][0]
+
+
+def test_retries_on_server_errors(stub_server, monkeypatch):
+    service, _ = _service(stub_server, "openai", monkeypatch, max_retries=2)
+    stub_server.statuses = [503, 429]
+    assert service.suggest_command("hola") == "log 3"
+    assert len(stub_server.requests) == 3
+
+
+def test_breaker_opens_after_repeated_failures(stub_server, monkeypatch):
+    now = [0.0]
+    service, _ = _service(stub_server, "openai", monkeypatch, max_retries=0)
+    service._breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+    stub_server.statuses = [500, 500]
+    assert service.suggest_command("a") is None
+    assert service._breaker.state == "closed"
+    assert service.suggest_command("b") is None
+    assert service._breaker.state == "open"
+    assert service.suggest_command("c") is None
+    assert service.last_error == "IA en pausa tras fallos repetidos"
+    assert len(stub_server.requests) == 2
+    now[0] = 11
+    assert service._breaker.would_allow()
+    assert service.suggest_command("d") == "log 3"
+    assert service._breaker.state == "closed"
+
+
+def test_open_breaker_still_serves_cached_answers(stub_server, monkeypatch):
+    now = [0.0]
+    service, _ = _service(stub_server, "openai", monkeypatch, max_retries=0)
+    service._cache = ResponseCache()
+    service._breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    assert service.suggest_command("muestra el historial") == "log 3"
+    stub_server.statuses = [500]
+    assert service.suggest_command("otra cosa") is None
+    assert service._breaker.state == "open" and service.is_ready()
+    assert service.suggest_command("muestra el historial") == "log 3"
+    assert service.suggest_command("algo nuevo") is None
+    assert len(stub_server.requests) == 2
+
+
+def test_half_open_breaker_lets_a_single_trial_through():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert not breaker.allow()
+    now[0] = 11
+    assert breaker.state == "half-open" and breaker.would_allow()
+    assert breaker.allow()
+    assert not breaker.allow()
+    others = []
+    thread = threading.Thread(target=lambda: others.append(breaker.allow()))
+    thread.start()
+    thread.join()
+    assert others == [False] and not breaker.would_allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+    now[0] = 22
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow() and breaker.allow()
+
+
+def test_unreachable_host_counts_as_failure(monkeypatch):
+    monkeypatch.setenv("STUB_AI_KEY", "secreto")
+    settings = AISettings(True, "http://127.0.0.1:9/x", "m", "STUB_AI_KEY", "p", "openai", breaker_threshold=1)
+    service = AIService(settings, transport=PooledHttpTransport(max_retries=0, connect_timeout=0.5))
+    assert service.suggest_command("hola") is None
+    assert service.last_error
+    assert service._breaker.state == "open"
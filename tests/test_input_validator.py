@@ -0,0 +1,58 @@
+import pytest
+
+from src.commands.base import CommandRegistry
+from src.commands.dir_command import DirCommand
+from src.commands.du_command import DuCommand
+from src.commands.mkdir_command import MkdirCommand
+from src.commands.mv_command import MvCommand
+from src.services.input_validator import InputValidator, quote
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("DIR /Documentos/Proyectos", ("dir", ["/Documentos/Proyectos"])),
+        ("usuario: mkdir  /Documentos/Nueva ", ("mkdir", ["/Documentos/Nueva"])),
+        ('mkdir "/Documentos/Mis fotos"', ("mkdir", ["/Documentos/Mis fotos"])),
+        ("mv /Documentos/'Mis fotos' '/Documentos/Fotos 2024'", ("mv", ["/Documentos/Mis fotos", "/Documentos/Fotos 2024"])),
+        ('find ""', ("find", [""])),
+    ],
+)
+def test_parse_keeps_argument_case_and_quotes(raw, expected):
+    assert InputValidator().parse(raw) == expected
+
+
+def test_parse_rejects_empty_and_unbalanced_input():
+    validator = InputValidator()
+    with pytest.raises(ValueError, match="Debe ingresar"):
+        validator.parse("   ")
+    with pytest.raises(ValueError, match="Comillas"):
+        validator.parse('dir "/Documentos')
+
+
+def test_quote_round_trips_through_tokenize():
+    validator = InputValidator()
+    for token in ["/Documentos", "/Documentos/Mis fotos", "It's", ""]:
+        assert validator.tokenize(f"dir {quote(token)}") == ["dir", token]
+
+
+def test_registry_resolves_aliases_and_unique_abbreviations():
+    registry = CommandRegistry()
+    for command in (DirCommand(), DuCommand(), MkdirCommand(), MvCommand()):
+        registry.register(command)
+    assert registry.resolve("ls").name == "dir"
+    assert registry.resolve("mkd").name == "mkdir"
+    assert registry.resolve("move").name == "mv"
+    assert registry.resolve("du").name == "du"
+    assert registry.resolve("mk") is None  # shorter than the minimum
+    assert registry.resolve("chiste") is None
+    with pytest.raises(KeyError):
+        registry.get("chiste")
+
+
+def test_shell_creates_folders_with_original_case(make_shell):
+    shell = make_shell()
+    assert "creada" in shell.process_message('md "/Documentos/Mis Fotos"')
+    listing = shell.process_message("ls /Documentos")
+    assert "Mis Fotos" in listing
+    assert shell.process_message("muestra Proyectos").startswith("Contenido de /Documentos/Proyectos")
@@ -0,0 +1,82 @@
+import pytest
+
+from src.services.intent_matcher import IntentMatcher
+from src.services.virtual_fs import VirtualFileSystem
+
+
+@pytest.fixture
+def matcher(seed):
+    return IntentMatcher(VirtualFileSystem.from_seed(seed))
+
+
+@pytest.mark.parametrize(
+    "phrase, expected",
+    [
+        ("muéstrame lo que hay en Proyectos", ("dir", ["/Documentos/Proyectos"])),
+        ("borra la carpeta Fotos", ("rmdir", ["/Documentos/Fotos"])),
+        ("crea la carpeta Música en Proyectos", ("mkdir", ["/Documentos/Proyectos/Música"])),
+        ("enséñame los últimos 5 del historial", ("log", ["5"])),
+        ("borra el historial", ("clear", [])),
+        ("muestra la carpeta proyetos", ("dir", ["/Documentos/Proyectos"])),
+    ],
+)
+def test_resolves_common_phrases(matcher, phrase, expected):
+    assert matcher.match(phrase) == expected
+
+
+def test_unresolved_phrases_fall_through(matcher):
+    assert matcher.match("cuéntame un chiste") is None
+    assert matcher.match("borra la carpeta Inexistente") is None
+    assert matcher.match("elimina Documentos") is None
+
+
+@pytest.mark.parametrize("phrase", ["borra la carpeta fotoss", "borra la carpeta Foto"])
+def test_rmdir_needs_an_exact_folder_name(matcher, phrase):
+    assert matcher.match(phrase) is None
+    assert matcher.match(phrase.replace("borra", "muestra")) == ("dir", ["/Documentos/Fotos"])
+
+
+def test_matcher_sees_new_folders(seed):
+    fs = VirtualFileSystem.from_seed(seed)
+    matcher = IntentMatcher(fs)
+    assert matcher.match("abre Viajes") is None
+    fs.make_directory("/Documentos/Viajes")
+    assert matcher.match("abre Viajes") == ("dir", ["/Documentos/Viajes"])
+    fs.move("/Documentos/Viajes", "/Documentos/Proyectos/Vacaciones")
+    assert matcher.match("abre Viajes") is None
+    assert matcher.match("borra Vacaciones") == ("rmdir", ["/Documentos/Proyectos/Vacaciones"])
+
+
+def test_custom_synonyms(seed):
+    matcher = IntentMatcher(VirtualFileSystem.from_seed(seed), intents={"dir": ["chequea"]})
+    assert matcher.match("chequea Fotos") == ("dir", ["/Documentos/Fotos"])
+
+
+def test_shell_uses_local_matcher_before_ai(make_shell):
+    shell = make_shell()
+    response = shell.process_message("borra la carpeta Fotos")
+    assert "eliminada" in response
+    assert any(" intent: " in entry for entry in shell.history)
+
+
+def test_search_phrase_maps_to_find(matcher):
+    assert matcher.match("búscame Plan.txt") == ("find", ["Plan.txt"])
+
+
+def test_top_level_folders_resolve_without_loading_the_tree(seed):
+    lazy = VirtualFileSystem.load_binary(VirtualFileSystem.from_seed(seed).snapshot_binary())
+    matcher = IntentMatcher(lazy)
+    assert matcher.match("muestra Fotos") == ("dir", ["/Documentos/Fotos"])
+    assert lazy._names is None
+    assert not all(node.is_loaded for _, node in lazy.walk_directories(loaded_only=True))
+
+
+def test_fuzzy_shortlist_comes_from_shared_trigrams():
+    fs = VirtualFileSystem.from_seed({"root": {"name": "Documentos", "type": "directory", "children": [
+        {"name": "Archivo", "type": "directory", "children": [
+            {"name": f"Carpeta{i:04d}", "type": "directory"} for i in range(2000)
+        ] + [{"name": "Presupuestos", "type": "directory"}]},
+    ]}})
+    shortlist = fs.name_index().similar_folded("presupuestso")
+    assert shortlist[0] == "presupuestos" and len(shortlist) <= 32
+    assert IntentMatcher(fs).match("abre presupuestso") == ("dir", ["/Documentos/Archivo/Presupuestos"])
@@ -0,0 +1,49 @@
+from src.services.log_service import LogService
+
+
+def test_log_keeps_only_latest_entries(tmp_path):
+    logger = LogService(max_entries=3)
+    for idx in range(5):
+        logger.add_entry("dir", f"mensaje {idx}")
+    history = logger.history()
+    assert len(history) == 3
+    assert history[0].endswith("dir: mensaje 4")
+    assert history[-1].endswith("dir: mensaje 2")
+    assert [entry[-1] for entry in logger.recent(2)] == ["4", "3"]
+    assert logger.evictions == 2
+
+    target = tmp_path / "log.txt"
+    logger.dump_to_file(target)
+    assert target.read_text(encoding="utf-8").splitlines()[0].endswith("mensaje 2")
+
+
+def test_log_command_limits_entries(make_shell):
+    shell = make_shell()
+    for idx in range(4):
+        shell.process_message("dir /Documentos")
+    response = shell.process_message("log 2")
+    assert response.count("dir:") == 2
+
+
+def test_records_keep_payload_by_reference_and_render_lazily():
+    class Listing:
+        renders = 0
+
+        def __str__(self):
+            Listing.renders += 1
+            return "Contenido de /Documentos"
+
+    logger = LogService(max_entries=5)
+    listing = Listing()
+    record = logger.add_entry("dir", listing)
+    assert record.payload is listing
+    assert Listing.renders == 0
+    assert logger.history()[0].endswith("dir: Contenido de /Documentos")
+    assert Listing.renders == 1
+
+
+def test_long_payloads_are_truncated_when_stored():
+    logger = LogService(max_entries=5, max_payload_chars=10)
+    logger.add_entry("dir", "x" * 50)
+    entry = logger.history()[0]
+    assert entry.endswith("dir: " + "x" * 10 + "… (+40 caracteres)")
@@ -0,0 +1,87 @@
+from src.services.log_service import LogRecord, LogService
+from src.services.log_sink import LogSink
+
+
+def _payloads(records):
+    return [record.payload for record in records]
+
+
+def test_sink_batches_writes(tmp_path):
+    sink = LogSink(tmp_path / "log.jsonl", batch_size=3)
+    sink.write(LogRecord("dir", "uno"))
+    sink.write(LogRecord("dir", "dos"))
+    assert not (tmp_path / "log.jsonl").exists() or not (tmp_path / "log.jsonl").read_text()
+    sink.write(LogRecord("dir", "tres"))
+    assert len((tmp_path / "log.jsonl").read_text(encoding="utf-8").splitlines()) == 3
+    sink.write(LogRecord("dir", "cuatro"))
+    assert _payloads(sink.tail(2)) == ["cuatro", "tres"]
+    sink.close()
+
+
+def test_sink_serializes_only_when_a_batch_is_written(tmp_path):
+    rendered = []
+
+    class Listing:
+        def __str__(self):
+            rendered.append(1)
+            return "a.txt b.txt"
+
+    sink = LogSink(tmp_path / "log.jsonl", batch_size=2)
+    sink.write(LogRecord("dir", Listing()))
+    assert rendered == []
+    sink.write(LogRecord("dir", "otro"))
+    assert rendered == [1]
+    assert _payloads(sink.tail(2)) == ["otro", "a.txt b.txt"]
+    sink.close()
+
+
+def test_sink_rotates_compresses_and_streams_newest_first(tmp_path):
+    sink = LogSink(tmp_path / "log.jsonl", batch_size=1, max_bytes=200, backup_count=3)
+    for idx in range(40):
+        sink.write(LogRecord("mkdir", f"entrada {idx:02d}\ncon salto"))
+    sink.close()
+    assert (tmp_path / "log.jsonl.1.gz").exists()
+    assert not (tmp_path / "log.jsonl.4.gz").exists()
+    payloads = _payloads(sink.iter_entries())
+    assert payloads[0] == "entrada 39\ncon salto"
+    assert payloads == sorted(payloads, reverse=True)
+    assert len(payloads) < 40  # the oldest segments were discarded
+
+
+def test_log_command_pages_past_memory_window(tmp_path, make_shell):
+    shell = make_shell(max_log_entries=3, log_file=str(tmp_path / "log.jsonl"))
+    for idx in range(6):
+        shell.process_message(f"mkdir /Documentos/C{idx}")
+    response = shell.process_message("log 2 --offset 3")
+    lines = response.splitlines()[1:]
+    assert [line.rsplit("'", 2)[1] for line in lines] == ["C2", "C1"]
+    shell.close()
+
+
+def test_paging_past_memory_stays_within_the_session_and_clear(tmp_path, make_shell):
+    log_file = str(tmp_path / "log.jsonl")
+    shell = make_shell(max_log_entries=3, log_file=log_file)
+    for idx in range(6):
+        shell.process_message(f"mkdir /Documentos/C{idx}")
+    shell.process_message("clear")
+    assert shell.process_message("log") == "No hay entradas en el historial"
+    for idx in range(5):
+        shell.process_message(f"mkdir /Documentos/D{idx}")
+    lines = shell.process_message("log 3 --offset 3").splitlines()[1:]
+    assert [line.rsplit("'", 2)[1] for line in lines] == ["D1", "D0"]
+    assert shell.process_message("log 2 --offset 5") == "No hay más entradas en el historial"
+    shell.close()
+
+    restarted = make_shell(max_log_entries=1, log_file=log_file)
+    restarted.process_message("mkdir /Documentos/E0")
+    restarted.process_message("mkdir /Documentos/E1")
+    lines = restarted.process_message("log 5 --offset 1").splitlines()[1:]
+    assert [line.rsplit("'", 2)[1] for line in lines] == ["E0"]
+    restarted.close()
+
+
+def test_log_service_page_from_memory():
+    logger = LogService(max_entries=5)
+    for idx in range(5):
+        logger.add_entry("dir", str(idx))
+    assert [line[-1] for line in logger.page(2, offset=1)] == ["3", "2"]
@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+from src.services.metrics import NULL_METRICS, Histogram, Metrics
+
+
+def test_histogram_percentiles_use_bucket_bounds():
+    histogram = Histogram()
+    for _ in range(90):
+        histogram.observe(3e-6)
+    for _ in range(10):
+        histogram.observe(0.5)
+    assert histogram.count == 100
+    assert histogram.percentile(0.5) == 4e-6
+    assert 0.26 < histogram.percentile(0.99) <= 0.5
+    assert histogram.summary()["max"] == 0.5
+
+
+def test_null_metrics_record_nothing():
+    with NULL_METRICS.time("parse"):
+        NULL_METRICS.incr("messages")
+    assert NULL_METRICS.snapshot()["stages"] == {}
+    assert NULL_METRICS.snapshot()["counters"] == {}
+
+
+def test_prometheus_dump_has_cumulative_buckets():
+    metrics = Metrics()
+    metrics.observe("execute", 2e-6)
+    metrics.observe("execute", 1.0)
+    metrics.incr("commands_dir")
+    metrics.gauge("backup_pending", lambda: 3)
+    text = metrics.to_prometheus()
+    assert 'chatbot_stage_seconds_bucket{stage="execute",le="+Inf"} 2' in text
+    assert 'chatbot_stage_seconds_count{stage="execute"} 2' in text
+    assert "chatbot_commands_dir_total 1" in text
+    assert "chatbot_backup_pending 3" in text
+
+
+def test_stats_command_reports_shell_stages(make_shell, tmp_path):
+    shell = make_shell(metrics={"enabled": True, "dump_file": str(tmp_path / "metrics.json")})
+    shell.process_message("mkdir /Documentos/Nueva")
+    shell.process_message("dir /Documentos")
+    shell.process_message("cuéntame un chiste")
+    table = shell.process_message("stats")
+    for stage in ("parse", "lookup", "execute", "snapshot", "backup"):
+        assert stage in table
+    data = json.loads(shell.process_message("stats --json"))
+    assert data["counters"]["commands_mkdir"] == 1
+    assert data["counters"]["unresolved"] == 1
+    assert data["counters"]["backup_bytes"] > 0
+    shell.close()
+    assert json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))["counters"]["messages"] >= 4
+
+
+def test_stats_command_when_disabled(make_shell):
+    assert "desactivadas" in make_shell().process_message("stats")
+
+
+def test_shipped_config_leaves_metrics_off():
+    settings_path = Path(__file__).resolve().parents[1] / "config" / "settings.json"
+    settings = json.loads(settings_path.read_text(encoding="utf-8"))
+    assert settings["metrics"]["enabled"] is False
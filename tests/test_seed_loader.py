@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from src.services.seed_loader import load_filesystem
+from src.services.virtual_fs import FileSystemNode
+
+
+def _deep_seed(depth):
+    node = {"name": f"N{depth}", "type": "directory", "children": []}
+    for level in range(depth - 1, 0, -1):
+        node = {"name": f"N{level}", "type": "directory", "children": [node, {"name": "f.txt", "type": "file"}]}
+    return {"root": {"name": "Documentos", "type": "directory", "children": [node]}}
+
+
+@pytest.mark.parametrize("mode", ["eager", "stream", "lazy"])
+def test_modes_build_the_same_tree(tmp_path, seed, mode):
+    path = tmp_path / "seed.json"
+    path.write_text(json.dumps(seed, indent=2, ensure_ascii=False), encoding="utf-8")
+    assert load_filesystem(path, mode).snapshot() == seed
+
+
+def test_deep_trees_do_not_hit_the_recursion_limit(tmp_path):
+    seed = _deep_seed(3000)
+    data = FileSystemNode.from_dict(seed["root"]).to_dict()
+    depth = 0
+    while data["children"]:
+        data, depth = data["children"][0], depth + 1
+    assert depth == 3000
+    path = tmp_path / "deep.json"
+    # json.dumps itself recurses, so write the deep seed by hand
+    text = '{"root": {"name": "Documentos", "type": "directory", "children": ['
+    text += "".join(f'{{"name": "N{i}", "type": "directory", "children": [' for i in range(1, 3001))
+    text += "]}" * 3000 + "]}}"
+    path.write_text(text, encoding="utf-8")
+    fs = load_filesystem(path, "stream")
+    deep_path = "/Documentos/" + "/".join(f"N{i}" for i in range(1, 3001))
+    assert fs.list_directory(deep_path) == {"folders": [], "files": []}
+
+
+def test_lazy_mode_materializes_only_visited_folders(tmp_path):
+    seed = {"root": {"name": "Documentos", "type": "directory", "children": [
+        {"name": f"C{i}", "type": "directory", "children": [
+            {"name": f"Sub{j}", "type": "directory", "children": [{"name": "a.txt", "type": "file"}]}
+            for j in range(3)
+        ]}
+        for i in range(4)
+    ]}}
+    path = tmp_path / "seed.json"
+    path.write_text(json.dumps(seed), encoding="utf-8")
+    fs = load_filesystem(path, "lazy")
+    assert not fs._root.is_loaded
+    assert fs.list_directory("/Documentos/C2")["folders"] == ["Sub0", "Sub1", "Sub2"]
+    assert fs._root.is_loaded
+    assert fs._root.find_child("C2").is_loaded
+    assert not fs._root.find_child("C1").is_loaded
+    assert not fs._root.find_child("C2").find_child("Sub0").is_loaded
+    fs.make_directory("/Documentos/C1/Nueva")
+    assert fs.list_directory("/Documentos/C1")["folders"] == ["Nueva", "Sub0", "Sub1", "Sub2"]
+    assert fs.snapshot()["root"]["children"][3]["children"][2]["children"][0]["name"] == "a.txt"
+
+
+def test_invalid_seed_file(tmp_path):
+    path = tmp_path / "seed.json"
+    path.write_text('{"otra": 1}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_filesystem(path, "stream")
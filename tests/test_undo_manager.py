@@ -0,0 +1,63 @@
+import pytest
+
+from src.services.backup_service import restore_from_journal
+from src.services.undo_manager import UndoManager
+from src.services.virtual_fs import VirtualFileSystem
+
+
+@pytest.fixture
+def fs(seed):
+    filesystem = VirtualFileSystem.from_seed(seed)
+    filesystem.undo_log = UndoManager(filesystem, max_depth=3)
+    return filesystem
+
+
+def test_undo_rmdir_relinks_the_same_subtree(fs):
+    proyectos = fs._resolve("/Documentos/Proyectos")
+    assert fs.usage("/Documentos")["files"] == 4
+    fs.remove_tree("/Documentos/Proyectos")
+    assert fs.find("plan") == []
+    assert fs.usage("/Documentos")["files"] == 2
+
+    fs.undo_log.undo()
+    assert fs._resolve("/Documentos/Proyectos") is proyectos
+    assert fs.find("plan") == ["/Documentos/Proyectos/Plan.txt"]
+    assert fs.usage("/Documentos")["files"] == 4
+    fs.undo_log.redo()
+    assert fs.list_directory("/Documentos")["folders"] == ["Fotos"]
+
+
+def test_undo_redo_mkdir_and_mv_in_order(fs):
+    before = fs.snapshot()
+    fs.make_directories("/Documentos/Fotos/A/B")
+    fs.move("/Documentos/Fotos/A", "/Documentos/Proyectos/Z")
+    fs.undo_log.undo()
+    assert fs.list_directory("/Documentos/Fotos/A")["folders"] == ["B"]
+    fs.undo_log.undo()
+    assert fs.snapshot() == before
+    with pytest.raises(ValueError):
+        fs.undo_log.undo()
+    fs.undo_log.redo()
+    fs.undo_log.redo()
+    assert fs.list_directory("/Documentos/Proyectos/Z")["folders"] == ["B"]
+    with pytest.raises(ValueError):
+        fs.undo_log.redo()
+
+
+def test_new_mutation_clears_redo_and_depth_is_bounded(fs):
+    fs.make_directory("/Documentos/Uno")
+    fs.undo_log.undo()
+    fs.make_directory("/Documentos/Dos")
+    with pytest.raises(ValueError):
+        fs.undo_log.redo()
+    for idx in range(10):
+        fs.make_directory(f"/Documentos/N{idx}")
+    assert len(fs.undo_log) == 3
+
+
+def test_undo_and_redo_are_journaled(make_shell, tmp_path):
+    shell = make_shell(backup_mode="journal")
+    for command in ("mkdir -p /Documentos/Uno/Dos", "rmdir -r /Documentos/Proyectos", "undo", "undo", "redo"):
+        assert not shell.process_message(command).startswith("Error"), command
+    assert shell.process_message("du /Documentos").startswith("Resumen de /Documentos: 4 carpetas")
+    assert restore_from_journal(str(tmp_path / "backups")).snapshot() == shell._filesystem.snapshot()
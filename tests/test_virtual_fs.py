@@ -0,0 +1,217 @@
+import pytest
+
+from src.services.virtual_fs import FileSystemNode, VirtualFileSystem
+
+
+def _seed():
+    return {
+        "root": {
+            "name": "Documentos",
+            "type": "directory",
+            "children": [
+                {"name": "Zeta", "type": "directory", "children": []},
+                {"name": "alfa", "type": "directory", "children": []},
+                {"name": "Notas.txt", "type": "file"},
+            ],
+        }
+    }
+
+
+def test_child_index_is_case_insensitive():
+    fs = VirtualFileSystem.from_seed(_seed())
+    assert fs._resolve("/documentos/ZETA").name == "Zeta"
+    with pytest.raises(ValueError):
+        fs.make_directory("/Documentos/ALFA")
+
+
+def test_child_index_tracks_mutations_and_sorted_listing():
+    fs = VirtualFileSystem.from_seed(_seed())
+    fs.make_directory("/Documentos/Beta")
+    assert fs.list_directory("/Documentos") == {
+        "folders": ["Beta", "Zeta", "alfa"],
+        "files": ["Notas.txt"],
+    }
+    fs.remove_directory("/Documentos/zeta")
+    assert fs.list_directory("/Documentos")["folders"] == ["Beta", "alfa"]
+    with pytest.raises(ValueError):
+        fs._resolve("/Documentos/Zeta")
+    fs.make_directory("/Documentos/Zeta")
+    assert fs._resolve("/Documentos/Zeta").children == []
+
+
+def test_to_dict_round_trip_keeps_insertion_order():
+    root = FileSystemNode.from_dict(_seed()["root"])
+    assert root.to_dict() == _seed()["root"]
+
+
+def test_failed_lazy_load_is_retried():
+    class FlakyLoader:
+        calls = 0
+
+        def load_children(self, token):
+            self.calls += 1
+            if self.calls == 1:
+                raise OSError("disco no disponible")
+            return [FileSystemNode(name="Hijo", type="directory")]
+
+    folder = FileSystemNode(name="Lenta", type="directory")
+    folder.defer_children(FlakyLoader(), None)
+    fs = VirtualFileSystem(FileSystemNode(name="Documentos", type="directory", children=[folder]))
+    with pytest.raises(OSError):
+        fs.list_directory("/Documentos/Lenta")
+    assert not folder.is_loaded
+    assert fs.list_directory("/Documentos/Lenta")["folders"] == ["Hijo"]
+    assert folder.find_child("hijo").parent is folder
+
+
+def test_cannot_remove_root():
+    fs = VirtualFileSystem.from_seed(_seed())
+    with pytest.raises(ValueError):
+        fs.remove_directory("/Documentos")
+
+
+def test_make_directories_creates_missing_parents_once():
+    fs = VirtualFileSystem.from_seed(_seed())
+    assert fs.make_directories("/Documentos/alfa/Uno/Dos") == 2
+    assert fs.list_directory("/Documentos/alfa/Uno")["folders"] == ["Dos"]
+    assert fs.make_directories("/Documentos/alfa/Uno/Dos") == 0
+    with pytest.raises(ValueError):
+        fs.make_directories("/Documentos/Notas.txt/Uno")
+
+
+def test_remove_tree_counts_removed_nodes():
+    fs = VirtualFileSystem.from_seed(_seed())
+    fs.make_directories("/Documentos/Zeta/A/B")
+    assert fs.remove_tree("/Documentos/Zeta") == ("Zeta", 3)
+    assert fs.list_directory("/Documentos")["folders"] == ["alfa"]
+
+
+def test_move_into_folder_and_rename():
+    fs = VirtualFileSystem.from_seed(_seed())
+    fs.make_directories("/Documentos/Zeta/Hijo")
+    assert fs.move("/Documentos/Zeta", "/Documentos/alfa") == "/Documentos/alfa/Zeta"
+    assert fs.list_directory("/Documentos/alfa/Zeta")["folders"] == ["Hijo"]
+    assert fs.move("/Documentos/alfa/Zeta", "/Documentos/Omega") == "/Documentos/Omega"
+    assert fs.list_directory("/Documentos")["folders"] == ["Omega", "alfa"]
+    assert fs.move("/Documentos/Notas.txt", "/Documentos/Omega/Notas.txt") == "/Documentos/Omega/Notas.txt"
+    with pytest.raises(ValueError):
+        fs.move("/Documentos/Omega", "/Documentos/Omega/Hijo")
+    with pytest.raises(ValueError):
+        fs.move("/Documentos/Omega/Hijo", "/Documentos/alfa/x/y")
+
+
+def test_path_cache_hits_and_invalidation():
+    fs = VirtualFileSystem.from_seed(_seed())
+    fs.make_directories("/Documentos/alfa/Uno/Dos")
+    fs.list_directory("/Documentos/alfa/Uno/Dos")
+    fs.list_directory("/documentos/ALFA/uno/dos/")
+    stats = fs.path_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    fs.list_directory("/Documentos/alfa")
+    fs.make_directory("/Documentos/alfa/Tres")  # resolves its parent from the cache
+    fs.list_directory("/Documentos/alfa")  # still valid: creating a folder stales nothing
+    assert fs.path_cache_stats()["hits"] == 3
+    fs.move("/Documentos/alfa/Uno", "/Documentos/Zeta")
+    assert fs.path_cache_stats()["invalidations"] == 1
+    with pytest.raises(ValueError):
+        fs.list_directory("/Documentos/alfa/Uno/Dos")
+    assert fs.list_directory("/Documentos/Zeta/Uno/Dos") == {"folders": [], "files": []}
+    fs.remove_directory("/Documentos/Zeta")
+    with pytest.raises(ValueError):
+        fs.list_directory("/Documentos/Zeta/Uno/Dos")
+    assert fs.path_cache_stats()["invalidations"] == 2
+    assert fs.list_directory("/Documentos/alfa")["folders"] == ["Tres"]
+
+
+def test_path_cache_is_bounded():
+    fs = VirtualFileSystem.from_seed(_seed())
+    fs.resize_path_cache(1)
+    fs.list_directory("/Documentos/alfa")
+    fs.list_directory("/Documentos/Zeta")
+    stats = fs.path_cache_stats()
+    assert (stats["size"], stats["evictions"]) == (1, 1)
+
+
+def test_find_modes_and_incremental_index():
+    fs = VirtualFileSystem.from_seed(_seed())
+    fs.make_directories("/Documentos/alfa/Planes/Plan2024")
+    assert fs.find("plan2024", mode="exact") == ["/Documentos/alfa/Planes/Plan2024"]
+    assert fs.find("pla", mode="prefix") == ["/Documentos/alfa/Planes", "/Documentos/alfa/Planes/Plan2024"]
+    assert fs.find("*.TXT", mode="glob") == ["/Documentos/Notas.txt"]
+    assert fs.find("plan202[0-9]", mode="glob") == ["/Documentos/alfa/Planes/Plan2024"]
+    assert fs.find("*[sz]", mode="glob") == ["/Documentos/alfa/Planes"]
+    assert fs.find("plan[!0-9]*", mode="glob") == ["/Documentos/alfa/Planes"]
+    assert fs.find("an2", mode="substring") == ["/Documentos/alfa/Planes/Plan2024"]
+    assert fs.find("plan", within="/Documentos/Zeta") == []
+
+    fs.make_directory("/Documentos/Zeta/Plano")
+    fs.move("/Documentos/alfa/Planes", "/Documentos/Zeta/Mapas")
+    assert fs.find("plan") == ["/Documentos/Zeta/Mapas/Plan2024", "/Documentos/Zeta/Plano"]
+    assert fs.find("planes", mode="exact") == []
+    fs.remove_tree("/Documentos/Zeta/Mapas")
+    assert fs.find("plan") == ["/Documentos/Zeta/Plano"]
+
+
+def test_find_command_lists_matches(make_shell):
+    shell = make_shell()
+    response = shell.process_message("find plan.txt")
+    assert "/Documentos/Proyectos/Plan.txt" in response
+    assert shell.process_message("find --exact nada").startswith("No se encontró")
+
+
+def _brute_usage(fs, path):
+    node = fs._resolve(path)
+    folders = files = height = 0
+    pending = [(node, 0)]
+    while pending:
+        current, level = pending.pop()
+        height = max(height, level)
+        for child in current.children:
+            if child.is_directory():
+                folders += 1
+                pending.append((child, level + 1))
+            else:
+                files += 1
+                height = max(height, level + 1)
+    return {"folders": folders, "files": files, "height": height}
+
+
+def test_usage_stays_consistent_across_mutations(seed):
+    fs = VirtualFileSystem.from_seed(seed)
+    assert fs.usage("/Documentos") == {"folders": 2, "files": 4, "height": 2, "depth": 0}
+    steps = [
+        lambda: fs.make_directories("/Documentos/Proyectos/A/B/C"),
+        lambda: fs.make_directory("/Documentos/Fotos/Nueva"),
+        lambda: fs.move("/Documentos/Proyectos/A", "/Documentos/Fotos"),
+        lambda: fs.move("/Documentos/Proyectos/Plan.txt", "/Documentos/Fotos/A/B/C/Plan.txt"),
+        lambda: fs.remove_tree("/Documentos/Fotos/A/B"),
+        lambda: fs.remove_directory("/Documentos/Proyectos"),
+    ]
+    for step in steps:
+        step()
+        for path, _node in fs.walk_directories():
+            usage = fs.usage(path)
+            usage.pop("depth")
+            assert usage == _brute_usage(fs, path), path
+    assert fs.usage("/Documentos/Fotos/A")["depth"] == 2
+
+
+def test_iter_directory_pages_by_offset_and_cursor():
+    fs = VirtualFileSystem.from_seed(_seed())
+    assert list(fs.iter_directory("/Documentos")) == [(True, "Zeta"), (True, "alfa"), (False, "Notas.txt")]
+    assert list(fs.iter_directory("/Documentos", offset=2)) == [(False, "Notas.txt")]
+    after = (True, "Zeta")
+    fs.remove_directory("/Documentos/Zeta")  # the cursor survives removing the last listed item
+    fs.make_directory("/Documentos/Beta")
+    assert list(fs.iter_directory("/Documentos", after=after)) == [(True, "alfa"), (False, "Notas.txt")]
+
+
+def test_dir_command_pages_with_cursor(make_shell):
+    shell = make_shell()
+    first = shell.process_message("dir /Documentos --limit 3")
+    assert first.splitlines()[1:5] == ["Carpetas:", "  - Fotos", "  - Proyectos", "Archivos:"]
+    cursor = first.rsplit("--cursor ", 1)[1]
+    second = shell.process_message(f"dir /Documentos --cursor {cursor}")
+    assert second.splitlines()[1:] == ["Archivos:", "  - Tareas.txt"]
+    assert shell.history[0].endswith("Contenido de /Documentos: 1 elementos")